@@ -0,0 +1,53 @@
+"""Add composite trail indexes to governance_audit_log.
+
+get_governance_trail filters by workspace plus event_type or agent_id and
+orders by created_at; these indexes cover the filter and the sort.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def _audit_index_names():
+    """Index names on governance_audit_log, or None if the table is absent.
+
+    Databases bootstrapped by db.create_all() already carry the model's
+    indexes, so each one is only created (or dropped) where needed.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if 'governance_audit_log' not in inspector.get_table_names():
+        return None
+    return {ix['name'] for ix in inspector.get_indexes('governance_audit_log')}
+
+
+def upgrade():
+    names = _audit_index_names()
+    if names is None:
+        return
+    if 'ix_gov_audit_ws_type_created' not in names:
+        op.create_index('ix_gov_audit_ws_type_created', 'governance_audit_log',
+                        ['workspace_id', 'event_type', 'created_at'])
+    if 'ix_gov_audit_ws_agent_created' not in names:
+        op.create_index('ix_gov_audit_ws_agent_created', 'governance_audit_log',
+                        ['workspace_id', 'agent_id', 'created_at'])
+
+
+def downgrade():
+    names = _audit_index_names()
+    if names is None:
+        return
+    if 'ix_gov_audit_ws_agent_created' in names:
+        op.drop_index('ix_gov_audit_ws_agent_created', 'governance_audit_log')
+    if 'ix_gov_audit_ws_type_created' in names:
+        op.drop_index('ix_gov_audit_ws_type_created', 'governance_audit_log')
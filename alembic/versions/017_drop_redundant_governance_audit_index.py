@@ -0,0 +1,38 @@
+"""Drop the redundant (workspace_id, event_type) governance audit index.
+
+ix_gov_audit_ws_type is a prefix of ix_gov_audit_ws_type_created (016),
+so it serves no query the composite cannot, while adding a b-tree update
+to every governance audit insert.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def _audit_index_names():
+    """Index names on governance_audit_log, or None if the table is absent."""
+    inspector = sa.inspect(op.get_bind())
+    if 'governance_audit_log' not in inspector.get_table_names():
+        return None
+    return {ix['name'] for ix in inspector.get_indexes('governance_audit_log')}
+
+
+def upgrade():
+    names = _audit_index_names()
+    if names is not None and 'ix_gov_audit_ws_type' in names:
+        op.drop_index('ix_gov_audit_ws_type', 'governance_audit_log')
+
+
+def downgrade():
+    names = _audit_index_names()
+    if names is not None and 'ix_gov_audit_ws_type' not in names:
+        op.create_index('ix_gov_audit_ws_type', 'governance_audit_log',
+                        ['workspace_id', 'event_type'])
@@ -0,0 +1,58 @@
+"""Store governance_audit_log.details as JSONB with a GIN index (PostgreSQL).
+
+Lets containment filters such as ``details @> '{"policy_id": 42}'`` use an
+index instead of scanning and re-parsing every row. jsonb_path_ops keeps the
+index small; it supports @> only, which is the only operator needed.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists, and only on
+PostgreSQL (other dialects keep plain JSON).
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def _applies():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    return 'governance_audit_log' in sa.inspect(bind).get_table_names()
+
+
+def _audit_index_names():
+    inspector = sa.inspect(op.get_bind())
+    return {ix['name'] for ix in inspector.get_indexes('governance_audit_log')}
+
+
+def upgrade():
+    if not _applies():
+        return
+    op.execute(
+        'ALTER TABLE governance_audit_log '
+        'ALTER COLUMN details TYPE JSONB USING details::jsonb'
+    )
+    # Databases bootstrapped by db.create_all() already have the index.
+    if 'ix_gov_audit_details_gin' not in _audit_index_names():
+        op.create_index('ix_gov_audit_details_gin', 'governance_audit_log',
+                        ['details'], postgresql_using='gin',
+                        postgresql_ops={'details': 'jsonb_path_ops'})
+
+
+def downgrade():
+    if not _applies():
+        return
+    if 'ix_gov_audit_details_gin' in _audit_index_names():
+        op.drop_index('ix_gov_audit_details_gin', 'governance_audit_log')
+    op.execute(
+        'ALTER TABLE governance_audit_log '
+        'ALTER COLUMN details TYPE JSON USING details::json'
+    )
@@ -0,0 +1,50 @@
+"""Add hash-chain columns to governance_audit_log.
+
+prev_hash/row_hash link each workspace's audit entries into a SHA-256
+chain so edits and deletions are detectable (see
+core.governance.governance_audit.verify_chain). Existing rows keep NULL
+hashes and are skipped by verification.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ('prev_hash', 'row_hash')
+
+
+def _existing_columns():
+    """Column names of governance_audit_log, or None if the table is absent."""
+    inspector = sa.inspect(op.get_bind())
+    if 'governance_audit_log' not in inspector.get_table_names():
+        return None
+    return {c['name'] for c in inspector.get_columns('governance_audit_log')}
+
+
+def upgrade():
+    existing = _existing_columns()
+    if existing is None:
+        return
+    for name in _COLUMNS:
+        if name not in existing:
+            op.add_column('governance_audit_log',
+                          sa.Column(name, sa.String(64), nullable=True))
+
+
+def downgrade():
+    existing = _existing_columns()
+    if existing is None:
+        return
+    for name in reversed(_COLUMNS):
+        if name in existing:
+            op.drop_column('governance_audit_log', name)
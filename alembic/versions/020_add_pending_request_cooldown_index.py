@@ -0,0 +1,50 @@
+"""Add a partial (policy_id, requested_at) index on pending change requests.
+
+create_request's cooldown check looks up pending requests for one policy
+by requested_at. Pending rows are a small slice of policy_change_requests,
+so the index is restricted to them.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def _request_index_names():
+    """Index names on policy_change_requests, or None if the table is absent.
+
+    Databases bootstrapped by db.create_all() already carry the model's
+    indexes, so the index is only created (or dropped) where needed.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if 'policy_change_requests' not in inspector.get_table_names():
+        return None
+    return {ix['name']
+            for ix in inspector.get_indexes('policy_change_requests')}
+
+
+def upgrade():
+    names = _request_index_names()
+    if names is None or 'ix_pcr_pending_policy_requested' in names:
+        return
+    op.create_index('ix_pcr_pending_policy_requested', 'policy_change_requests',
+                    ['policy_id', 'requested_at'],
+                    postgresql_where=sa.text("status = 'pending'"),
+                    sqlite_where=sa.text("status = 'pending'"))
+
+
+def downgrade():
+    names = _request_index_names()
+    if names is None or 'ix_pcr_pending_policy_requested' not in names:
+        return
+    op.drop_index('ix_pcr_pending_policy_requested', 'policy_change_requests')
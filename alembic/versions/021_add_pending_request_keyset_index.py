@@ -0,0 +1,50 @@
+"""Add a partial (workspace_id, requested_at, id) index on pending requests.
+
+/api/governance/pending pages by keyset on (requested_at, id) within one
+workspace instead of by OFFSET. The index matches that seek and, like 020,
+covers only pending rows.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def _request_index_names():
+    """Index names on policy_change_requests, or None if the table is absent.
+
+    Databases bootstrapped by db.create_all() already carry the model's
+    indexes, so the index is only created (or dropped) where needed.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if 'policy_change_requests' not in inspector.get_table_names():
+        return None
+    return {ix['name']
+            for ix in inspector.get_indexes('policy_change_requests')}
+
+
+def upgrade():
+    names = _request_index_names()
+    if names is None or 'ix_pcr_pending_ws_requested_id' in names:
+        return
+    op.create_index('ix_pcr_pending_ws_requested_id', 'policy_change_requests',
+                    ['workspace_id', 'requested_at', 'id'],
+                    postgresql_where=sa.text("status = 'pending'"),
+                    sqlite_where=sa.text("status = 'pending'"))
+
+
+def downgrade():
+    names = _request_index_names()
+    if names is None or 'ix_pcr_pending_ws_requested_id' not in names:
+        return
+    op.drop_index('ix_pcr_pending_ws_requested_id', 'policy_change_requests')
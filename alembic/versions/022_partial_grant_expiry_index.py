@@ -0,0 +1,50 @@
+"""Make ix_dg_active_valid_to a partial valid_to index on active grants.
+
+The expiry sweep only ever looks at active grants, so inactive history is
+kept out of the index. Replaces the full (active, valid_to) index of the
+same name.
+
+The governance tables are created by db.create_all() rather than by a
+migration, so this only runs where the table already exists.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def _grant_index_names():
+    """Index names on delegation_grants, or None if the table is absent."""
+    inspector = sa.inspect(op.get_bind())
+    if 'delegation_grants' not in inspector.get_table_names():
+        return None
+    return {ix['name'] for ix in inspector.get_indexes('delegation_grants')}
+
+
+def upgrade():
+    names = _grant_index_names()
+    if names is None:
+        return
+    if 'ix_dg_active_valid_to' in names:
+        op.drop_index('ix_dg_active_valid_to', 'delegation_grants')
+    op.create_index('ix_dg_active_valid_to', 'delegation_grants',
+                    ['valid_to'],
+                    postgresql_where=sa.text('active'),
+                    sqlite_where=sa.text('active'))
+
+
+def downgrade():
+    names = _grant_index_names()
+    if names is None:
+        return
+    if 'ix_dg_active_valid_to' in names:
+        op.drop_index('ix_dg_active_valid_to', 'delegation_grants')
+    op.create_index('ix_dg_active_valid_to', 'delegation_grants',
+                    ['active', 'valid_to'])
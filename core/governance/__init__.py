@@ -13,6 +13,7 @@ Public API:
     get_active_grants, apply_delegated_change   — delegation enforcement
     expire_grants, revoke_grant                 — delegation lifecycle
     log_governance_event, get_governance_trail  — audit trail
+    verify_chain                                — audit tamper detection
     rollback_change                             — policy rollback
 """
 
@@ -39,6 +40,7 @@ from core.governance.delegation import (
 from core.governance.governance_audit import (
     log_governance_event,
     get_governance_trail,
+    verify_chain,
 )
 from core.governance.rollback import (
     rollback_change,
@@ -59,5 +61,6 @@ __all__ = [
     'revoke_grant',
     'log_governance_event',
     'get_governance_trail',
+    'verify_chain',
     'rollback_change',
 ]
@@ -14,6 +14,10 @@ Critical constraints:
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from core.governance.errors import (
+    ERR_BOUNDARY_VIOLATION, ERR_REQUEST_NOT_PENDING,
+)
+
 # Maximum delegation duration in minutes (24 hours).
 MAX_DELEGATION_MINUTES = 1440
 
@@ -40,7 +44,7 @@ def approve_request(request_id, workspace_id, approver_id, mode,
     from core.governance.governance_audit import log_governance_event
 
     # --- Validate approver ---
-    approver = User.query.get(approver_id)
+    approver = db.session.get(User, approver_id)
     if approver is None:
         return None, 'Approver not found'
 
@@ -96,7 +100,7 @@ def deny_request(request_id, workspace_id, approver_id, reason=None):
     from core.governance.governance_audit import log_governance_event
 
     # --- Validate approver ---
-    approver = User.query.get(approver_id)
+    approver = db.session.get(User, approver_id)
     if approver is None:
         return None, 'Approver not found'
 
@@ -115,9 +119,9 @@ def deny_request(request_id, workspace_id, approver_id, reason=None):
 
     # --- Deny ---
     now = datetime.utcnow()
-    pcr.status = 'denied'
-    pcr.reviewed_by = approver_id
-    pcr.reviewed_at = now
+    if not _claim_pending(pcr, 'denied', approver_id, now):
+        db.session.rollback()
+        return None, f'{ERR_REQUEST_NOT_PENDING}: cannot deny'
 
     log_governance_event(
         workspace_id=workspace_id,
@@ -141,6 +145,32 @@ def deny_request(request_id, workspace_id, approver_id, reason=None):
     }, None
 
 
+# ---------------------------------------------------------------------------
+# Internal: pending -> reviewed transition
+# ---------------------------------------------------------------------------
+
+def _claim_pending(pcr, status, approver_id, now):
+    """Move the request out of 'pending' with one conditional UPDATE.
+
+    The WHERE clause re-checks status='pending' in the database, so of two
+    concurrent reviewers only one matches a row; the loser gets False and
+    must roll back. The loaded ``pcr`` is synchronized in place.
+    """
+    from sqlalchemy import update
+    from models import db, PolicyChangeRequest
+
+    claimed = db.session.execute(
+        update(PolicyChangeRequest)
+        .where(
+            PolicyChangeRequest.id == pcr.id,
+            PolicyChangeRequest.status == 'pending',
+        )
+        .values(status=status, reviewed_by=approver_id, reviewed_at=now)
+        .returning(PolicyChangeRequest.id)
+    ).first()
+    return claimed is not None
+
+
 # ---------------------------------------------------------------------------
 # Internal: one-time apply
 # ---------------------------------------------------------------------------
@@ -175,7 +205,7 @@ def _apply_one_time(pcr, approver_id, workspace_id):
             actor_id=approver_id,
         )
         db.session.commit()
-        return None, f'Boundary violation: {boundary_error}'
+        return None, f'{ERR_BOUNDARY_VIOLATION}: {boundary_error}'
 
     # --- Load policy ---
     policy = RiskPolicy.query.filter_by(
@@ -195,16 +225,17 @@ def _apply_one_time(pcr, approver_id, workspace_id):
     elif field == 'action_type':
         policy.action_type = str(new_value)
 
-    policy.updated_at = datetime.utcnow()
+    # One timestamp for the whole transition: policy change, review, audit.
+    now = datetime.utcnow()
+    policy.updated_at = now
 
     # --- Snapshot after ---
     policy_after = policy.to_dict()
 
     # --- Update request status ---
-    now = datetime.utcnow()
-    pcr.status = 'applied'
-    pcr.reviewed_by = approver_id
-    pcr.reviewed_at = now
+    if not _claim_pending(pcr, 'applied', approver_id, now):
+        db.session.rollback()
+        return None, f'{ERR_REQUEST_NOT_PENDING}: cannot approve'
 
     # --- Audit: approval ---
     log_governance_event(
@@ -218,6 +249,7 @@ def _apply_one_time(pcr, approver_id, workspace_id):
         },
         agent_id=pcr.agent_id,
         actor_id=approver_id,
+        created_at=now,
     )
 
     # --- Audit: application ---
@@ -235,6 +267,7 @@ def _apply_one_time(pcr, approver_id, workspace_id):
         },
         agent_id=pcr.agent_id,
         actor_id=approver_id,
+        created_at=now,
     )
 
     db.session.commit()
@@ -303,7 +336,7 @@ def _create_delegation(pcr, approver_id, workspace_id, delegation_params):
             actor_id=approver_id,
         )
         db.session.commit()
-        return None, f'Boundary violation: {boundary_error}'
+        return None, f'{ERR_BOUNDARY_VIOLATION}: {boundary_error}'
 
     # --- Build allowed_changes envelope ---
     current_value = changes.get('current_value')
@@ -342,8 +375,15 @@ def _create_delegation(pcr, approver_id, workspace_id, delegation_params):
         except Exception:
             return None, f'Invalid max_spend_delta: {max_spend_delta}'
 
-    # --- Create grant ---
+    # --- Update request status ---
+    # Claimed before the grant is added so the UPDATE's autoflush does not
+    # split the grant from its audit rows.
     now = datetime.utcnow()
+    if not _claim_pending(pcr, 'approved', approver_id, now):
+        db.session.rollback()
+        return None, f'{ERR_REQUEST_NOT_PENDING}: cannot approve'
+
+    # --- Create grant ---
     grant = DelegationGrant(
         workspace_id=workspace_id,
         agent_id=pcr.agent_id,
@@ -359,11 +399,6 @@ def _create_delegation(pcr, approver_id, workspace_id, delegation_params):
     )
     db.session.add(grant)
 
-    # --- Update request status ---
-    pcr.status = 'approved'
-    pcr.reviewed_by = approver_id
-    pcr.reviewed_at = now
-
     # --- Audit: approval ---
     log_governance_event(
         workspace_id=workspace_id,
@@ -39,6 +39,13 @@ TIER_BOUNDARIES = {
     'agency':     {'max_daily_spend_cap': Decimal('2000.00')},
 }
 
+# Full boundary set per tier (tier limits + system constants), merged once
+# at import since both inputs are constant.
+_RESOLVED_BOUNDARIES = {
+    tier_name: {**bounds, **SYSTEM_BOUNDARIES, 'tier_name': tier_name}
+    for tier_name, bounds in TIER_BOUNDARIES.items()
+}
+
 
 def get_workspace_boundaries(workspace_id):
     """Return the full boundary set for a workspace.
@@ -56,11 +63,13 @@ def get_workspace_boundaries(workspace_id):
     tier = get_workspace_tier(workspace_id)
     tier_name = tier.get('tier_name', 'free')
 
-    tier_bounds = TIER_BOUNDARIES.get(tier_name, TIER_BOUNDARIES['free']).copy()
-    tier_bounds.update(SYSTEM_BOUNDARIES)
-    tier_bounds['tier_name'] = tier_name
+    resolved = _RESOLVED_BOUNDARIES.get(tier_name)
+    if resolved is None:
+        # Unknown tier: free-tier limits, reported under the actual tier name.
+        return {**_RESOLVED_BOUNDARIES['free'], 'tier_name': tier_name}
 
-    return tier_bounds
+    # Copy so callers cannot alter the shared table.
+    return dict(resolved)
 
 
 def validate_against_boundaries(workspace_id, policy_id, field, new_value):
@@ -100,11 +109,16 @@ def _validate_threshold(workspace_id, policy_id, new_value, boundaries):
         return False, 'Policy not found'
 
     try:
-        new_threshold = Decimal(str(new_value))
+        new_threshold = (new_value if isinstance(new_value, Decimal)
+                         else Decimal(str(new_value)))
     except Exception:
         return False, f'Invalid threshold value: {new_value}'
 
-    if new_threshold < Decimal('0'):
+    # NaN would raise on comparison and Infinity would pass an absent cap.
+    if not new_threshold.is_finite():
+        return False, f'Invalid threshold value: {new_value}'
+
+    if new_threshold < 0:
         return False, 'Threshold value cannot be negative'
 
     # Check tier-specific cap based on policy type
@@ -139,12 +153,12 @@ def _validate_cooldown(new_value, boundaries):
 
 def _validate_action_type(policy_id, new_value):
     """Validate an action_type change: can only escalate, never de-escalate."""
-    from models import RiskPolicy
+    from models import db, RiskPolicy
 
     if new_value not in ACTION_SEVERITY:
         return False, f'Unknown action_type: {new_value}'
 
-    policy = RiskPolicy.query.get(policy_id)
+    policy = db.session.get(RiskPolicy, policy_id)
     if policy is None:
         return False, 'Policy not found'
 
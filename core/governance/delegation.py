@@ -14,6 +14,17 @@ grant and workspace boundaries.
 from datetime import datetime
 from decimal import Decimal
 
+from core.governance.errors import (
+    ERR_ENVELOPE_VIOLATION,
+    ERR_WORKSPACE_BOUNDARY_VIOLATION,
+    ERR_GRANT_NOT_FOUND,
+    ERR_GRANT_WRONG_AGENT,
+    ERR_GRANT_INACTIVE,
+    ERR_GRANT_NOT_YET_VALID,
+    ERR_GRANT_EXPIRED,
+    ERR_GRANT_ALREADY_INACTIVE,
+)
+
 
 def get_active_grants(workspace_id, agent_id=None):
     """Return active, non-expired delegation grants.
@@ -67,20 +78,20 @@ def apply_delegated_change(grant_id, workspace_id, agent_id, requested_change):
         id=grant_id, workspace_id=workspace_id,
     ).first()
     if grant is None:
-        return None, 'Grant not found'
+        return None, ERR_GRANT_NOT_FOUND
 
     # --- Grant belongs to this agent ---
     if grant.agent_id != agent_id:
-        return None, 'Grant does not belong to this agent'
+        return None, ERR_GRANT_WRONG_AGENT
 
     # --- Grant is active ---
     if not grant.active:
-        return None, 'Grant is no longer active'
+        return None, ERR_GRANT_INACTIVE
 
     # --- Grant is within time window ---
     now = datetime.utcnow()
     if now < grant.valid_from:
-        return None, 'Grant is not yet valid'
+        return None, ERR_GRANT_NOT_YET_VALID
     if now > grant.valid_to:
         # Auto-deactivate
         grant.active = False
@@ -91,7 +102,7 @@ def apply_delegated_change(grant_id, workspace_id, agent_id, requested_change):
             agent_id=agent_id,
         )
         db.session.commit()
-        return None, 'Grant has expired'
+        return None, ERR_GRANT_EXPIRED
 
     # --- Validate requested_change structure ---
     if not isinstance(requested_change, dict):
@@ -135,7 +146,7 @@ def apply_delegated_change(grant_id, workspace_id, agent_id, requested_change):
             agent_id=agent_id,
         )
         db.session.commit()
-        return None, f'Grant envelope violation: {envelope_error}'
+        return None, f'{ERR_ENVELOPE_VIOLATION}: {envelope_error}'
 
     # --- Workspace boundary check ---
     valid, boundary_error = validate_against_boundaries(
@@ -156,7 +167,7 @@ def apply_delegated_change(grant_id, workspace_id, agent_id, requested_change):
             agent_id=agent_id,
         )
         db.session.commit()
-        return None, f'Workspace boundary violation: {boundary_error}'
+        return None, f'{ERR_WORKSPACE_BOUNDARY_VIOLATION}: {boundary_error}'
 
     # --- Load and mutate policy ---
     policy = RiskPolicy.query.filter_by(
@@ -230,18 +241,28 @@ def expire_grants():
     Returns:
         int: Count of grants expired.
     """
+    from sqlalchemy import update
     from models import db, DelegationGrant
     from core.governance.governance_audit import log_governance_event
 
     now = datetime.utcnow()
-    expired = DelegationGrant.query.filter(
-        DelegationGrant.active == True,  # noqa: E712
-        DelegationGrant.valid_to < now,
+    # Deactivate in one UPDATE; RETURNING supplies the audit details.
+    expired = db.session.execute(
+        update(DelegationGrant)
+        .where(
+            DelegationGrant.active == True,  # noqa: E712
+            DelegationGrant.valid_to < now,
+        )
+        .values(active=False)
+        .returning(
+            DelegationGrant.id,
+            DelegationGrant.workspace_id,
+            DelegationGrant.agent_id,
+            DelegationGrant.valid_to,
+        )
     ).all()
 
-    count = 0
     for grant in expired:
-        grant.active = False
         log_governance_event(
             workspace_id=grant.workspace_id,
             event_type='grant_expired',
@@ -252,12 +273,11 @@ def expire_grants():
             },
             agent_id=grant.agent_id,
         )
-        count += 1
 
-    if count > 0:
+    if expired:
         db.session.commit()
 
-    return count
+    return len(expired)
 
 
 def revoke_grant(grant_id, workspace_id, revoker_id):
@@ -276,7 +296,7 @@ def revoke_grant(grant_id, workspace_id, revoker_id):
     from core.governance.governance_audit import log_governance_event
 
     # --- Validate revoker ---
-    revoker = User.query.get(revoker_id)
+    revoker = db.session.get(User, revoker_id)
     if revoker is None:
         return None, 'Revoker not found'
     if revoker_id != workspace_id and not revoker.is_admin:
@@ -287,10 +307,10 @@ def revoke_grant(grant_id, workspace_id, revoker_id):
         id=grant_id, workspace_id=workspace_id,
     ).first()
     if grant is None:
-        return None, 'Grant not found'
+        return None, ERR_GRANT_NOT_FOUND
 
     if not grant.active:
-        return None, 'Grant is already inactive'
+        return None, ERR_GRANT_ALREADY_INACTIVE
 
     # --- Revoke ---
     now = datetime.utcnow()
@@ -357,6 +377,9 @@ def _check_numeric_envelope(field, new_value, constraints):
         val = Decimal(str(new_value))
     except Exception:
         return f'Invalid numeric value: {new_value}'
+    # NaN cannot be ordered against the bounds; Infinity is never in one.
+    if not val.is_finite():
+        return f'Invalid numeric value: {new_value}'
 
     min_val = constraints.get('min_value')
     max_val = constraints.get('max_value')
@@ -0,0 +1,48 @@
+"""
+Governance error messages — shared constants for (result, error) returns.
+
+Governance functions report failures as ``(None, str)``. Messages that
+callers branch on (routes mapping to HTTP status codes, tests asserting a
+specific failure) are defined here once so both sides compare against the
+same value instead of matching on free-form wording.
+
+Prefix constants are followed by ``': <detail>'`` in the returned string;
+match them with ``error.startswith(...)``. The remaining constants are
+returned verbatim.
+"""
+
+# ---------------------------------------------------------------------------
+# Delegation: violations (mapped to HTTP 403 by the routes)
+# ---------------------------------------------------------------------------
+
+ERR_ENVELOPE_VIOLATION = 'Grant envelope violation'
+ERR_WORKSPACE_BOUNDARY_VIOLATION = 'Workspace boundary violation'
+
+DELEGATION_VIOLATIONS = (
+    ERR_ENVELOPE_VIOLATION,
+    ERR_WORKSPACE_BOUNDARY_VIOLATION,
+)
+
+# ---------------------------------------------------------------------------
+# Delegation: grant state
+# ---------------------------------------------------------------------------
+
+ERR_GRANT_NOT_FOUND = 'Grant not found'
+ERR_GRANT_WRONG_AGENT = 'Grant does not belong to this agent'
+ERR_GRANT_INACTIVE = 'Grant is no longer active'
+ERR_GRANT_NOT_YET_VALID = 'Grant is not yet valid'
+ERR_GRANT_EXPIRED = 'Grant has expired'
+ERR_GRANT_ALREADY_INACTIVE = 'Grant is already inactive'
+
+# ---------------------------------------------------------------------------
+# Approval and rollback: boundary re-validation (mapped to HTTP 403)
+# ---------------------------------------------------------------------------
+
+ERR_BOUNDARY_VIOLATION = 'Boundary violation'
+ERR_ROLLBACK_BLOCKED = 'Rollback blocked'
+
+# ---------------------------------------------------------------------------
+# Approval: lost review race (mapped to HTTP 409)
+# ---------------------------------------------------------------------------
+
+ERR_REQUEST_NOT_PENDING = 'Request is no longer pending'
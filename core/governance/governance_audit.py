@@ -4,11 +4,133 @@ Governance audit log — append-only trail for all governance events.
 Every governance state transition (request, approval, denial, application,
 expiration, rollback, boundary violation) is logged here. Separate from
 risk_audit_log which tracks automated interventions.
+
+Entries are hash-chained per workspace: each row stores the row_hash of the
+workspace's previous entry (prev_hash) and its own row_hash, a SHA-256 over
+prev_hash plus the row's canonical JSON. Editing a row breaks its own hash;
+deleting or re-hashing one orphans the prev_hash of its successor.
+verify_chain() checks both. Concurrent writers in one workspace may both
+chain onto the same head; such forks are accepted, they are not gaps.
+
+Trail queries are memoized for the lifetime of the current database
+transaction (approve -> read trail -> read again runs one query, not
+three). The memo lives in ``session.info`` and is discarded once the
+session moves on to a new transaction, so a commit or rollback always
+forces a fresh read. Within the transaction it is dropped whenever the
+session writes to governance_audit_log: log_governance_event, a flush
+touching an audit entry, or an INSERT/UPDATE/DELETE statement against the
+table run through session.execute(). Only this session's own writes are
+seen: audit rows another transaction commits meanwhile show up from the
+next transaction on, even under READ COMMITTED.
 """
+import functools
+import hashlib
+import json
+from datetime import datetime
+
+from sqlalchemy import event
+
+_TRAIL_CACHE_KEY = 'governance_trail_cache'
+_CHAIN_HEAD_KEY = 'governance_chain_heads'
+
+
+def _transaction_memo(session, key):
+    """Return the session.info memo under key for the current transaction.
+
+    Outside a transaction there is nothing to scope the memo to, so a
+    throwaway dict is returned and nothing is cached.
+    """
+    txn = session.get_transaction()
+    if txn is None:
+        return {}
+    cached = session.info.get(key)
+    if cached is None or cached[0] is not txn:
+        cached = (txn, {})
+        session.info[key] = cached
+    return cached[1]
+
+
+def _drop_trail_memo_on_flush(session, flush_context, instances):
+    """Drop the trail memo when a flush will write an audit entry."""
+    from models import GovernanceAuditLog
+
+    if _TRAIL_CACHE_KEY not in session.info:
+        return
+    pending = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, GovernanceAuditLog) for obj in pending):
+        session.info.pop(_TRAIL_CACHE_KEY, None)
+
+
+def _drop_trail_memo_on_write(orm_execute_state):
+    """Drop the trail memo when a statement writes to the audit table."""
+    from models import GovernanceAuditLog
+
+    session = orm_execute_state.session
+    if _TRAIL_CACHE_KEY not in session.info or orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, 'table', None)
+    if getattr(table, 'name', None) == GovernanceAuditLog.__tablename__:
+        session.info.pop(_TRAIL_CACHE_KEY, None)
+
+
+def _watch_trail_writes():
+    """Register the memo-dropping listeners on db.session's factory.
+
+    Listening on the scoped session rather than the global Session class
+    keeps them off sessions that never serve the trail.
+    """
+    from models import db
+
+    event.listen(db.session, 'before_flush', _drop_trail_memo_on_flush)
+    event.listen(db.session, 'do_orm_execute', _drop_trail_memo_on_write)
+
+
+_watch_trail_writes()
+
+
+def _row_hash(prev_hash, workspace_id, agent_id, actor_id, event_type,
+              details, created_at):
+    """SHA-256 hex digest chaining an entry's content onto prev_hash."""
+    payload = json.dumps(
+        {
+            'workspace_id': workspace_id,
+            'agent_id': agent_id,
+            'actor_id': actor_id,
+            'event_type': event_type,
+            'details': details,
+            'created_at': created_at.isoformat(),
+        },
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256((prev_hash + payload).encode()).hexdigest()
+
+
+def _chain_heads(session, workspace_id):
+    """Return the transaction's {workspace_id: row_hash} chain-head memo.
+
+    A workspace's head is read from the table once per transaction, then
+    advanced in memory as entries are logged, so pending (unflushed)
+    entries chain onto each other without forcing a flush.
+    """
+    from sqlalchemy import select
+    from models import GovernanceAuditLog
+
+    session.connection()  # begin the transaction the memo is scoped to
+    heads = _transaction_memo(session, _CHAIN_HEAD_KEY)
+    if workspace_id not in heads:
+        with session.no_autoflush:
+            heads[workspace_id] = session.execute(
+                select(GovernanceAuditLog.row_hash)
+                .where(GovernanceAuditLog.workspace_id == workspace_id)
+                .order_by(GovernanceAuditLog.id.desc())
+                .limit(1)
+            ).scalar() or ''
+    return heads
 
 
 def log_governance_event(workspace_id, event_type, details,
-                         agent_id=None, actor_id=None):
+                         agent_id=None, actor_id=None, created_at=None):
     """Write a governance audit log entry.
 
     Args:
@@ -22,24 +144,71 @@ def log_governance_event(workspace_id, event_type, details,
                  policy_before/policy_after for mutation events.
         agent_id: The agent involved (may be None for system events).
         actor_id: The human who acted (may be None for agent/system events).
+        created_at: Timestamp for the entry (default: now). Callers pass the
+                    time they stamped on the state change they are auditing.
+
+    The entry is only added to the session, never flushed here, so all
+    audit rows of an operation go out in the same flush as its state change
+    when the caller commits.
 
     Returns:
         GovernanceAuditLog instance.
     """
     from models import db, GovernanceAuditLog
 
+    now = created_at or datetime.utcnow()
+    heads = _chain_heads(db.session(), workspace_id)
+    prev_hash = heads[workspace_id]
+    row_hash = _row_hash(prev_hash, workspace_id, agent_id, actor_id,
+                         event_type, details, now)
+
     entry = GovernanceAuditLog(
         workspace_id=workspace_id,
         agent_id=agent_id,
         actor_id=actor_id,
         event_type=event_type,
         details=details,
+        created_at=now,
+        prev_hash=prev_hash,
+        row_hash=row_hash,
     )
     db.session.add(entry)
+    heads[workspace_id] = row_hash
+    db.session.info.pop(_TRAIL_CACHE_KEY, None)
     # Caller is responsible for commit (batched with request status update).
     return entry
 
 
+@functools.lru_cache(maxsize=None)
+def _trail_statement(by_event_type, by_agent):
+    """Return the trail SELECT for one filter combination, built once.
+
+    Filter values and the limit are bind parameters, so the statement is
+    reused as-is and SQLAlchemy's compiled cache is hit without rebuilding
+    the query and its cache key on every call.
+    """
+    from sqlalchemy import bindparam, select
+    from models import GovernanceAuditLog
+
+    stmt = select(GovernanceAuditLog).where(
+        GovernanceAuditLog.workspace_id == bindparam('workspace_id'),
+    )
+    if by_event_type:
+        stmt = stmt.where(
+            GovernanceAuditLog.event_type == bindparam('event_type'),
+        )
+    if by_agent:
+        stmt = stmt.where(GovernanceAuditLog.agent_id == bindparam('agent_id'))
+
+    # id breaks ties between entries logged in the same instant, so the
+    # newest entry is always first.
+    return (
+        stmt.order_by(GovernanceAuditLog.created_at.desc(),
+                      GovernanceAuditLog.id.desc())
+        .limit(bindparam('limit'))
+    )
+
+
 def get_governance_trail(workspace_id, event_type=None, agent_id=None,
                          limit=100):
     """Query the governance audit trail for a workspace.
@@ -50,17 +219,64 @@ def get_governance_trail(workspace_id, event_type=None, agent_id=None,
         agent_id: Optional filter by agent.
         limit: Max entries to return (default 100).
 
+    Results are memoized until this session writes an audit entry or ends
+    its transaction. Entries committed by other transactions in the
+    meantime are not picked up until the next transaction.
+
     Returns:
         list[GovernanceAuditLog] ordered by created_at descending.
     """
-    from models import GovernanceAuditLog
+    from models import db
+
+    session = db.session()
+    # Flush up front, as the query's autoflush would: a flush that writes
+    # audit entries drops the memo, and it must do so before the memo is
+    # consulted rather than under the query that refills it.
+    if session.autoflush:
+        session.flush()
+
+    key = (workspace_id, event_type, agent_id, limit)
+    cache = _transaction_memo(session, _TRAIL_CACHE_KEY)
+    if key not in cache:
+        stmt = _trail_statement(event_type is not None, agent_id is not None)
+        cache[key] = session.execute(stmt, {
+            'workspace_id': workspace_id,
+            'event_type': event_type,
+            'agent_id': agent_id,
+            'limit': limit,
+        }).scalars().all()
 
-    q = GovernanceAuditLog.query.filter_by(workspace_id=workspace_id)
+    return list(cache[key])
 
-    if event_type is not None:
-        q = q.filter_by(event_type=event_type)
 
-    if agent_id is not None:
-        q = q.filter_by(agent_id=agent_id)
+def verify_chain(workspace_id):
+    """Check a workspace's audit entries against their hash chain.
 
-    return q.order_by(GovernanceAuditLog.created_at.desc()).limit(limit).all()
+    Every hashed entry must match the hash recomputed from its stored
+    content and prev_hash, and every non-empty prev_hash must be the
+    row_hash of another entry in the workspace. Entries written before
+    hashing was introduced (row_hash NULL) are skipped.
+
+    Returns:
+        (True, None) if the chain is intact.
+        (False, str) naming the first entry that fails.
+    """
+    from models import GovernanceAuditLog
+
+    entries = (
+        GovernanceAuditLog.query
+        .filter(GovernanceAuditLog.workspace_id == workspace_id,
+                GovernanceAuditLog.row_hash.isnot(None))
+        .order_by(GovernanceAuditLog.id)
+        .all()
+    )
+    known = {e.row_hash for e in entries}
+    for e in entries:
+        expected = _row_hash(e.prev_hash, e.workspace_id, e.agent_id,
+                             e.actor_id, e.event_type, e.details,
+                             e.created_at)
+        if e.row_hash != expected:
+            return False, f'Audit entry {e.id} does not match its hash'
+        if e.prev_hash and e.prev_hash not in known:
+            return False, f'Audit entry {e.id} follows a missing entry'
+    return True, None
@@ -60,7 +60,9 @@ def create_request(workspace_id, agent_id, requested_changes, reason):
         return None, 'requested_changes.requested_value is required'
 
     # --- Validate field is mutable ---
-    if field not in MUTABLE_FIELDS:
+    # One set lookup; the isinstance check keeps unhashable JSON values
+    # (lists, objects) from raising TypeError on the membership test.
+    if not isinstance(field, str) or field not in MUTABLE_FIELDS:
         return None, f'Field "{field}" is not mutable via governance'
 
     # --- Validate policy exists and belongs to workspace ---
@@ -71,7 +73,8 @@ def create_request(workspace_id, agent_id, requested_changes, reason):
         return None, 'Policy not found or does not belong to workspace'
 
     # --- Cooldown check ---
-    cooldown_cutoff = datetime.utcnow() - timedelta(minutes=REQUEST_COOLDOWN_MINUTES)
+    now = datetime.utcnow()
+    cooldown_cutoff = now - timedelta(minutes=REQUEST_COOLDOWN_MINUTES)
     recent = PolicyChangeRequest.query.filter(
         PolicyChangeRequest.workspace_id == workspace_id,
         PolicyChangeRequest.policy_id == policy_id,
@@ -94,7 +97,6 @@ def create_request(workspace_id, agent_id, requested_changes, reason):
         requested_changes = dict(requested_changes)
         requested_changes['current_value'] = current_value
 
-    now = datetime.utcnow()
     pcr = PolicyChangeRequest(
         workspace_id=workspace_id,
         agent_id=agent_id,
@@ -122,6 +124,7 @@ def create_request(workspace_id, agent_id, requested_changes, reason):
             'reason': reason,
         },
         agent_id=agent_id,
+        created_at=now,
     )
 
     db.session.commit()
@@ -130,7 +133,8 @@ def create_request(workspace_id, agent_id, requested_changes, reason):
     return pcr, None
 
 
-def get_requests(workspace_id, status=None, agent_id=None, limit=50):
+def get_requests(workspace_id, status=None, agent_id=None, limit=50,
+                 before=None):
     """List policy change requests for a workspace.
 
     Args:
@@ -138,11 +142,14 @@ def get_requests(workspace_id, status=None, agent_id=None, limit=50):
         status: Optional filter by status.
         agent_id: Optional filter by requesting agent.
         limit: Max entries to return (default 50).
+        before: Optional (requested_at, id) keyset; only rows ordered after
+            it are returned. See request_cursor() / parse_request_cursor().
 
     Returns:
-        list[PolicyChangeRequest] ordered by requested_at descending.
+        list[PolicyChangeRequest] ordered by requested_at, then id,
+        descending.
     """
-    from models import PolicyChangeRequest
+    from models import db, PolicyChangeRequest
 
     q = PolicyChangeRequest.query.filter_by(workspace_id=workspace_id)
 
@@ -150,8 +157,52 @@ def get_requests(workspace_id, status=None, agent_id=None, limit=50):
         q = q.filter_by(status=status)
     if agent_id is not None:
         q = q.filter_by(agent_id=agent_id)
+    if before is not None:
+        q = q.filter(
+            db.tuple_(PolicyChangeRequest.requested_at, PolicyChangeRequest.id)
+            < db.tuple_(*before)
+        )
+
+    return q.order_by(
+        PolicyChangeRequest.requested_at.desc(),
+        PolicyChangeRequest.id.desc(),
+    ).limit(limit).all()
+
+
+def count_pending_requests(workspace_id):
+    """Count a workspace's pending requests with a single COUNT(*).
+
+    Backs the approval UI's badge, which only needs the number and should
+    not pay for loading and serializing the rows.
+    """
+    from models import db, PolicyChangeRequest
 
-    return q.order_by(PolicyChangeRequest.requested_at.desc()).limit(limit).all()
+    return db.session.execute(
+        db.select(db.func.count())
+        .select_from(PolicyChangeRequest)
+        .filter_by(workspace_id=workspace_id, status='pending')
+    ).scalar_one()
+
+
+def request_cursor(pcr):
+    """Encode a request's position as an opaque pagination cursor."""
+    return f'{pcr.requested_at.isoformat()}_{pcr.id}'
+
+
+def parse_request_cursor(cursor):
+    """Decode a cursor from request_cursor().
+
+    Returns:
+        (requested_at, id) tuple for get_requests(before=...), or None if
+        the cursor is malformed.
+    """
+    requested_at, sep, pcr_id = cursor.rpartition('_')
+    if not sep:
+        return None
+    try:
+        return datetime.fromisoformat(requested_at), int(pcr_id)
+    except ValueError:
+        return None
 
 
 def get_request(request_id, workspace_id):
@@ -180,30 +231,40 @@ def expire_stale_requests(max_age_hours=DEFAULT_EXPIRY_HOURS):
     Returns:
         int: Count of requests expired.
     """
+    from sqlalchemy import update
     from models import db, PolicyChangeRequest
     from core.governance.governance_audit import log_governance_event
 
     now = datetime.utcnow()
     fallback_cutoff = now - timedelta(hours=max_age_hours)
 
-    # Find pending requests that are expired
-    stale = PolicyChangeRequest.query.filter(
-        PolicyChangeRequest.status == 'pending',
-        db.or_(
-            db.and_(
-                PolicyChangeRequest.expires_at.isnot(None),
-                PolicyChangeRequest.expires_at <= now,
-            ),
-            db.and_(
-                PolicyChangeRequest.expires_at.is_(None),
-                PolicyChangeRequest.requested_at <= fallback_cutoff,
+    # Expire every stale pending request in one UPDATE; RETURNING hands back
+    # what the audit entries need without loading the rows first.
+    stale = db.session.execute(
+        update(PolicyChangeRequest)
+        .where(
+            PolicyChangeRequest.status == 'pending',
+            db.or_(
+                db.and_(
+                    PolicyChangeRequest.expires_at.isnot(None),
+                    PolicyChangeRequest.expires_at <= now,
+                ),
+                db.and_(
+                    PolicyChangeRequest.expires_at.is_(None),
+                    PolicyChangeRequest.requested_at <= fallback_cutoff,
+                ),
             ),
-        ),
+        )
+        .values(status='expired')
+        .returning(
+            PolicyChangeRequest.id,
+            PolicyChangeRequest.workspace_id,
+            PolicyChangeRequest.policy_id,
+            PolicyChangeRequest.agent_id,
+        )
     ).all()
 
-    count = 0
     for req in stale:
-        req.status = 'expired'
         log_governance_event(
             workspace_id=req.workspace_id,
             event_type='request_expired',
@@ -214,9 +275,8 @@ def expire_stale_requests(max_age_hours=DEFAULT_EXPIRY_HOURS):
             },
             agent_id=req.agent_id,
         )
-        count += 1
 
-    if count > 0:
+    if stale:
         db.session.commit()
 
-    return count
+    return len(stale)
@@ -12,6 +12,15 @@ restores the state that existed before the rollback was applied.
 from datetime import datetime
 from decimal import Decimal
 
+from core.governance.errors import ERR_ROLLBACK_BLOCKED
+
+# Column coercion for restorable fields (snapshots store them as strings).
+_RESTORE_TYPES = {
+    'threshold_value': lambda value: Decimal(str(value)),
+    'cooldown_minutes': int,
+    'action_type': str,
+}
+
 
 def rollback_change(audit_entry_id, workspace_id, actor_id):
     """Rollback a policy change to its pre-change state.
@@ -23,7 +32,9 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
         actor_id: The human initiating the rollback.
 
     Returns:
-        (dict, None) on success — rollback details.
+        (dict, None) on success — rollback details, including
+            ``rollback_entry_id`` (the change_rolled_back entry written
+            here, which can itself be rolled back).
         (None, str) on failure — error message.
     """
     from models import db, GovernanceAuditLog, RiskPolicy, User
@@ -31,7 +42,7 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
     from core.governance.governance_audit import log_governance_event
 
     # --- Validate actor ---
-    actor = User.query.get(actor_id)
+    actor = db.session.get(User, actor_id)
     if actor is None:
         return None, 'Actor not found'
     if actor_id != workspace_id and not actor.is_admin:
@@ -79,14 +90,16 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
     }
 
     # --- Boundary re-validation for each field being changed ---
+    changed_fields = {}
     for field, snapshot_value in restorable_fields.items():
         if snapshot_value is None:
             continue
 
-        # Only validate if the value is actually changing
+        # Only validate (and later restore) if the value is actually changing
         current_val = str(getattr(policy, field, None))
         if current_val == str(snapshot_value):
             continue
+        changed_fields[field] = snapshot_value
 
         valid, boundary_error = validate_against_boundaries(
             workspace_id, policy_id, field, snapshot_value,
@@ -107,19 +120,17 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
             )
             db.session.commit()
             return None, (
-                f'Rollback blocked: restoring {field} to {snapshot_value} '
+                f'{ERR_ROLLBACK_BLOCKED}: restoring {field} to {snapshot_value} '
                 f'would violate current boundaries: {boundary_error}'
             )
 
     # --- Apply rollback ---
     now = datetime.utcnow()
 
-    if restorable_fields.get('threshold_value') is not None:
-        policy.threshold_value = Decimal(str(restorable_fields['threshold_value']))
-    if restorable_fields.get('cooldown_minutes') is not None:
-        policy.cooldown_minutes = int(restorable_fields['cooldown_minutes'])
-    if restorable_fields.get('action_type') is not None:
-        policy.action_type = str(restorable_fields['action_type'])
+    # Typically a single field differs; the UPDATE then carries only that
+    # column (plus updated_at), since the ORM writes modified attributes only.
+    for field, snapshot_value in changed_fields.items():
+        setattr(policy, field, _RESTORE_TYPES[field](snapshot_value))
 
     policy.updated_at = now
 
@@ -127,7 +138,7 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
     policy_after = policy.to_dict()
 
     # --- Audit: rollback ---
-    log_governance_event(
+    rollback_entry = log_governance_event(
         workspace_id=workspace_id,
         event_type='change_rolled_back',
         details={
@@ -146,6 +157,7 @@ def rollback_change(audit_entry_id, workspace_id, actor_id):
 
     return {
         'audit_entry_id': audit_entry_id,
+        'rollback_entry_id': rollback_entry.id,
         'policy_id': policy_id,
         'policy_before_rollback': policy_current,
         'policy_after_rollback': policy_after,
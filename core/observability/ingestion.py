@@ -66,13 +66,22 @@ def emit_event(user_id, event_type, status='info', agent_id=None, run_id=None,
 
 
 def emit_event_batch(events_data, user_id):
-    """Write a batch of events. Returns (accepted_count, rejected list)."""
+    """Write a batch of events. Returns (accepted_count, rejected list).
+
+    Accepted events go to the database as one multi-row INSERT rather than
+    through the ORM unit of work, so a large batch neither builds an
+    ObsEvent instance per row nor pays per-row flush bookkeeping. Where the
+    dialect supports it, rows whose dedupe_key already exists are skipped
+    by the same statement (ON CONFLICT DO NOTHING) and reported as
+    rejected, instead of failing the batch.
+    """
     if not _check_obs_tables():
         return 0, [{'index': i, 'reason': 'obs tables not available'} for i in range(len(events_data))]
 
-    from models import db, ObsEvent
+    from models import db
 
-    accepted = 0
+    rows = []
+    indexes = []
     rejected = []
 
     for i, ev in enumerate(events_data):
@@ -95,37 +104,83 @@ def emit_event_batch(events_data, user_id):
             if cost_usd is None and tokens_in and model and provider:
                 cost_usd = float(calculate_cost(provider, model, tokens_in, tokens_out))
 
-            event = ObsEvent(
-                uid=ev.get('id') or str(uuid.uuid4()),
-                user_id=user_id,
-                agent_id=ev.get('agent_id'),
-                run_id=ev.get('run_id'),
-                event_type=etype,
-                status=estatus,
-                model=model,
-                tokens_in=tokens_in,
-                tokens_out=tokens_out,
-                cost_usd=Decimal(str(cost_usd)) if cost_usd else None,
-                latency_ms=ev.get('latency_ms'),
-                payload=ev.get('payload', {}),
-                dedupe_key=ev.get('dedupe_key'),
-            )
-            db.session.add(event)
-            accepted += 1
+            indexes.append(i)
+            rows.append({
+                'uid': ev.get('id') or str(uuid.uuid4()),
+                'user_id': user_id,
+                'agent_id': ev.get('agent_id'),
+                'run_id': ev.get('run_id'),
+                'event_type': etype,
+                'status': estatus,
+                'model': model,
+                'tokens_in': tokens_in,
+                'tokens_out': tokens_out,
+                'cost_usd': Decimal(str(cost_usd)) if cost_usd else None,
+                'latency_ms': ev.get('latency_ms'),
+                'payload': ev.get('payload', {}),
+                'dedupe_key': ev.get('dedupe_key'),
+            })
 
         except Exception as e:
             rejected.append({'index': i, 'reason': str(e)})
 
-    if accepted > 0:
-        try:
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-            return _commit_one_by_one(events_data, user_id)
+    if not rows:
+        return 0, rejected
+
+    try:
+        inserted_keys = _insert_events(rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        return _commit_one_by_one(events_data, user_id)
 
+    if inserted_keys is None:
+        return len(rows), rejected
+
+    # A dedupe_key was inserted for at most one row; every other row
+    # carrying it (already stored, or repeated in this batch) was skipped.
+    accepted = 0
+    for i, row in zip(indexes, rows):
+        key = row['dedupe_key']
+        if key is None:
+            accepted += 1
+        elif key in inserted_keys:
+            inserted_keys.remove(key)
+            accepted += 1
+        else:
+            rejected.append({'index': i, 'reason': 'duplicate dedupe_key'})
     return accepted, rejected
 
 
+def _insert_events(rows):
+    """INSERT the event rows in one statement.
+
+    On PostgreSQL and SQLite, dedupe_key conflicts are skipped by the
+    database and the set of dedupe_keys actually written is returned.
+    Other dialects get a plain INSERT and None is returned; a conflict
+    there raises and the caller falls back to row-by-row inserts.
+    """
+    from sqlalchemy import insert
+    from models import db, ObsEvent
+
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        db.session.execute(insert(ObsEvent), rows)
+        return None
+
+    stmt = (
+        dialect_insert(ObsEvent)
+        .on_conflict_do_nothing(index_elements=['dedupe_key'])
+        .returning(ObsEvent.dedupe_key)
+    )
+    result = db.session.execute(stmt, rows)
+    return {key for key in result.scalars() if key is not None}
+
+
 def _commit_one_by_one(events_data, user_id):
     """Fallback: insert events individually to isolate dedupe conflicts."""
     accepted = 0
@@ -6,8 +6,14 @@ from decimal import Decimal
 
 
 def aggregate_daily(target_date=None):
-    """Aggregate obs_events for target_date into obs_agent_daily_metrics. Returns rows upserted."""
-    from models import db, ObsEvent, ObsAgentDailyMetrics
+    """Aggregate obs_events for target_date into obs_agent_daily_metrics. Returns rows upserted.
+
+    Counters, token/cost sums and the last heartbeat are computed by the
+    database in one GROUP BY over the day's events. Only the LLM-call
+    latencies and models, which feed the percentiles and the models_used
+    histogram, are read back row by row, and only those two columns.
+    """
+    from models import db, ObsEvent
 
     if target_date is None:
         from datetime import datetime as _dt
@@ -15,74 +21,78 @@ def aggregate_daily(target_date=None):
 
     day_start = datetime.combine(target_date, datetime.min.time())
     day_end = day_start + timedelta(days=1)
-
-    pairs = db.session.query(
-        ObsEvent.user_id, ObsEvent.agent_id
-    ).filter(
+    in_day = (
         ObsEvent.created_at >= day_start,
         ObsEvent.created_at < day_end,
-    ).distinct().all()
+    )
+
+    def count_if(*conditions):
+        return db.func.sum(db.case((db.and_(*conditions), 1), else_=0))
+
+    is_run = ObsEvent.event_type == 'run_finished'
+    totals = db.session.query(
+        ObsEvent.user_id,
+        ObsEvent.agent_id,
+        db.func.count().label('total_events'),
+        count_if(is_run).label('total_runs'),
+        count_if(is_run, ObsEvent.status == 'success').label('successful_runs'),
+        count_if(is_run, ObsEvent.status == 'error').label('failed_runs'),
+        db.func.coalesce(db.func.sum(ObsEvent.tokens_in), 0).label('total_tokens_in'),
+        db.func.coalesce(db.func.sum(ObsEvent.tokens_out), 0).label('total_tokens_out'),
+        db.func.sum(ObsEvent.cost_usd).label('total_cost'),
+        count_if(ObsEvent.event_type == 'tool_call').label('total_tool_calls'),
+        count_if(
+            ObsEvent.event_type.in_(('tool_call', 'tool_result')),
+            ObsEvent.status == 'error',
+        ).label('tool_errors'),
+        db.func.max(db.case(
+            (ObsEvent.event_type == 'heartbeat', ObsEvent.created_at),
+        )).label('last_heartbeat_at'),
+    ).filter(*in_day).group_by(ObsEvent.user_id, ObsEvent.agent_id).all()
+
+    llm_calls = {}
+    for user_id, agent_id, latency_ms, model in db.session.query(
+        ObsEvent.user_id, ObsEvent.agent_id, ObsEvent.latency_ms, ObsEvent.model,
+    ).filter(*in_day, ObsEvent.event_type == 'llm_call'):
+        llm_calls.setdefault((user_id, agent_id), []).append((latency_ms, model))
 
     count = 0
-    for user_id, agent_id in pairs:
+    for row in totals:
         try:
-            _aggregate_one(user_id, agent_id, target_date, day_start, day_end)
+            _aggregate_one(row, llm_calls.get((row.user_id, row.agent_id), []),
+                           target_date)
             count += 1
         except Exception as e:
             from models import db as _db
             _db.session.rollback()
-            print(f"[obs] aggregate failed for user={user_id} agent={agent_id}: {e}")
+            print(f"[obs] aggregate failed for user={row.user_id} agent={row.agent_id}: {e}")
 
     return count
 
 
-def _aggregate_one(user_id, agent_id, target_date, day_start, day_end):
-    """Aggregate for a single (user, agent, day) tuple."""
-    from models import db, ObsEvent, ObsAgentDailyMetrics
-
-    base_q = ObsEvent.query.filter(
-        ObsEvent.user_id == user_id,
-        ObsEvent.created_at >= day_start,
-        ObsEvent.created_at < day_end,
-    )
-    if agent_id is not None:
-        base_q = base_q.filter(ObsEvent.agent_id == agent_id)
-    else:
-        base_q = base_q.filter(ObsEvent.agent_id.is_(None))
-
-    events = base_q.all()
-    if not events:
-        return
-
-    run_events = [e for e in events if e.event_type == 'run_finished']
-    llm_events = [e for e in events if e.event_type == 'llm_call']
-    tool_events = [e for e in events if e.event_type in ('tool_call', 'tool_result')]
-    heartbeat_events = [e for e in events if e.event_type == 'heartbeat']
-
-    total_runs = len(run_events)
-    successful_runs = len([e for e in run_events if e.status == 'success'])
-    failed_runs = len([e for e in run_events if e.status == 'error'])
+def _aggregate_one(totals, llm_calls, target_date):
+    """Upsert the metrics row for one (user, agent, day) GROUP BY row.
 
-    total_tokens_in = sum(e.tokens_in or 0 for e in events)
-    total_tokens_out = sum(e.tokens_out or 0 for e in events)
-    total_cost = sum(Decimal(str(e.cost_usd or 0)) for e in events)
+    llm_calls is the [(latency_ms, model), ...] list for that agent's
+    llm_call events.
+    """
+    from models import db, ObsAgentDailyMetrics
 
-    total_tool_calls = len([e for e in tool_events if e.event_type == 'tool_call'])
-    tool_errors = len([e for e in tool_events if e.status == 'error'])
+    user_id, agent_id = totals.user_id, totals.agent_id
 
     # Latency percentiles from LLM call events
-    latencies = sorted([e.latency_ms for e in llm_events if e.latency_ms])
+    latencies = sorted(latency for latency, _ in llm_calls if latency)
     latency_p50 = _percentile(latencies, 50) if latencies else None
     latency_p95 = _percentile(latencies, 95) if latencies else None
     latency_avg = int(sum(latencies) / len(latencies)) if latencies else None
 
     # Models used
     models = {}
-    for e in llm_events:
-        if e.model:
-            models[e.model] = models.get(e.model, 0) + 1
+    for _, model in llm_calls:
+        if model:
+            models[model] = models.get(model, 0) + 1
 
-    last_hb = max((e.created_at for e in heartbeat_events), default=None)
+    total_cost = Decimal(str(totals.total_cost or 0))
 
     # Upsert
     existing = ObsAgentDailyMetrics.query.filter_by(
@@ -95,20 +105,20 @@ def _aggregate_one(user_id, agent_id, target_date, day_start, day_end):
         m = ObsAgentDailyMetrics(user_id=user_id, agent_id=agent_id, date=target_date)
         db.session.add(m)
 
-    m.total_runs = total_runs
-    m.successful_runs = successful_runs
-    m.failed_runs = failed_runs
-    m.total_events = len(events)
-    m.total_tokens_in = total_tokens_in
-    m.total_tokens_out = total_tokens_out
+    m.total_runs = totals.total_runs
+    m.successful_runs = totals.successful_runs
+    m.failed_runs = totals.failed_runs
+    m.total_events = totals.total_events
+    m.total_tokens_in = totals.total_tokens_in
+    m.total_tokens_out = totals.total_tokens_out
     m.total_cost_usd = total_cost.quantize(Decimal('0.00000001'))
-    m.total_tool_calls = total_tool_calls
-    m.tool_errors = tool_errors
+    m.total_tool_calls = totals.total_tool_calls
+    m.tool_errors = totals.tool_errors
     m.latency_p50_ms = latency_p50
     m.latency_p95_ms = latency_p95
     m.latency_avg_ms = latency_avg
     m.models_used = models
-    m.last_heartbeat_at = last_hb
+    m.last_heartbeat_at = totals.last_heartbeat_at
 
     db.session.commit()
 
@@ -3,6 +3,7 @@ Database models for OpenClaw Dashboard monetization
 """
 from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import JSONB
 import secrets
 import hashlib
 
@@ -1032,6 +1033,14 @@ class WorkspaceTier(db.Model):
         ),
     }
 
+    @classmethod
+    def create_for_workspace(cls, workspace_id, tier_name='free'):
+        """Create a tier row populated with TIER_DEFAULTS[tier_name]."""
+        tier = cls(workspace_id=workspace_id, tier_name=tier_name,
+                   **cls.TIER_DEFAULTS[tier_name])
+        db.session.add(tier)
+        return tier
+
     def to_dict(self):
         return {
             'workspace_id': self.workspace_id,
@@ -1248,6 +1257,18 @@ class PolicyChangeRequest(db.Model):
         db.Index('ix_pcr_ws_status', 'workspace_id', 'status'),
         db.Index('ix_pcr_agent_status', 'agent_id', 'status'),
         db.Index('ix_pcr_status_requested', 'status', 'requested_at'),
+        # Partial index for the per-policy cooldown check in create_request:
+        # only pending requests are ever looked up this way, and they are a
+        # small slice of the table.
+        db.Index('ix_pcr_pending_policy_requested', 'policy_id', 'requested_at',
+                 postgresql_where=db.text("status = 'pending'"),
+                 sqlite_where=db.text("status = 'pending'")),
+        # Partial index for the pending list's keyset pagination, which
+        # seeks on (requested_at, id) within one workspace.
+        db.Index('ix_pcr_pending_ws_requested_id',
+                 'workspace_id', 'requested_at', 'id',
+                 postgresql_where=db.text("status = 'pending'"),
+                 sqlite_where=db.text("status = 'pending'")),
     )
 
     def to_dict(self):
@@ -1294,7 +1315,11 @@ class DelegationGrant(db.Model):
 
     __table_args__ = (
         db.Index('ix_dg_ws_agent_active', 'workspace_id', 'agent_id', 'active'),
-        db.Index('ix_dg_active_valid_to', 'active', 'valid_to'),
+        # Partial index: the expiry sweep only ever looks at active grants,
+        # so inactive history is kept out of the index entirely.
+        db.Index('ix_dg_active_valid_to', 'valid_to',
+                 postgresql_where=db.text('active'),
+                 sqlite_where=db.text('active')),
     )
 
     def to_dict(self):
@@ -1325,16 +1350,34 @@ class GovernanceAuditLog(db.Model):
     agent_id = db.Column(db.Integer, db.ForeignKey('agents.id'), nullable=True)
     actor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     event_type = db.Column(db.String(50), nullable=False)
-    details = db.Column(db.JSON, nullable=False)
+    # JSONB on PostgreSQL so containment filters (details @> {...}) can use
+    # the GIN index below; plain JSON elsewhere.
+    details = db.Column(db.JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # Per-workspace hash chain, set by log_governance_event (see
+    # core.governance.governance_audit.verify_chain). NULL on older rows.
+    prev_hash = db.Column(db.String(64), nullable=True)
+    row_hash = db.Column(db.String(64), nullable=True)
 
     workspace = db.relationship('User', foreign_keys=[workspace_id], backref='governance_audit_logs')
     agent = db.relationship('Agent', backref='governance_audit_logs')
     actor = db.relationship('User', foreign_keys=[actor_id])
 
+    # Trail queries filter by workspace plus event_type or agent_id and read
+    # newest-first; the composites serve both the filter and the ORDER BY
+    # (b-trees scan backwards, so no DESC column is needed). Every governance
+    # write appends here, so keep the set minimal: (workspace_id, event_type)
+    # alone would be a redundant prefix of ix_gov_audit_ws_type_created.
     __table_args__ = (
         db.Index('ix_gov_audit_ws_created', 'workspace_id', 'created_at'),
-        db.Index('ix_gov_audit_ws_type', 'workspace_id', 'event_type'),
+        db.Index('ix_gov_audit_ws_type_created',
+                 'workspace_id', 'event_type', 'created_at'),
+        db.Index('ix_gov_audit_ws_agent_created',
+                 'workspace_id', 'agent_id', 'created_at'),
+        db.Index('ix_gov_audit_details_gin', 'details',
+                 postgresql_using='gin',
+                 postgresql_ops={'details': 'jsonb_path_ops'},
+                 ).ddl_if(dialect='postgresql'),
     )
 
     def to_dict(self):
@@ -17,6 +17,7 @@ Phase 4:
     GET  /api/governance/audit              — Query governance audit trail
 Phase 5:
     GET  /api/governance/pending            — List pending requests (UI convenience)
+    GET  /api/governance/pending/count      — Pending request count (UI badge)
 """
 import os
 from flask import jsonify, request, session
@@ -76,7 +77,7 @@ def register_governance_routes(app):
         Query params:
             status (str, optional): Filter by status.
             agent_id (int, optional): Filter by agent.
-            limit (int, optional): Max results (default 50).
+            limit (int, optional): Max results (default 50, capped at 200).
         """
         user_id = session.get('user_id')
         if not user_id:
@@ -105,11 +106,14 @@ def register_governance_routes(app):
     def governance_pending_requests():
         """List pending policy change requests for the workspace.
 
-        Convenience endpoint for the approval UI.
+        Convenience endpoint for the approval UI. Pages by keyset rather
+        than offset: pass the returned next_cursor back as ``cursor`` to
+        fetch the next page (next_cursor is null on the last page).
 
         Query params:
             agent_id (int, optional): Filter by agent.
-            limit (int, optional): Max results (default 50).
+            limit (int, optional): Max results (default 50, capped at 200).
+            cursor (str, optional): next_cursor from the previous page.
         """
         user_id = session.get('user_id')
         if not user_id:
@@ -119,20 +123,57 @@ def register_governance_routes(app):
         limit = request.args.get('limit', 50, type=int)
         limit = min(max(limit, 1), 200)
 
-        from core.governance.requests import get_requests
+        from core.governance.requests import (
+            get_requests, parse_request_cursor, request_cursor,
+        )
+
+        before = None
+        cursor = request.args.get('cursor')
+        if cursor:
+            before = parse_request_cursor(cursor)
+            if before is None:
+                return jsonify({'error': 'Invalid cursor'}), 400
 
+        # One extra row tells us whether another page exists.
         results = get_requests(
             workspace_id=user_id,
             status='pending',
             agent_id=agent_id_filter,
-            limit=limit,
+            limit=limit + 1,
+            before=before,
+        )
+        page = results[:limit]
+        next_cursor = (
+            request_cursor(page[-1]) if len(results) > limit else None
         )
 
         return jsonify({
-            'requests': [r.to_dict() for r in results],
-            'count': len(results),
+            'requests': [r.to_dict() for r in page],
+            'count': len(page),
+            'next_cursor': next_cursor,
         })
 
+    @app.route('/api/governance/pending/count', methods=['GET'])
+    def governance_pending_count():
+        """Count pending policy change requests for the workspace.
+
+        Polled by the approval UI's badge; runs a COUNT(*) instead of
+        loading the pending list. The response is privately cacheable for
+        a few seconds and carries an ETag, so repeat polls with
+        If-None-Match get an empty 304 while the count is unchanged.
+        """
+        user_id = session.get('user_id')
+        if not user_id:
+            return jsonify({'error': 'Authentication required'}), 401
+
+        from core.governance.requests import count_pending_requests
+
+        resp = jsonify({'count': count_pending_requests(user_id)})
+        resp.cache_control.private = True
+        resp.cache_control.max_age = 3
+        resp.add_etag()
+        return resp.make_conditional(request)
+
     # ------------------------------------------------------------------
     # Phase 2: Approval / Denial
     # ------------------------------------------------------------------
@@ -160,6 +201,9 @@ def register_governance_routes(app):
         delegation_params = data.get('delegation_params')
 
         from core.governance.approvals import approve_request
+        from core.governance.errors import (
+            ERR_BOUNDARY_VIOLATION, ERR_REQUEST_NOT_PENDING,
+        )
 
         result, error = approve_request(
             request_id=request_id,
@@ -170,8 +214,14 @@ def register_governance_routes(app):
         )
 
         if error:
-            # Distinguish boundary violations (403) from other errors (400)
-            status_code = 403 if 'Boundary violation' in error else 400
+            # Distinguish boundary violations (403) and a lost review race
+            # (409) from other errors (400)
+            if error.startswith(ERR_BOUNDARY_VIOLATION):
+                status_code = 403
+            elif error.startswith(ERR_REQUEST_NOT_PENDING):
+                status_code = 409
+            else:
+                status_code = 400
             return jsonify({'error': error}), status_code
 
         return jsonify({'success': True, **result})
@@ -191,6 +241,7 @@ def register_governance_routes(app):
         reason = data.get('reason')
 
         from core.governance.approvals import deny_request
+        from core.governance.errors import ERR_REQUEST_NOT_PENDING
 
         result, error = deny_request(
             request_id=request_id,
@@ -200,7 +251,9 @@ def register_governance_routes(app):
         )
 
         if error:
-            return jsonify({'error': error}), 400
+            # A lost review race (409) is distinct from bad input (400)
+            status_code = 409 if error.startswith(ERR_REQUEST_NOT_PENDING) else 400
+            return jsonify({'error': error}), status_code
 
         return jsonify({'success': True, **result})
 
@@ -237,6 +290,7 @@ def register_governance_routes(app):
             return jsonify({'error': 'requested_change is required'}), 400
 
         from core.governance.delegation import apply_delegated_change
+        from core.governance.errors import DELEGATION_VIOLATIONS
 
         result, error = apply_delegated_change(
             grant_id=grant_id,
@@ -246,7 +300,7 @@ def register_governance_routes(app):
         )
 
         if error:
-            status_code = 403 if 'violation' in error.lower() else 400
+            status_code = 403 if error.startswith(DELEGATION_VIOLATIONS) else 400
             return jsonify({'error': error}), status_code
 
         return jsonify({'success': True, **result})
@@ -344,6 +398,7 @@ def register_governance_routes(app):
             return jsonify({'error': 'Authentication required'}), 401
 
         from core.governance.rollback import rollback_change
+        from core.governance.errors import ERR_ROLLBACK_BLOCKED
 
         result, error = rollback_change(
             audit_entry_id=audit_id,
@@ -352,7 +407,7 @@ def register_governance_routes(app):
         )
 
         if error:
-            status_code = 403 if 'boundary' in error.lower() else 400
+            status_code = 403 if error.startswith(ERR_ROLLBACK_BLOCKED) else 400
             return jsonify({'error': error}), status_code
 
         return jsonify({'success': True, **result})
@@ -364,7 +419,7 @@ def register_governance_routes(app):
         Query params:
             event_type (str, optional): Filter by event type.
             agent_id (int, optional): Filter by agent.
-            limit (int, optional): Max results (default 100).
+            limit (int, optional): Max results (default 100, capped at 500).
         """
         user_id = session.get('user_id')
         if not user_id:
@@ -94,9 +94,12 @@ def ingest_events():
 
     from core.observability import emit_event_batch, VALID_EVENT_TYPES
 
-    # Validate before writing
+    # Validate before writing. Nothing is written until the whole batch is
+    # validated, so an agent's allow/deny verdict is the same for every
+    # event in it; check each distinct agent_id once.
     validated = []
     rejected = []
+    agent_verdicts = {}
     for i, ev in enumerate(events_list):
         if not isinstance(ev, dict):
             rejected.append({'index': i, 'reason': 'event must be an object'})
@@ -108,7 +111,9 @@ def ingest_events():
         # Tier-enforced agent limit
         agent_id = ev.get('agent_id')
         if agent_id is not None:
-            ok, msg = check_agent_allowed(user_id, agent_id)
+            if agent_id not in agent_verdicts:
+                agent_verdicts[agent_id] = check_agent_allowed(user_id, agent_id)
+            ok, msg = agent_verdicts[agent_id]
             if not ok:
                 rejected.append({'index': i, 'reason': msg})
                 continue
@@ -958,8 +963,7 @@ def billing_webhook():
             for key, value in defaults.items():
                 setattr(existing, key, value)
         else:
-            tier = WorkspaceTier(workspace_id=workspace_id, tier_name=tier_name, **defaults)
-            db.session.add(tier)
+            WorkspaceTier.create_for_workspace(workspace_id, tier_name)
 
         db.session.commit()
         invalidate_tier_cache(workspace_id)
@@ -980,8 +984,7 @@ def billing_webhook():
             for key, value in free_defaults.items():
                 setattr(existing, key, value)
         else:
-            tier = WorkspaceTier(workspace_id=workspace_id, tier_name='free', **free_defaults)
-            db.session.add(tier)
+            WorkspaceTier.create_for_workspace(workspace_id, 'free')
 
         db.session.commit()
         invalidate_tier_cache(workspace_id)
@@ -4,7 +4,6 @@ Pytest configuration and shared fixtures for OpenClaw Dashboard tests
 import pytest
 import os
 import sys
-import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,52 +18,115 @@ os.environ['TESTING'] = 'true'
 @pytest.fixture(scope='session')
 def app():
     """Create and configure a test Flask application instance"""
-    from server import app as flask_app
-    from models import db
-    from rate_limiter import limiter
-
-    # Create a temporary database for testing
-    db_fd, db_path = tempfile.mkstemp(suffix='.db')
-
-    # Configure app for testing
-    flask_app.config.update({
-        'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
-        'SQLALCHEMY_TRACK_MODIFICATIONS': False,
-        'SECRET_KEY': 'test-secret-key',
-        'WTF_CSRF_ENABLED': False,
-        'STRIPE_SECRET_KEY': 'sk_test_fake_key',
-        'STRIPE_WEBHOOK_SECRET': 'whsec_test_fake_secret',
-        'SENDGRID_API_KEY': 'test_sendgrid_key',
-    })
-
-    # Disable rate limiting for tests (must be done after init_limiter ran)
-    limiter.enabled = False
-
-    # Create tables inside a persistent app context
-    with flask_app.app_context():
-        db.create_all()
-        yield flask_app
-        db.session.remove()
-        db.drop_all()
-
-    # Close and remove temporary database
-    os.close(db_fd)
-    os.unlink(db_path)
+    # Use an in-memory database. Flask-SQLAlchemy serves ``sqlite://`` from
+    # a StaticPool, so every session shares one connection and commits never
+    # touch disk; each pytest-xdist worker process gets its own database.
+    # The URL must be set before server is imported because the engine is
+    # created at init_app time. The MonkeyPatch context restores the previous
+    # value when the test session ends.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('DATABASE_URL', 'sqlite://')
+
+        from server import app as flask_app
+        from models import db
+        from rate_limiter import limiter
+
+        # Configure app for testing
+        flask_app.config.update({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+            'SECRET_KEY': 'test-secret-key',
+            'WTF_CSRF_ENABLED': False,
+            'STRIPE_SECRET_KEY': 'sk_test_fake_key',
+            'STRIPE_WEBHOOK_SECRET': 'whsec_test_fake_secret',
+            'SENDGRID_API_KEY': 'test_sendgrid_key',
+        })
+
+        # Disable rate limiting for tests (must be done after init_limiter ran)
+        limiter.enabled = False
+
+        # Create tables inside a persistent app context
+        with flask_app.app_context():
+            _enable_sqlite_savepoints(db.engine)
+            db.create_all()
+            yield flask_app
+            db.session.remove()
+            db.drop_all()
+
+
+def _enable_sqlite_savepoints(engine):
+    """Let pysqlite honour SAVEPOINTs inside an outer transaction.
+
+    The sqlite3 driver only emits BEGIN lazily before DML, so a SAVEPOINT
+    issued first would start (and its RELEASE would commit) the real
+    transaction. Turning off the driver's transaction handling and emitting
+    BEGIN ourselves keeps nested transactions nested.
+    """
+    from sqlalchemy import event
+
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+    # Drop connections opened before the listeners were attached
+    engine.dispose()
 
 
 @pytest.fixture(autouse=True)
-def _clean_db(app):
-    """Clean up data between tests to avoid UNIQUE constraint violations."""
+def _fresh_session(app):
+    """Start and end every test with a fresh session.
+
+    Data isolation itself comes from db_transaction, which rolls back
+    everything the test wrote.
+    """
     from models import db
     # Remove stale session from previous test entirely
     db.session.remove()
     yield
     db.session.remove()
-    # Use a fresh session to clean all tables
-    for table in reversed(db.metadata.sorted_tables):
-        db.session.execute(table.delete())
-    db.session.commit()
+
+
+@pytest.fixture(autouse=True)
+def db_transaction(app):
+    """Run every test inside a connection-level transaction that is rolled back.
+
+    The session joins the outer transaction through SAVEPOINTs (the
+    SQLAlchemy 2 form of the "join a session into an external transaction"
+    recipe), so code under test can commit() and rollback() normally while
+    nothing outlives the test. Teardown is a single ROLLBACK instead of a
+    DELETE per table.
+    """
+    from models import db
+
+    engines = db.engines
+    engine = engines[None]
+    factory_kw = db.session.session_factory.kw
+    previous_mode = factory_kw.get('join_transaction_mode')
+
+    connection = engine.connect()
+    outer = connection.begin()
+    db.session.remove()
+    factory_kw['join_transaction_mode'] = 'create_savepoint'
+    engines[None] = connection
+    try:
+        yield connection
+    finally:
+        db.session.remove()
+        engines[None] = engine
+        if previous_mode is None:
+            factory_kw.pop('join_transaction_mode', None)
+        else:
+            factory_kw['join_transaction_mode'] = previous_mode
+        outer.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope='function')
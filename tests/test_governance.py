@@ -4,13 +4,105 @@ Tests for the Human-Approved Policy Delegation System — Phase 1.
 Covers: models (schema/CRUD), request creation, workspace isolation,
 agent ownership, cooldown, listing/filtering, expiration, audit logging.
 """
+import ast
+import functools
+import types
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+from sqlalchemy import delete, event, inspect, select, update
 from models import (
     db, User, Agent, RiskPolicy, WorkspaceTier,
     PolicyChangeRequest, DelegationGrant, GovernanceAuditLog,
 )
+from core.governance.errors import (
+    ERR_BOUNDARY_VIOLATION,
+    ERR_ROLLBACK_BLOCKED,
+    ERR_ENVELOPE_VIOLATION,
+    ERR_WORKSPACE_BOUNDARY_VIOLATION,
+    ERR_GRANT_WRONG_AGENT,
+    ERR_GRANT_INACTIVE,
+    ERR_GRANT_NOT_YET_VALID,
+    ERR_GRANT_EXPIRED,
+    ERR_GRANT_ALREADY_INACTIVE,
+    ERR_REQUEST_NOT_PENDING,
+)
+from core.governance.delegation import (
+    apply_delegated_change,
+    expire_grants,
+    get_active_grants,
+    revoke_grant,
+)
+from core.governance.approvals import approve_request, deny_request
+from core.governance.boundaries import (
+    get_workspace_boundaries,
+    validate_against_boundaries,
+)
+from core.governance.governance_audit import (
+    get_governance_trail,
+    log_governance_event,
+    verify_chain,
+)
+from core.governance.requests import (
+    MUTABLE_FIELDS,
+    REQUEST_COOLDOWN_MINUTES,
+    create_request,
+    expire_stale_requests,
+    get_request,
+    get_requests,
+)
+from core.governance.rollback import rollback_change
+import core.governance as gov
+from core.governance import (
+    approvals as app_mod,
+    delegation as del_mod,
+    governance_audit as audit_mod,
+    requests as req_mod,
+    rollback as rb_mod,
+)
+from core.observability.tier_enforcement import invalidate_tier_cache
+
+pytestmark = pytest.mark.governance
+
+# Policy amounts as stored (Numeric(12, 4)). Decimal is immutable, so the
+# tests share one instance per value.
+_D5 = Decimal('5.0000')
+_D10 = Decimal('10.0000')
+_D14 = Decimal('14.0000')
+_D15 = Decimal('15.0000')
+_D20 = Decimal('20.0000')
+
+
+@functools.lru_cache(maxsize=None)
+def _imported_modules(path):
+    """Dotted names of every module imported by the source file at path.
+
+    ``from a.b import c`` yields both ``a.b`` and ``a.b.c`` since ``c`` may
+    be a submodule. Parsed once per file per test session. The source is
+    read rather than the module namespace inspected because the governance
+    modules import their dependencies inside functions, where a namespace
+    check cannot see them.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+            names.update(f'{node.module}.{alias.name}' for alias in node.names)
+    return frozenset(names)
+
+
+def _imports_package(path, package):
+    """True if the file at path imports package or anything below it."""
+    return any(
+        name == package or name.startswith(package + '.')
+        for name in _imported_modules(path)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -24,7 +116,7 @@ def risk_policy(app, user, agent):
         workspace_id=user.id,
         agent_id=agent.id,
         policy_type='daily_spend_cap',
-        threshold_value=Decimal('10.0000'),
+        threshold_value=_D10,
         action_type='pause_agent',
         cooldown_minutes=360,
         is_enabled=True,
@@ -63,11 +155,52 @@ def other_agent(app, other_user):
     return a
 
 
+@pytest.fixture
+def alt_agent_id(app, user):
+    """Insert a second agent in user's workspace and return its id.
+
+    Only the id is ever needed (to show a grant is bound to its agent), so
+    the row goes in via a Core insert rather than a mapped Agent.
+    """
+    return db.session.execute(
+        Agent.__table__.insert().values(
+            user_id=user.id,
+            name='Agent2',
+            is_active=True,
+            created_at=datetime.utcnow(),
+        )
+    ).inserted_primary_key[0]
+
+
+@pytest.fixture
+def pro_tier(app, user):
+    """Put user's workspace on the pro tier; returns a tier-switching callable.
+
+    Switching flips ``tier_name`` with a single UPDATE and drops the cached
+    tier for the workspace. The cache entry is dropped again on teardown so
+    the rolled-back tier does not leak into later tests.
+    """
+
+    WorkspaceTier.create_for_workspace(user.id, 'pro')
+    db.session.flush()
+    invalidate_tier_cache(user.id)
+
+    def set_tier(tier_name):
+        db.session.execute(
+            update(WorkspaceTier)
+            .where(WorkspaceTier.workspace_id == user.id)
+            .values(tier_name=tier_name)
+        )
+        invalidate_tier_cache(user.id)
+
+    yield set_tier
+    invalidate_tier_cache(user.id)
+
+
 # ---------------------------------------------------------------------------
 # PolicyChangeRequest Model Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPolicyChangeRequestModel:
 
     def test_create_request(self, app, user, agent, risk_policy):
@@ -149,19 +282,17 @@ class TestPolicyChangeRequestModel:
 # DelegationGrant Model Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestDelegationGrantModel:
 
-    def test_create_grant(self, app, user, agent):
-        now = datetime.utcnow()
+    def test_create_grant(self, app, user, agent, clock):
         grant = DelegationGrant(
             workspace_id=user.id,
             agent_id=agent.id,
             granted_by=user.id,
             allowed_changes={'policy_id': 1, 'fields': {}},
             duration_minutes=120,
-            valid_from=now,
-            valid_to=now + timedelta(minutes=120),
+            valid_from=clock.now,
+            valid_to=clock.now + timedelta(minutes=120),
             active=True,
         )
         db.session.add(grant)
@@ -171,17 +302,16 @@ class TestDelegationGrantModel:
         assert grant.active is True
         assert grant.revoked_at is None
 
-    def test_to_dict(self, app, user, agent):
-        now = datetime.utcnow()
+    def test_to_dict(self, app, user, agent, clock):
         grant = DelegationGrant(
             workspace_id=user.id,
             agent_id=agent.id,
             granted_by=user.id,
             allowed_changes={},
-            max_spend_delta=Decimal('5.0000'),
+            max_spend_delta=_D5,
             duration_minutes=60,
-            valid_from=now,
-            valid_to=now + timedelta(minutes=60),
+            valid_from=clock.now,
+            valid_to=clock.now + timedelta(minutes=60),
         )
         db.session.add(grant)
         db.session.commit()
@@ -196,7 +326,6 @@ class TestDelegationGrantModel:
 # GovernanceAuditLog Model Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGovernanceAuditLogModel:
 
     def test_create_log_entry(self, app, user, agent):
@@ -233,10 +362,9 @@ class TestGovernanceAuditLogModel:
 # Governance Module Exports
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGovernanceModuleExports:
 
-    def test_module_imports(self, app):
+    def test_module_imports(self):
         from core.governance import (
             create_request, get_requests, get_request,
             expire_stale_requests,
@@ -254,12 +382,9 @@ class TestGovernanceModuleExports:
 # Request Creation Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestCreateRequest:
 
     def test_successful_request(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, error = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -281,8 +406,6 @@ class TestCreateRequest:
         assert pcr.expires_at is not None
 
     def test_auto_fills_current_value(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -297,8 +420,6 @@ class TestCreateRequest:
         assert pcr.requested_changes['current_value'] == '10.0000'
 
     def test_preserves_provided_current_value(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -315,8 +436,6 @@ class TestCreateRequest:
 
     def test_agent_not_in_workspace(self, app, user, agent, risk_policy,
                                     other_user, other_agent):
-        from core.governance.requests import create_request
-
         # other_agent belongs to other_user, not user
         pcr, error = create_request(
             workspace_id=user.id,
@@ -334,14 +453,12 @@ class TestCreateRequest:
 
     def test_policy_not_in_workspace(self, app, user, agent, risk_policy,
                                      other_user, other_agent):
-        from core.governance.requests import create_request
-
         # Create a policy in other_user's workspace
         other_policy = RiskPolicy(
             workspace_id=other_user.id,
             agent_id=other_agent.id,
             policy_type='daily_spend_cap',
-            threshold_value=Decimal('20.0000'),
+            threshold_value=_D20,
             action_type='alert_only',
         )
         db.session.add(other_policy)
@@ -362,8 +479,6 @@ class TestCreateRequest:
         assert 'Policy not found' in error
 
     def test_immutable_field_rejected(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, error = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -379,8 +494,6 @@ class TestCreateRequest:
         assert 'not mutable' in error
 
     def test_workspace_id_field_rejected(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, error = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -396,8 +509,6 @@ class TestCreateRequest:
         assert 'not mutable' in error
 
     def test_missing_policy_id(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, error = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -412,8 +523,6 @@ class TestCreateRequest:
         assert 'policy_id is required' in error
 
     def test_invalid_requested_changes_type(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, error = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -425,8 +534,6 @@ class TestCreateRequest:
         assert 'must be a dict' in error
 
     def test_creates_audit_entry(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -448,7 +555,6 @@ class TestCreateRequest:
 
     def test_no_immediate_policy_mutation(self, app, user, agent, risk_policy):
         """Critical: submitting a request must NOT change the policy."""
-        from core.governance.requests import create_request
 
         original_threshold = risk_policy.threshold_value
 
@@ -464,7 +570,7 @@ class TestCreateRequest:
         )
 
         # Refresh from DB
-        db.session.refresh(risk_policy)
+        db.session.expire(risk_policy, ['threshold_value'])
         assert risk_policy.threshold_value == original_threshold
 
 
@@ -472,12 +578,9 @@ class TestCreateRequest:
 # Request Cooldown Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestRequestCooldown:
 
     def test_cooldown_blocks_rapid_requests(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
         # First request succeeds
         pcr1, err1 = create_request(
             workspace_id=user.id,
@@ -507,14 +610,13 @@ class TestRequestCooldown:
 
     def test_cooldown_allows_different_policies(self, app, user, agent, risk_policy):
         """Cooldown is per-policy, not per-workspace."""
-        from core.governance.requests import create_request
 
         # Create a second policy
         policy2 = RiskPolicy(
             workspace_id=user.id,
             agent_id=agent.id,
             policy_type='error_rate_cap',
-            threshold_value=Decimal('5.0000'),
+            threshold_value=_D5,
             action_type='alert_only',
         )
         db.session.add(policy2)
@@ -548,7 +650,6 @@ class TestRequestCooldown:
 
     def test_cooldown_allows_after_expiry(self, app, user, agent, risk_policy):
         """Requests allowed after cooldown period passes."""
-        from core.governance.requests import create_request, REQUEST_COOLDOWN_MINUTES
 
         # Create a request with a past timestamp
         old_request = PolicyChangeRequest(
@@ -588,12 +689,9 @@ class TestRequestCooldown:
 # Request Listing / Filtering Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGetRequests:
 
     def test_list_all_for_workspace(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request, get_requests
-
         create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -610,8 +708,6 @@ class TestGetRequests:
         assert results[0].workspace_id == user.id
 
     def test_filter_by_status(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request, get_requests
-
         create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -630,8 +726,6 @@ class TestGetRequests:
         assert len(denied) == 0
 
     def test_filter_by_agent(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request, get_requests
-
         create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -649,10 +743,47 @@ class TestGetRequests:
         results = get_requests(workspace_id=user.id, agent_id=9999)
         assert len(results) == 0
 
+    def test_before_keyset(self, app, user, agent, risk_policy):
+        create_request(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': 'threshold_value',
+                'requested_value': '15.0000',
+            },
+            reason='test',
+        )
+        (pcr,) = get_requests(workspace_id=user.id)
+
+        assert get_requests(
+            workspace_id=user.id, before=(pcr.requested_at, pcr.id + 1),
+        ) == [pcr]
+        assert get_requests(
+            workspace_id=user.id, before=(pcr.requested_at, pcr.id),
+        ) == []
+
+    def test_request_cursor_round_trip(self, app, user, agent, risk_policy):
+        pcr, _ = create_request(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': 'threshold_value',
+                'requested_value': '15.0000',
+            },
+            reason='test',
+        )
+
+        cursor = req_mod.request_cursor(pcr)
+        assert req_mod.parse_request_cursor(cursor) == (
+            pcr.requested_at, pcr.id,
+        )
+        assert req_mod.parse_request_cursor('garbage') is None
+        assert req_mod.parse_request_cursor('2026-01-01_x') is None
+
     def test_workspace_isolation(self, app, user, agent, risk_policy,
                                  other_user, other_agent):
-        from core.governance.requests import create_request, get_requests
-
         create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -669,8 +800,6 @@ class TestGetRequests:
         assert len(results) == 0
 
     def test_get_single_request(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request, get_request
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -688,8 +817,6 @@ class TestGetRequests:
 
     def test_get_request_wrong_workspace(self, app, user, agent, risk_policy,
                                          other_user):
-        from core.governance.requests import create_request, get_request
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -705,8 +832,6 @@ class TestGetRequests:
         assert found is None
 
     def test_ordered_by_requested_at_desc(self, app, user, agent, risk_policy):
-        from core.governance.requests import get_requests
-
         old = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -736,12 +861,9 @@ class TestGetRequests:
 # Request Expiration Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestExpireStaleRequests:
 
     def test_expires_old_requests(self, app, user, agent, risk_policy):
-        from core.governance.requests import expire_stale_requests
-
         old = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -760,9 +882,41 @@ class TestExpireStaleRequests:
         db.session.refresh(old)
         assert old.status == 'expired'
 
-    def test_does_not_expire_recent(self, app, user, agent, risk_policy):
-        from core.governance.requests import expire_stale_requests
+    def test_expires_in_one_update(self, app, user, agent, risk_policy):
+        stale = [
+            PolicyChangeRequest(
+                workspace_id=user.id, agent_id=agent.id,
+                policy_id=risk_policy.id,
+                requested_changes={'policy_id': risk_policy.id,
+                                   'field': 'threshold_value',
+                                   'requested_value': '15'},
+                reason=f'old {i}', status='pending',
+                requested_at=datetime.utcnow() - timedelta(hours=25),
+                expires_at=datetime.utcnow() - timedelta(hours=1),
+            )
+            for i in range(3)
+        ]
+        db.session.add_all(stale)
+        db.session.commit()
 
+        updates = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.startswith('UPDATE policy_change_requests'):
+                updates.append(statement)
+
+        conn = db.session.connection()
+        event.listen(conn, 'before_cursor_execute', record)
+        try:
+            assert expire_stale_requests() == 3
+        finally:
+            event.remove(conn, 'before_cursor_execute', record)
+
+        assert len(updates) == 1
+        # Instances already in the session see the new status
+        assert [r.status for r in stale] == ['expired'] * 3
+
+    def test_does_not_expire_recent(self, app, user, agent, risk_policy):
         fresh = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -782,8 +936,6 @@ class TestExpireStaleRequests:
         assert fresh.status == 'pending'
 
     def test_does_not_expire_non_pending(self, app, user, agent, risk_policy):
-        from core.governance.requests import expire_stale_requests
-
         denied = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -800,8 +952,6 @@ class TestExpireStaleRequests:
         assert count == 0
 
     def test_fallback_expiry_without_expires_at(self, app, user, agent, risk_policy):
-        from core.governance.requests import expire_stale_requests
-
         no_expiry = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -818,8 +968,6 @@ class TestExpireStaleRequests:
         assert count == 1
 
     def test_expiration_creates_audit_entry(self, app, user, agent, risk_policy):
-        from core.governance.requests import expire_stale_requests
-
         old = PolicyChangeRequest(
             workspace_id=user.id, agent_id=agent.id,
             policy_id=risk_policy.id,
@@ -845,12 +993,9 @@ class TestExpireStaleRequests:
 # Governance Audit Log Helper Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGovernanceAuditHelpers:
 
     def test_log_event(self, app, user, agent):
-        from core.governance.governance_audit import log_governance_event
-
         entry = log_governance_event(
             workspace_id=user.id,
             event_type='request_submitted',
@@ -864,11 +1009,38 @@ class TestGovernanceAuditHelpers:
         assert entry.event_type == 'request_submitted'
         assert entry.workspace_id == user.id
 
-    def test_get_trail_by_workspace(self, app, user, agent, other_user):
-        from core.governance.governance_audit import (
-            log_governance_event, get_governance_trail,
-        )
+    def test_log_event_defers_write_to_caller(self, app, user):
+        """Logging issues no INSERT or flush; the caller's flush writes it.
+
+        The only statement is the chain-head SELECT (once per workspace and
+        transaction)."""
+        workspace_id = user.id  # load the fixture row before recording
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        conn = db.session.connection()
+        event.listen(conn, 'before_cursor_execute', record)
+        try:
+            entry = log_governance_event(
+                workspace_id=workspace_id,
+                event_type='request_submitted',
+                details={'request_id': 1},
+            )
+        finally:
+            event.remove(conn, 'before_cursor_execute', record)
 
+        assert len(statements) == 1
+        assert statements[0].startswith(
+            'SELECT governance_audit_log.row_hash')
+        assert entry in db.session.new
+        assert entry.id is None
+
+        db.session.flush()
+        assert entry.id is not None
+
+    def test_get_trail_by_workspace(self, app, user, agent, other_user):
         log_governance_event(
             workspace_id=user.id,
             event_type='request_submitted',
@@ -884,10 +1056,6 @@ class TestGovernanceAuditHelpers:
         assert len(other_trail) == 0
 
     def test_get_trail_by_event_type(self, app, user, agent):
-        from core.governance.governance_audit import (
-            log_governance_event, get_governance_trail,
-        )
-
         log_governance_event(
             workspace_id=user.id,
             event_type='request_submitted',
@@ -912,10 +1080,6 @@ class TestGovernanceAuditHelpers:
         assert len(expired) == 1
 
     def test_get_trail_by_agent(self, app, user, agent):
-        from core.governance.governance_audit import (
-            log_governance_event, get_governance_trail,
-        )
-
         log_governance_event(
             workspace_id=user.id,
             event_type='request_submitted',
@@ -936,10 +1100,6 @@ class TestGovernanceAuditHelpers:
         assert len(by_agent) == 1
 
     def test_trail_ordered_desc(self, app, user):
-        from core.governance.governance_audit import (
-            log_governance_event, get_governance_trail,
-        )
-
         e1 = GovernanceAuditLog(
             workspace_id=user.id, event_type='first',
             details={}, created_at=datetime.utcnow() - timedelta(hours=2),
@@ -955,11 +1115,25 @@ class TestGovernanceAuditHelpers:
         assert trail[0].event_type == 'second'
         assert trail[1].event_type == 'first'
 
-    def test_trail_limit(self, app, user):
-        from core.governance.governance_audit import (
-            log_governance_event, get_governance_trail,
-        )
+    def test_trail_same_timestamp_newest_id_first(self, app, user):
+        now = datetime.utcnow()
+        entries = [
+            GovernanceAuditLog(
+                workspace_id=user.id, event_type=name,
+                details={}, created_at=now,
+            )
+            for name in ('first', 'second', 'third')
+        ]
+        db.session.add_all(entries)
+        db.session.commit()
 
+        trail = get_governance_trail(workspace_id=user.id)
+        assert [e.event_type for e in trail] == ['third', 'second', 'first']
+        assert get_governance_trail(
+            workspace_id=user.id, limit=1,
+        )[0].event_type == 'third'
+
+    def test_trail_limit(self, app, user):
         for i in range(5):
             log_governance_event(
                 workspace_id=user.id,
@@ -971,12 +1145,171 @@ class TestGovernanceAuditHelpers:
         trail = get_governance_trail(workspace_id=user.id, limit=3)
         assert len(trail) == 3
 
+    def test_trail_memoized_within_transaction(self, app, user):
+        log_governance_event(
+            workspace_id=user.id, event_type='test', details={},
+        )
+        first = get_governance_trail(workspace_id=user.id)
+
+        selects = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+
+        conn = db.session.connection()
+        event.listen(conn, 'before_cursor_execute', record)
+        try:
+            again = get_governance_trail(workspace_id=user.id)
+        finally:
+            event.remove(conn, 'before_cursor_execute', record)
+
+        assert again == first
+        assert selects == []
+
+    def test_core_insert_invalidates_trail_cache(self, app, user):
+        assert get_governance_trail(workspace_id=user.id) == []
+
+        db.session.execute(GovernanceAuditLog.__table__.insert().values(
+            workspace_id=user.id, event_type='test', details={},
+            created_at=datetime.utcnow(),
+        ))
+        assert len(get_governance_trail(workspace_id=user.id)) == 1
+
+    def test_bulk_update_invalidates_trail_cache(self, app, user):
+        log_governance_event(
+            workspace_id=user.id, event_type='test', details={},
+        )
+        db.session.commit()
+        assert get_governance_trail(
+            workspace_id=user.id, event_type='renamed') == []
+
+        db.session.execute(
+            update(GovernanceAuditLog)
+            .where(GovernanceAuditLog.workspace_id == user.id)
+            .values(event_type='renamed'),
+        )
+        assert len(get_governance_trail(
+            workspace_id=user.id, event_type='renamed')) == 1
+
+    def test_flushed_entry_invalidates_trail_cache(self, app, user):
+        assert get_governance_trail(workspace_id=user.id) == []
+
+        db.session.add(GovernanceAuditLog(
+            workspace_id=user.id, event_type='test', details={},
+            created_at=datetime.utcnow(),
+        ))
+        db.session.flush()
+        assert len(get_governance_trail(workspace_id=user.id)) == 1
+
+    def test_trail_listeners_scoped_to_app_session(self, app):
+        from sqlalchemy.orm import Session
+        from core.governance import governance_audit as audit
+
+        for name, fn in (
+            ('before_flush', audit._drop_trail_memo_on_flush),
+            ('do_orm_execute', audit._drop_trail_memo_on_write),
+        ):
+            assert event.contains(db.session, name, fn)
+            assert not event.contains(Session, name, fn)
+
+    def test_log_event_invalidates_trail_cache(self, app, user):
+        assert get_governance_trail(workspace_id=user.id) == []
+
+        log_governance_event(
+            workspace_id=user.id, event_type='test', details={},
+        )
+        assert len(get_governance_trail(workspace_id=user.id)) == 1
+
+    def test_trail_cache_keyed_by_filters(self, app, user, agent):
+        log_governance_event(
+            workspace_id=user.id, event_type='request_submitted',
+            details={}, agent_id=agent.id,
+        )
+        assert len(get_governance_trail(workspace_id=user.id)) == 1
+        assert get_governance_trail(
+            workspace_id=user.id, event_type='request_expired',
+        ) == []
+        assert len(get_governance_trail(
+            workspace_id=user.id, agent_id=agent.id,
+        )) == 1
+
+
+class TestGovernanceAuditChain:
+
+    def _log(self, user, n):
+        return [
+            log_governance_event(
+                workspace_id=user.id, event_type='request_submitted',
+                details={'request_id': i},
+            )
+            for i in range(n)
+        ]
+
+    def test_entries_chain_within_transaction(self, app, user):
+        first, second = self._log(user, 2)
+
+        assert first.prev_hash == ''
+        assert len(first.row_hash) == 64
+        assert second.prev_hash == first.row_hash
+
+    def test_entries_chain_across_transactions(self, app, user):
+        [first] = self._log(user, 1)
+        db.session.commit()
+        [second] = self._log(user, 1)
+
+        assert second.prev_hash == first.row_hash
+
+    def test_chains_are_per_workspace(self, app, user, other_user):
+        self._log(user, 1)
+        other = log_governance_event(
+            workspace_id=other_user.id, event_type='request_submitted',
+            details={},
+        )
+
+        assert other.prev_hash == ''
+
+    def test_verify_intact_chain(self, app, user):
+        self._log(user, 3)
+        db.session.commit()
+
+        assert verify_chain(user.id) == (True, None)
+
+    def test_verify_detects_edited_entry(self, app, user):
+        _, middle, _ = self._log(user, 3)
+        db.session.commit()
+
+        db.session.execute(
+            update(GovernanceAuditLog)
+            .where(GovernanceAuditLog.id == middle.id)
+            .values(details={'request_id': 99})
+        )
+        db.session.expire_all()
+
+        valid, error = verify_chain(user.id)
+        assert valid is False
+        assert str(middle.id) in error
+
+    def test_verify_detects_deleted_entry(self, app, user):
+        _, middle, last = self._log(user, 3)
+        db.session.commit()
+        last_id = last.id
+
+        db.session.execute(
+            delete(GovernanceAuditLog)
+            .where(GovernanceAuditLog.id == middle.id)
+        )
+        db.session.expire_all()
+
+        valid, error = verify_chain(user.id)
+        assert valid is False
+        assert str(last_id) in error
+
 
 # ---------------------------------------------------------------------------
 # Route Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGovernanceSubmitRoute:
 
     def test_unauthenticated_rejected(self, client, app):
@@ -987,8 +1320,7 @@ class TestGovernanceSubmitRoute:
         })
         assert resp.status_code == 401
 
-    def test_missing_body(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_missing_body(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -996,8 +1328,7 @@ class TestGovernanceSubmitRoute:
                            content_type='application/json')
         assert resp.status_code == 400
 
-    def test_missing_agent_id(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_missing_agent_id(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1012,8 +1343,7 @@ class TestGovernanceSubmitRoute:
         assert resp.status_code == 400
         assert 'agent_id' in resp.get_json()['error']
 
-    def test_missing_reason(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_missing_reason(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1028,8 +1358,7 @@ class TestGovernanceSubmitRoute:
         })
         assert resp.status_code == 400
 
-    def test_successful_submit(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_successful_submit(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1048,8 +1377,8 @@ class TestGovernanceSubmitRoute:
         assert data['request']['status'] == 'pending'
         assert data['request']['policy_id'] == risk_policy.id
 
-    def test_validation_error_returns_400(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_validation_error_returns_400(self, client, user, agent,
+                                          risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1066,15 +1395,13 @@ class TestGovernanceSubmitRoute:
         assert 'not mutable' in resp.get_json()['error']
 
 
-@pytest.mark.governance
 class TestGovernanceListRoute:
 
     def test_unauthenticated_rejected(self, client, app):
         resp = client.get('/api/governance/requests')
         assert resp.status_code == 401
 
-    def test_list_empty(self, app, user):
-        client = app.test_client()
+    def test_list_empty(self, client, user):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1084,8 +1411,28 @@ class TestGovernanceListRoute:
         assert data['requests'] == []
         assert data['count'] == 0
 
-    def test_list_with_results(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    @pytest.mark.parametrize('raw, expected', [
+        ('1000000', 200), ('0', 1), ('-5', 1), ('abc', 50),
+    ])
+    def test_limit_clamped(self, client, user, monkeypatch, raw, expected):
+        """The route bounds limit to 1..200 whatever the client sends."""
+        limits = []
+
+        def fake_get_requests(**kwargs):
+            limits.append(kwargs['limit'])
+            return []
+
+        monkeypatch.setattr(
+            'core.governance.requests.get_requests', fake_get_requests,
+        )
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+
+        resp = client.get(f'/api/governance/requests?limit={raw}')
+        assert resp.status_code == 200
+        assert limits == [expected]
+
+    def test_list_with_results(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1106,8 +1453,7 @@ class TestGovernanceListRoute:
         assert data['count'] == 1
         assert data['requests'][0]['status'] == 'pending'
 
-    def test_filter_by_status(self, app, user, agent, risk_policy):
-        client = app.test_client()
+    def test_filter_by_status(self, client, user, agent, risk_policy):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1127,10 +1473,8 @@ class TestGovernanceListRoute:
         resp = client.get('/api/governance/requests?status=denied')
         assert resp.get_json()['count'] == 0
 
-    def test_workspace_isolation(self, app, user, agent, risk_policy,
+    def test_workspace_isolation(self, client, user, agent, risk_policy,
                                  other_user):
-        client = app.test_client()
-
         # Submit as user
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
@@ -1155,13 +1499,11 @@ class TestGovernanceListRoute:
 # Safety: No Silent Mutation
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestSafetyNoSilentMutation:
 
     def test_request_does_not_mutate_policy_via_module(self, app, user, agent,
                                                        risk_policy):
         """The governance request module never writes to risk_policies."""
-        from core.governance.requests import create_request
 
         original = risk_policy.to_dict()
 
@@ -1179,12 +1521,11 @@ class TestSafetyNoSilentMutation:
         db.session.refresh(risk_policy)
         assert risk_policy.to_dict() == original
 
-    def test_request_does_not_mutate_policy_via_route(self, app, user, agent,
-                                                      risk_policy):
+    def test_request_does_not_mutate_policy_via_route(self, client, user,
+                                                      agent, risk_policy):
         """The governance route never writes to risk_policies."""
         original = risk_policy.to_dict()
 
-        client = app.test_client()
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1203,7 +1544,6 @@ class TestSafetyNoSilentMutation:
 
     def test_policy_snapshot_captured(self, app, user, agent, risk_policy):
         """Request stores a snapshot of the policy at submission time."""
-        from core.governance.requests import create_request
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -1225,7 +1565,6 @@ class TestSafetyNoSilentMutation:
 # Backwards Compatibility: Existing Risk Engine Tests Unaffected
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestBackwardsCompatibility:
 
     def test_risk_policy_model_unchanged(self, app, user, agent):
@@ -1234,7 +1573,7 @@ class TestBackwardsCompatibility:
             workspace_id=user.id,
             agent_id=agent.id,
             policy_type='daily_spend_cap',
-            threshold_value=Decimal('10.0000'),
+            threshold_value=_D10,
             action_type='pause_agent',
         )
         db.session.add(policy)
@@ -1255,16 +1594,14 @@ class TestBackwardsCompatibility:
         assert callable(evaluate_policies)
         assert callable(execute_pending_events)
 
-    def test_governance_does_not_import_risk_engine_internals(self, app):
+    def test_governance_does_not_import_risk_engine_internals(self):
         """Governance module does not import risk engine internals."""
-        import core.governance.requests as req_mod
-        import core.governance.governance_audit as audit_mod
 
         # These modules should not import evaluator/interventions
         for mod in [req_mod, audit_mod]:
-            source = open(mod.__file__).read()
-            assert 'from core.risk_engine.evaluator' not in source
-            assert 'from core.risk_engine.interventions' not in source
+            for internal in ('core.risk_engine.evaluator',
+                             'core.risk_engine.interventions'):
+                assert not _imports_package(mod.__file__, internal)
 
 
 # ===================================================================
@@ -1278,7 +1615,6 @@ class TestBackwardsCompatibility:
 @pytest.fixture
 def pending_request(app, user, agent, risk_policy):
     """Create a pending policy change request."""
-    from core.governance.requests import create_request
 
     pcr, _ = create_request(
         workspace_id=user.id,
@@ -1298,12 +1634,9 @@ def pending_request(app, user, agent, risk_policy):
 # Boundary Validation Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestBoundaryValidation:
 
     def test_threshold_within_boundary(self, app, user, agent, risk_policy):
-        from core.governance.boundaries import validate_against_boundaries
-
         # Free tier cap is $50 — requesting $15 should pass
         valid, error = validate_against_boundaries(
             user.id, risk_policy.id, 'threshold_value', '15.0000',
@@ -1312,8 +1645,6 @@ class TestBoundaryValidation:
         assert error is None
 
     def test_threshold_exceeds_boundary(self, app, user, agent, risk_policy):
-        from core.governance.boundaries import validate_against_boundaries
-
         # Free tier cap is $50 — requesting $100 should fail
         valid, error = validate_against_boundaries(
             user.id, risk_policy.id, 'threshold_value', '100.0000',
@@ -1323,25 +1654,35 @@ class TestBoundaryValidation:
         assert 'free' in error
 
     def test_negative_threshold_rejected(self, app, user, agent, risk_policy):
-        from core.governance.boundaries import validate_against_boundaries
-
         valid, error = validate_against_boundaries(
             user.id, risk_policy.id, 'threshold_value', '-5.0000',
         )
         assert valid is False
         assert 'negative' in error
 
-    def test_cooldown_above_minimum(self, app, user, agent, risk_policy):
-        from core.governance.boundaries import validate_against_boundaries
+    @pytest.mark.parametrize('value', ['NaN', 'sNaN', 'Infinity'])
+    def test_non_finite_threshold_rejected(self, app, user, risk_policy,
+                                           value):
+        valid, error = validate_against_boundaries(
+            user.id, risk_policy.id, 'threshold_value', value,
+        )
+        assert valid is False
+        assert 'Invalid threshold value' in error
+
+    def test_decimal_threshold_accepted(self, app, user, risk_policy):
+        valid, error = validate_against_boundaries(
+            user.id, risk_policy.id, 'threshold_value', _D15,
+        )
+        assert valid is True
+        assert error is None
 
+    def test_cooldown_above_minimum(self, app, user, agent, risk_policy):
         valid, error = validate_against_boundaries(
             user.id, risk_policy.id, 'cooldown_minutes', '60',
         )
         assert valid is True
 
     def test_cooldown_below_minimum(self, app, user, agent, risk_policy):
-        from core.governance.boundaries import validate_against_boundaries
-
         valid, error = validate_against_boundaries(
             user.id, risk_policy.id, 'cooldown_minutes', '10',
         )
@@ -1350,12 +1691,11 @@ class TestBoundaryValidation:
 
     def test_action_type_escalation_allowed(self, app, user, agent):
         """Can escalate from alert_only to pause_agent."""
-        from core.governance.boundaries import validate_against_boundaries
 
         policy = RiskPolicy(
             workspace_id=user.id, agent_id=agent.id,
             policy_type='daily_spend_cap',
-            threshold_value=Decimal('10.0000'),
+            threshold_value=_D10,
             action_type='alert_only',
         )
         db.session.add(policy)
@@ -1368,7 +1708,6 @@ class TestBoundaryValidation:
 
     def test_action_type_deescalation_blocked(self, app, user, agent, risk_policy):
         """Cannot de-escalate from pause_agent to alert_only."""
-        from core.governance.boundaries import validate_against_boundaries
 
         # risk_policy has action_type='pause_agent'
         valid, error = validate_against_boundaries(
@@ -1378,26 +1717,27 @@ class TestBoundaryValidation:
         assert 'Cannot de-escalate' in error
 
     def test_get_workspace_boundaries(self, app, user):
-        from core.governance.boundaries import get_workspace_boundaries
-
         bounds = get_workspace_boundaries(user.id)
         assert 'max_daily_spend_cap' in bounds
         assert 'min_cooldown_minutes' in bounds
         assert bounds['tier_name'] == 'free'
         assert bounds['max_daily_spend_cap'] == Decimal('50.00')
 
+    def test_workspace_boundaries_are_copies(self, app, user):
+        get_workspace_boundaries(user.id)['max_daily_spend_cap'] = Decimal('1')
+
+        bounds = get_workspace_boundaries(user.id)
+        assert bounds['max_daily_spend_cap'] == Decimal('50.00')
+
 
 # ---------------------------------------------------------------------------
 # Approve One-Time Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestApproveOneTime:
 
     def test_approve_mutates_policy(self, app, user, agent, risk_policy,
                                     pending_request):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1412,13 +1752,10 @@ class TestApproveOneTime:
         assert result['new_value'] == '15.0000'
 
         # Policy actually changed
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert risk_policy.threshold_value == _D15
 
     def test_approve_updates_request_status(self, app, user, agent,
                                              risk_policy, pending_request):
-        from core.governance.approvals import approve_request
-
         approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1430,11 +1767,10 @@ class TestApproveOneTime:
         assert pending_request.status == 'applied'
         assert pending_request.reviewed_by == user.id
         assert pending_request.reviewed_at is not None
+        assert risk_policy.updated_at == pending_request.reviewed_at
 
     def test_approve_creates_audit_entries(self, app, user, agent,
                                            risk_policy, pending_request):
-        from core.governance.approvals import approve_request
-
         approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1460,8 +1796,6 @@ class TestApproveOneTime:
     def test_approve_boundary_violation_rejected(self, app, user, agent,
                                                   risk_policy):
         """Approval blocked if change exceeds workspace boundary."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
 
         # Request value exceeding free tier ($50 cap)
         pcr, _ = create_request(
@@ -1483,11 +1817,11 @@ class TestApproveOneTime:
         )
 
         assert result is None
-        assert 'Boundary violation' in error
+        assert error.startswith(ERR_BOUNDARY_VIOLATION)
 
         # Policy unchanged
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D10
 
         # Boundary violation logged
         violations = GovernanceAuditLog.query.filter_by(
@@ -1497,8 +1831,6 @@ class TestApproveOneTime:
 
     def test_approve_cooldown_change(self, app, user, agent, risk_policy):
         """Approve a cooldown_minutes change."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -1519,7 +1851,6 @@ class TestApproveOneTime:
         )
 
         assert error is None
-        db.session.refresh(risk_policy)
         assert risk_policy.cooldown_minutes == 120
 
 
@@ -1527,13 +1858,10 @@ class TestApproveOneTime:
 # Approve Delegate Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestApproveDelegate:
 
     def test_delegate_creates_grant(self, app, user, agent, risk_policy,
                                      pending_request):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1547,10 +1875,37 @@ class TestApproveDelegate:
         assert result['grant_id'] is not None
         assert result['duration_minutes'] == 120
 
+    def test_delegate_flushes_grant_and_audit_together(self, user,
+                                                       pending_request):
+        """The grant and both audit rows are written in one flush."""
+
+        flushes = []
+
+        def record(session, flush_context):
+            flushes.append(sorted(
+                getattr(obj, 'event_type', type(obj).__name__)
+                for obj in session.new
+            ))
+
+        event.listen(db.session, 'after_flush', record)
+        try:
+            _, error = approve_request(
+                request_id=pending_request.id,
+                workspace_id=user.id,
+                approver_id=user.id,
+                mode='delegate',
+                delegation_params={'duration_minutes': 60},
+            )
+        finally:
+            event.remove(db.session, 'after_flush', record)
+
+        assert error is None
+        assert flushes == [
+            ['DelegationGrant', 'grant_created', 'request_approved'],
+        ]
+
     def test_delegate_sets_request_approved(self, app, user, agent,
                                              risk_policy, pending_request):
-        from core.governance.approvals import approve_request
-
         approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1566,7 +1921,6 @@ class TestApproveDelegate:
     def test_delegate_does_not_mutate_policy(self, app, user, agent,
                                               risk_policy, pending_request):
         """Delegate mode only creates a grant — no immediate policy change."""
-        from core.governance.approvals import approve_request
 
         original_threshold = risk_policy.threshold_value
 
@@ -1578,13 +1932,11 @@ class TestApproveDelegate:
             delegation_params={'duration_minutes': 60},
         )
 
-        db.session.refresh(risk_policy)
+        db.session.expire(risk_policy, ['threshold_value'])
         assert risk_policy.threshold_value == original_threshold
 
     def test_delegate_grant_has_correct_bounds(self, app, user, agent,
                                                 risk_policy, pending_request):
-        from core.governance.approvals import approve_request
-
         result, _ = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1593,7 +1945,7 @@ class TestApproveDelegate:
             delegation_params={'duration_minutes': 60},
         )
 
-        grant = DelegationGrant.query.get(result['grant_id'])
+        grant = db.session.get(DelegationGrant, result['grant_id'])
         assert grant is not None
         assert grant.active is True
         assert grant.duration_minutes == 60
@@ -1609,8 +1961,6 @@ class TestApproveDelegate:
 
     def test_delegate_creates_audit_entries(self, app, user, agent,
                                              risk_policy, pending_request):
-        from core.governance.approvals import approve_request
-
         approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1633,8 +1983,6 @@ class TestApproveDelegate:
 
     def test_delegate_missing_duration(self, app, user, agent, risk_policy,
                                        pending_request):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1648,8 +1996,6 @@ class TestApproveDelegate:
 
     def test_delegate_excessive_duration(self, app, user, agent, risk_policy,
                                          pending_request):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1663,8 +2009,6 @@ class TestApproveDelegate:
 
     def test_delegate_boundary_violation(self, app, user, agent, risk_policy):
         """Delegation rejected if requested value exceeds boundary."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -1686,20 +2030,17 @@ class TestApproveDelegate:
         )
 
         assert result is None
-        assert 'Boundary violation' in error
+        assert error.startswith(ERR_BOUNDARY_VIOLATION)
 
 
 # ---------------------------------------------------------------------------
 # Deny Request Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestDenyRequest:
 
     def test_deny_sets_status(self, app, user, agent, risk_policy,
                                pending_request):
-        from core.governance.approvals import deny_request
-
         result, error = deny_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1717,8 +2058,6 @@ class TestDenyRequest:
 
     def test_deny_does_not_mutate_policy(self, app, user, agent,
                                           risk_policy, pending_request):
-        from core.governance.approvals import deny_request
-
         original = risk_policy.to_dict()
 
         deny_request(
@@ -1732,8 +2071,6 @@ class TestDenyRequest:
 
     def test_deny_creates_audit_entry(self, app, user, agent, risk_policy,
                                        pending_request):
-        from core.governance.approvals import deny_request
-
         deny_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1749,8 +2086,6 @@ class TestDenyRequest:
 
     def test_deny_without_reason(self, app, user, agent, risk_policy,
                                   pending_request):
-        from core.governance.approvals import deny_request
-
         result, error = deny_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1765,14 +2100,11 @@ class TestDenyRequest:
 # Authorization Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestApprovalAuthorization:
 
     def test_non_owner_non_admin_cannot_approve(self, app, user, agent,
                                                  risk_policy, pending_request,
                                                  other_user):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1786,8 +2118,6 @@ class TestApprovalAuthorization:
     def test_admin_can_approve_any_workspace(self, app, user, agent,
                                               risk_policy, pending_request,
                                               admin_user):
-        from core.governance.approvals import approve_request
-
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1801,8 +2131,6 @@ class TestApprovalAuthorization:
     def test_non_owner_non_admin_cannot_deny(self, app, user, agent,
                                               risk_policy, pending_request,
                                               other_user):
-        from core.governance.approvals import deny_request
-
         result, error = deny_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1814,8 +2142,6 @@ class TestApprovalAuthorization:
 
     def test_cannot_approve_already_denied(self, app, user, agent,
                                             risk_policy, pending_request):
-        from core.governance.approvals import approve_request, deny_request
-
         deny_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1834,8 +2160,6 @@ class TestApprovalAuthorization:
 
     def test_cannot_deny_already_applied(self, app, user, agent,
                                           risk_policy, pending_request):
-        from core.governance.approvals import approve_request, deny_request
-
         approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
@@ -1852,40 +2176,98 @@ class TestApprovalAuthorization:
         assert result is None
         assert 'already applied' in error
 
-    def test_approve_wrong_workspace(self, app, user, agent, risk_policy,
-                                      pending_request, other_user):
-        from core.governance.approvals import approve_request
+    @staticmethod
+    def _deny_behind_session(pcr):
+        """Another reviewer denies the request behind this session's back:
+        the row changes in the database, the loaded instance still reads
+        'pending'."""
+        db.session.execute(
+            update(PolicyChangeRequest)
+            .where(PolicyChangeRequest.id == pcr.id)
+            .values(status='denied'),
+            execution_options={'synchronize_session': False},
+        )
+        assert pcr.status == 'pending'
+
+    def test_concurrent_one_time_loses_claim(self, app, user, agent,
+                                             risk_policy, pending_request):
+        """A reviewer holding a stale 'pending' row cannot apply it."""
+        original = risk_policy.to_dict()
+        self._deny_behind_session(pending_request)
 
         result, error = approve_request(
             request_id=pending_request.id,
-            workspace_id=other_user.id,
-            approver_id=other_user.id,
+            workspace_id=user.id,
+            approver_id=user.id,
             mode='one_time',
         )
 
         assert result is None
-        assert 'not found' in error
+        assert error.startswith(ERR_REQUEST_NOT_PENDING)
+        assert risk_policy.to_dict() == original
 
-    def test_invalid_mode_rejected(self, app, user, agent, risk_policy,
-                                    pending_request):
-        from core.governance.approvals import approve_request
+    def test_concurrent_delegate_loses_claim(self, app, user, agent,
+                                             risk_policy, pending_request):
+        """A lost delegate race leaves no grant behind."""
+        self._deny_behind_session(pending_request)
 
         result, error = approve_request(
             request_id=pending_request.id,
             workspace_id=user.id,
             approver_id=user.id,
-            mode='auto_apply',
+            mode='delegate',
+            delegation_params={'duration_minutes': 60},
         )
 
         assert result is None
-        assert 'Invalid mode' in error
+        assert error.startswith(ERR_REQUEST_NOT_PENDING)
+        assert DelegationGrant.query.filter_by(
+            request_id=pending_request.id).count() == 0
 
+    def test_concurrent_deny_loses_claim(self, app, user, agent,
+                                         risk_policy, pending_request):
+        self._deny_behind_session(pending_request)
+
+        result, error = deny_request(
+            request_id=pending_request.id,
+            workspace_id=user.id,
+            approver_id=user.id,
+        )
+
+        assert result is None
+        assert error.startswith(ERR_REQUEST_NOT_PENDING)
+        assert GovernanceAuditLog.query.filter_by(
+            workspace_id=user.id, event_type='request_denied').count() == 0
+
+    def test_approve_wrong_workspace(self, app, user, agent, risk_policy,
+                                      pending_request, other_user):
+        result, error = approve_request(
+            request_id=pending_request.id,
+            workspace_id=other_user.id,
+            approver_id=other_user.id,
+            mode='one_time',
+        )
+
+        assert result is None
+        assert 'not found' in error
+
+    def test_invalid_mode_rejected(self, app, user, agent, risk_policy,
+                                    pending_request):
+        result, error = approve_request(
+            request_id=pending_request.id,
+            workspace_id=user.id,
+            approver_id=user.id,
+            mode='auto_apply',
+        )
+
+        assert result is None
+        assert 'Invalid mode' in error
+
+
+# ---------------------------------------------------------------------------
+# Phase 2 Route Tests
+# ---------------------------------------------------------------------------
 
-# ---------------------------------------------------------------------------
-# Phase 2 Route Tests
-# ---------------------------------------------------------------------------
-
-@pytest.mark.governance
 class TestApproveRoute:
 
     def test_unauthenticated_rejected(self, client, app):
@@ -1894,8 +2276,8 @@ class TestApproveRoute:
         })
         assert resp.status_code == 401
 
-    def test_missing_mode(self, app, user, agent, risk_policy, pending_request):
-        client = app.test_client()
+    def test_missing_mode(self, client, user, agent, risk_policy,
+                          pending_request):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1906,9 +2288,8 @@ class TestApproveRoute:
         assert resp.status_code == 400
         assert 'mode' in resp.get_json()['error']
 
-    def test_one_time_via_route(self, app, user, agent, risk_policy,
-                                 pending_request):
-        client = app.test_client()
+    def test_one_time_via_route(self, client, user, agent, risk_policy,
+                                pending_request):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1923,12 +2304,23 @@ class TestApproveRoute:
         assert data['status'] == 'applied'
 
         # Policy changed
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D15
 
-    def test_delegate_via_route(self, app, user, agent, risk_policy,
-                                 pending_request):
-        client = app.test_client()
+    def test_lost_review_race_is_409(self, client, user, monkeypatch):
+        monkeypatch.setattr(
+            'core.governance.approvals.approve_request',
+            lambda **kwargs: (None, f'{ERR_REQUEST_NOT_PENDING}: cannot approve'),
+        )
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+
+        resp = client.post('/api/governance/approve/1',
+                           json={'mode': 'one_time'})
+        assert resp.status_code == 409
+
+    def test_delegate_via_route(self, client, user, agent, risk_policy,
+                                pending_request):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1945,9 +2337,8 @@ class TestApproveRoute:
         assert data['mode'] == 'delegate'
         assert data['grant_id'] is not None
 
-    def test_boundary_violation_returns_403(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-
+    def test_boundary_violation_returns_403(self, client, user, agent,
+                                            risk_policy):
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -1959,7 +2350,6 @@ class TestApproveRoute:
             reason='too high',
         )
 
-        client = app.test_client()
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1968,19 +2358,17 @@ class TestApproveRoute:
             json={'mode': 'one_time'},
         )
         assert resp.status_code == 403
-        assert 'Boundary violation' in resp.get_json()['error']
+        assert resp.get_json()['error'].startswith(ERR_BOUNDARY_VIOLATION)
 
 
-@pytest.mark.governance
 class TestDenyRoute:
 
     def test_unauthenticated_rejected(self, client, app):
         resp = client.post('/api/governance/deny/1', json={})
         assert resp.status_code == 401
 
-    def test_deny_via_route(self, app, user, agent, risk_policy,
-                             pending_request):
-        client = app.test_client()
+    def test_deny_via_route(self, client, user, agent, risk_policy,
+                            pending_request):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -1993,8 +2381,18 @@ class TestDenyRoute:
         assert data['success'] is True
         assert data['status'] == 'denied'
 
-    def test_deny_nonexistent_returns_400(self, app, user):
-        client = app.test_client()
+    def test_lost_review_race_is_409(self, client, user, monkeypatch):
+        monkeypatch.setattr(
+            'core.governance.approvals.deny_request',
+            lambda **kwargs: (None, f'{ERR_REQUEST_NOT_PENDING}: cannot deny'),
+        )
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+
+        resp = client.post('/api/governance/deny/1', json={})
+        assert resp.status_code == 409
+
+    def test_deny_nonexistent_returns_400(self, client, user):
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
 
@@ -2006,13 +2404,11 @@ class TestDenyRoute:
 # Phase 2 Safety
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPhase2Safety:
 
     def test_one_time_approval_stores_before_after(self, app, user, agent,
                                                      risk_policy, pending_request):
         """change_applied audit entry has full before/after snapshots."""
-        from core.governance.approvals import approve_request
 
         approve_request(
             request_id=pending_request.id,
@@ -2031,17 +2427,36 @@ class TestPhase2Safety:
         assert before['threshold_value'] == '10.0000'
         assert after['threshold_value'] == '15.0000'
 
+    def test_one_time_approval_shares_timestamp(self, app, user, agent,
+                                                risk_policy, pending_request):
+        """Policy change, review and audit rows carry the same timestamp."""
+
+        approve_request(
+            request_id=pending_request.id,
+            workspace_id=user.id,
+            approver_id=user.id,
+            mode='one_time',
+        )
+
+        entries = GovernanceAuditLog.query.filter(
+            GovernanceAuditLog.event_type.in_(
+                ['request_approved', 'change_applied']),
+        ).all()
+        assert len(entries) == 2
+        for entry in entries:
+            assert entry.created_at == risk_policy.updated_at
+        assert pending_request.reviewed_at == risk_policy.updated_at
+
     def test_approve_does_not_affect_other_policies(self, app, user, agent,
                                                       risk_policy,
                                                       pending_request):
         """Only the targeted policy is modified."""
-        from core.governance.approvals import approve_request
 
         # Create a second policy
         policy2 = RiskPolicy(
             workspace_id=user.id, agent_id=agent.id,
             policy_type='error_rate_cap',
-            threshold_value=Decimal('5.0000'),
+            threshold_value=_D5,
             action_type='alert_only',
         )
         db.session.add(policy2)
@@ -2078,119 +2493,139 @@ class TestPhase2Safety:
 # Fixtures for Phase 3
 # ---------------------------------------------------------------------------
 
+def _envelope(lo, hi, policy_id):
+    """Build a fresh threshold_value envelope for a hand-built grant."""
+    return {
+        'policy_id': policy_id,
+        'fields': {'threshold_value': {'min_value': lo, 'max_value': hi}},
+    }
+
+
 @pytest.fixture
 def active_grant(app, user, agent, risk_policy, pending_request):
     """Create an active delegation grant via the approval flow."""
-    from core.governance.approvals import approve_request as do_approve
 
-    result, _ = do_approve(
+    result, _ = approve_request(
         request_id=pending_request.id,
         workspace_id=user.id,
         approver_id=user.id,
         mode='delegate',
         delegation_params={'duration_minutes': 120},
     )
-    return DelegationGrant.query.get(result['grant_id'])
-
-
-# ---------------------------------------------------------------------------
-# Apply Delegated Change Tests
-# ---------------------------------------------------------------------------
+    return db.session.get(DelegationGrant, result['grant_id'])
 
-@pytest.mark.governance
-class TestApplyDelegatedChange:
 
-    def test_apply_within_envelope(self, app, user, agent, risk_policy,
-                                    active_grant):
-        from core.governance.delegation import apply_delegated_change
+@pytest.fixture
+def active_grant_id(make_grant, risk_policy):
+    """Build the grant active_grant would issue and return only its id.
+
+    Skips the request/approval flow and its audit entries; tests that read
+    grant attributes or depend on that flow use active_grant instead.
+    """
+    envelope = _envelope('10', '15', risk_policy.id)
+    return make_grant(allowed_changes=envelope).id
+
+
+@pytest.fixture(scope='module')
+def clock():
+    """Reference timestamps for hand-built grants, computed once per module.
+
+    The governance code compares against the real ``utcnow()``, so these are
+    anchored to wall-clock time at module start; the one- and two-hour
+    offsets leave ample margin for the duration of the test run.
+    """
+    now = datetime.utcnow()
+    return SimpleNamespace(
+        now=now,
+        past_2h=now - timedelta(hours=2),
+        past_1h=now - timedelta(hours=1),
+        future_1h=now + timedelta(hours=1),
+        future_2h=now + timedelta(hours=2),
+    )
 
-        result, error = apply_delegated_change(
-            grant_id=active_grant.id,
-            workspace_id=user.id,
-            agent_id=agent.id,
-            requested_change={
-                'policy_id': risk_policy.id,
-                'field': 'threshold_value',
-                'new_value': '12.0000',
-            },
-        )
 
-        assert error is None
-        assert result['old_value'] == '10.0000'
-        assert result['new_value'] == '12.0000'
+@pytest.fixture
+def make_grant(user, agent, clock):
+    """Factory for hand-built grants issued by ``user`` to ``agent``.
+
+    Defaults to an active grant with an empty envelope, valid from now for
+    two hours; keyword arguments override any column. ``duration_minutes``
+    follows the validity window unless given. Grants are flushed rather
+    than committed so they roll back with the test transaction.
+    """
+    def make(**overrides):
+        fields = {
+            'workspace_id': user.id,
+            'agent_id': agent.id,
+            'granted_by': user.id,
+            'allowed_changes': {},
+            'valid_from': clock.now,
+            'valid_to': clock.future_2h,
+            'active': True,
+            **overrides,
+        }
+        fields.setdefault('duration_minutes', int(
+            (fields['valid_to'] - fields['valid_from']).total_seconds() // 60
+        ))
+        grant = DelegationGrant(**fields)
+        db.session.add(grant)
+        db.session.flush()
+        return grant
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('12.0000')
+    return make
 
-    def test_apply_at_max_envelope(self, app, user, agent, risk_policy,
-                                    active_grant):
-        """Applying exactly at the envelope max is allowed."""
-        from core.governance.delegation import apply_delegated_change
 
-        result, error = apply_delegated_change(
-            grant_id=active_grant.id,
-            workspace_id=user.id,
-            agent_id=agent.id,
-            requested_change={
-                'policy_id': risk_policy.id,
-                'field': 'threshold_value',
-                'new_value': '15.0000',
-            },
-        )
+# ---------------------------------------------------------------------------
+# Apply Delegated Change Tests
+# ---------------------------------------------------------------------------
 
-        assert error is None
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+class TestApplyDelegatedChange:
 
-    def test_apply_exceeds_envelope(self, app, user, agent, risk_policy,
-                                     active_grant):
-        """Value above grant max is rejected."""
-        from core.governance.delegation import apply_delegated_change
+    @pytest.mark.parametrize('new_value, expected_error, final_value', [
+        pytest.param('12.0000', None, '12.0000', id='within'),
+        pytest.param('15.0000', None, '15.0000', id='at_max'),
+        pytest.param('20.0000', ERR_ENVELOPE_VIOLATION, '10.0000',
+                     id='exceeds'),
+        pytest.param('5.0000', ERR_ENVELOPE_VIOLATION, '10.0000',
+                     id='below'),
+        pytest.param('NaN', ERR_ENVELOPE_VIOLATION, '10.0000', id='nan'),
+        pytest.param('Infinity', ERR_ENVELOPE_VIOLATION, '10.0000',
+                     id='infinity'),
+    ])
+    def test_apply_envelope_bounds(self, user, agent, risk_policy,
+                                   active_grant_id, new_value, expected_error,
+                                   final_value):
+        """Values inside the 10-15 envelope apply; values outside are rejected
+        and leave the policy unchanged."""
 
         result, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
                 'policy_id': risk_policy.id,
                 'field': 'threshold_value',
-                'new_value': '20.0000',
+                'new_value': new_value,
             },
         )
 
-        assert result is None
-        assert 'envelope violation' in error
-
-        # Policy unchanged
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
-
-    def test_apply_below_envelope(self, app, user, agent, risk_policy,
-                                   active_grant):
-        """Value below grant min is rejected."""
-        from core.governance.delegation import apply_delegated_change
-
-        result, error = apply_delegated_change(
-            grant_id=active_grant.id,
-            workspace_id=user.id,
-            agent_id=agent.id,
-            requested_change={
-                'policy_id': risk_policy.id,
-                'field': 'threshold_value',
-                'new_value': '5.0000',
-            },
-        )
+        if expected_error is None:
+            assert error is None
+            assert result['old_value'] == '10.0000'
+            assert result['new_value'] == new_value
+        else:
+            assert result is None
+            assert error.startswith(expected_error)
 
-        assert result is None
-        assert 'envelope violation' in error
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == Decimal(final_value)
 
-    def test_apply_wrong_field(self, app, user, agent, risk_policy,
-                                active_grant):
+    def test_apply_wrong_field(self, user, agent, risk_policy,
+                               active_grant_id):
         """Field not in grant is rejected."""
-        from core.governance.delegation import apply_delegated_change
 
         result, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -2203,27 +2638,26 @@ class TestApplyDelegatedChange:
         assert result is None
         assert 'not covered by this grant' in error
 
-    def test_apply_wrong_policy(self, app, user, agent, risk_policy,
-                                 active_grant):
+    def test_apply_wrong_policy(self, user, agent, risk_policy,
+                                active_grant_id):
         """Policy not matching grant is rejected."""
-        from core.governance.delegation import apply_delegated_change
 
-        # Create another policy
-        p2 = RiskPolicy(
-            workspace_id=user.id, agent_id=agent.id,
-            policy_type='error_rate_cap',
-            threshold_value=Decimal('5.0000'),
-            action_type='alert_only',
-        )
-        db.session.add(p2)
-        db.session.commit()
+        # Create another policy — only its id is needed, so skip the ORM
+        p2_id = db.session.execute(
+            RiskPolicy.__table__.insert().values(
+                workspace_id=user.id, agent_id=agent.id,
+                policy_type='error_rate_cap',
+                threshold_value=_D5,
+                action_type='alert_only',
+            )
+        ).inserted_primary_key[0]
 
         result, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
-                'policy_id': p2.id,
+                'policy_id': p2_id,
                 'field': 'threshold_value',
                 'new_value': '10.0000',
             },
@@ -2232,12 +2666,10 @@ class TestApplyDelegatedChange:
         assert result is None
         assert 'not policy' in error
 
-    def test_apply_creates_audit_entries(self, app, user, agent, risk_policy,
-                                          active_grant):
-        from core.governance.delegation import apply_delegated_change
-
+    def test_apply_creates_audit_entries(self, user, agent, risk_policy,
+                                         active_grant_id):
         apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -2247,27 +2679,57 @@ class TestApplyDelegatedChange:
             },
         )
 
-        used = GovernanceAuditLog.query.filter_by(
+        # .one() fails unless exactly one grant_used row exists
+        (used_details,) = GovernanceAuditLog.query.filter_by(
             event_type='grant_used',
-        ).all()
-        assert len(used) == 1
-        assert used[0].details['grant_id'] == active_grant.id
+        ).with_entities(GovernanceAuditLog.details).one()
+        assert used_details['grant_id'] == active_grant_id
 
-        applied = GovernanceAuditLog.query.filter_by(
+        applied_count = GovernanceAuditLog.query.filter_by(
             event_type='change_applied',
         ).filter(
             GovernanceAuditLog.details['source'].as_string() == 'delegation'
-        ).all()
-        assert len(applied) >= 1
+        ).count()
+        assert applied_count >= 1
+
+    def test_apply_flushes_audit_rows_together(self, user, agent,
+                                                risk_policy, active_grant_id):
+        """grant_used and change_applied are written in one flush."""
+
+        flushes = []
+
+        def record(session, flush_context):
+            flushes.append(sorted(
+                obj.event_type for obj in session.new
+                if isinstance(obj, GovernanceAuditLog)
+            ))
 
-    def test_apply_multiple_times_within_envelope(self, app, user, agent,
-                                                    risk_policy, active_grant):
+        event.listen(db.session, 'after_flush', record)
+        try:
+            _, error = apply_delegated_change(
+                grant_id=active_grant_id,
+                workspace_id=user.id,
+                agent_id=agent.id,
+                requested_change={
+                    'policy_id': risk_policy.id,
+                    'field': 'threshold_value',
+                    'new_value': '13.0000',
+                },
+            )
+        finally:
+            event.remove(db.session, 'after_flush', record)
+
+        assert error is None
+        assert flushes == [['change_applied', 'grant_used']]
+
+    def test_apply_multiple_times_within_envelope(self, user, agent,
+                                                  risk_policy,
+                                                  active_grant_id):
         """Agent can use a grant multiple times as long as values stay in envelope."""
-        from core.governance.delegation import apply_delegated_change
 
         # First: set to 12
         r1, e1 = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -2280,7 +2742,7 @@ class TestApplyDelegatedChange:
 
         # Second: set to 14
         r2, e2 = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -2291,38 +2753,25 @@ class TestApplyDelegatedChange:
         )
         assert e2 is None
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('14.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D14
 
 
 # ---------------------------------------------------------------------------
 # Expired Grant Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestExpiredGrant:
 
-    def test_expired_grant_rejected(self, app, user, agent, risk_policy):
+    def test_expired_grant_rejected(self, user, agent, risk_policy, clock,
+                                    make_grant):
         """Cannot use a grant after its valid_to has passed."""
-        from core.governance.delegation import apply_delegated_change
 
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '20'},
-                },
-            },
-            duration_minutes=60,
-            valid_from=now - timedelta(hours=2),
-            valid_to=now - timedelta(hours=1),
-            active=True,
+        grant = make_grant(
+            allowed_changes=_envelope('10', '20', risk_policy.id),
+            valid_from=clock.past_2h,
+            valid_to=clock.past_1h,
         )
-        db.session.add(grant)
-        db.session.commit()
 
         result, error = apply_delegated_change(
             grant_id=grant.id,
@@ -2336,33 +2785,20 @@ class TestExpiredGrant:
         )
 
         assert result is None
-        assert 'expired' in error
+        assert error == ERR_GRANT_EXPIRED
 
         # Grant should have been auto-deactivated
         db.session.refresh(grant)
         assert grant.active is False
 
-    def test_not_yet_valid_grant_rejected(self, app, user, agent, risk_policy):
+    def test_not_yet_valid_grant_rejected(self, user, agent, risk_policy,
+                                          clock, make_grant):
         """Cannot use a grant before its valid_from."""
-        from core.governance.delegation import apply_delegated_change
 
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '20'},
-                },
-            },
-            duration_minutes=60,
-            valid_from=now + timedelta(hours=1),
-            valid_to=now + timedelta(hours=2),
-            active=True,
+        grant = make_grant(
+            allowed_changes=_envelope('10', '20', risk_policy.id),
+            valid_from=clock.future_1h,
         )
-        db.session.add(grant)
-        db.session.commit()
 
         result, error = apply_delegated_change(
             grant_id=grant.id,
@@ -2376,31 +2812,17 @@ class TestExpiredGrant:
         )
 
         assert result is None
-        assert 'not yet valid' in error
+        assert error == ERR_GRANT_NOT_YET_VALID
 
 
 # ---------------------------------------------------------------------------
 # Grant Expiration Cron Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestExpireGrants:
 
-    def test_expire_deactivates_old_grants(self, app, user, agent):
-        from core.governance.delegation import expire_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={},
-            duration_minutes=60,
-            valid_from=now - timedelta(hours=2),
-            valid_to=now - timedelta(hours=1),
-            active=True,
-        )
-        db.session.add(grant)
-        db.session.commit()
+    def test_expire_deactivates_old_grants(self, clock, make_grant):
+        grant = make_grant(valid_from=clock.past_2h, valid_to=clock.past_1h)
 
         count = expire_grants()
         assert count == 1
@@ -2408,21 +2830,8 @@ class TestExpireGrants:
         db.session.refresh(grant)
         assert grant.active is False
 
-    def test_expire_skips_active_grants(self, app, user, agent):
-        from core.governance.delegation import expire_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={},
-            duration_minutes=120,
-            valid_from=now,
-            valid_to=now + timedelta(hours=2),
-            active=True,
-        )
-        db.session.add(grant)
-        db.session.commit()
+    def test_expire_skips_active_grants(self, make_grant):
+        grant = make_grant()
 
         count = expire_grants()
         assert count == 0
@@ -2430,60 +2839,34 @@ class TestExpireGrants:
         db.session.refresh(grant)
         assert grant.active is True
 
-    def test_expire_skips_already_inactive(self, app, user, agent):
-        from core.governance.delegation import expire_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={},
-            duration_minutes=60,
-            valid_from=now - timedelta(hours=2),
-            valid_to=now - timedelta(hours=1),
+    def test_expire_skips_already_inactive(self, clock, make_grant):
+        make_grant(
+            valid_from=clock.past_2h,
+            valid_to=clock.past_1h,
             active=False,
         )
-        db.session.add(grant)
-        db.session.commit()
 
         count = expire_grants()
         assert count == 0
 
-    def test_expire_creates_audit_entries(self, app, user, agent):
-        from core.governance.delegation import expire_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={},
-            duration_minutes=60,
-            valid_from=now - timedelta(hours=2),
-            valid_to=now - timedelta(hours=1),
-            active=True,
-        )
-        db.session.add(grant)
-        db.session.commit()
+    def test_expire_creates_audit_entries(self, clock, make_grant):
+        make_grant(valid_from=clock.past_2h, valid_to=clock.past_1h)
 
         expire_grants()
 
-        entries = GovernanceAuditLog.query.filter_by(
+        assert GovernanceAuditLog.query.filter_by(
             event_type='grant_expired',
-        ).all()
-        assert len(entries) == 1
+        ).count() == 1
 
 
 # ---------------------------------------------------------------------------
 # Grant Revocation Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestRevokeGrant:
 
-    def test_revoke_deactivates_grant(self, app, user, agent, risk_policy,
+    def test_revoke_deactivates_grant(self, user, agent, risk_policy,
                                       active_grant):
-        from core.governance.delegation import revoke_grant
-
         result, error = revoke_grant(
             grant_id=active_grant.id,
             workspace_id=user.id,
@@ -2498,18 +2881,16 @@ class TestRevokeGrant:
         assert active_grant.revoked_at is not None
         assert active_grant.revoked_by == user.id
 
-    def test_revoked_grant_cannot_be_used(self, app, user, agent, risk_policy,
-                                           active_grant):
-        from core.governance.delegation import revoke_grant, apply_delegated_change
-
+    def test_revoked_grant_cannot_be_used(self, user, agent, risk_policy,
+                                          active_grant_id):
         revoke_grant(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             revoker_id=user.id,
         )
 
         result, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -2520,28 +2901,23 @@ class TestRevokeGrant:
         )
 
         assert result is None
-        assert 'no longer active' in error
-
-    def test_revoke_creates_audit_entry(self, app, user, agent, risk_policy,
-                                         active_grant):
-        from core.governance.delegation import revoke_grant
+        assert error == ERR_GRANT_INACTIVE
 
+    def test_revoke_creates_audit_entry(self, user, agent, risk_policy,
+                                        active_grant_id):
         revoke_grant(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             revoker_id=user.id,
         )
 
-        entries = GovernanceAuditLog.query.filter_by(
+        (details,) = GovernanceAuditLog.query.filter_by(
             event_type='grant_revoked',
-        ).all()
-        assert len(entries) == 1
-        assert entries[0].details['revoked_by'] == user.id
+        ).with_entities(GovernanceAuditLog.details).one()
+        assert details['revoked_by'] == user.id
 
-    def test_revoke_already_inactive(self, app, user, agent, risk_policy,
+    def test_revoke_already_inactive(self, user, agent, risk_policy,
                                       active_grant):
-        from core.governance.delegation import revoke_grant
-
         active_grant.active = False
         db.session.commit()
 
@@ -2552,14 +2928,12 @@ class TestRevokeGrant:
         )
 
         assert result is None
-        assert 'already inactive' in error
-
-    def test_non_owner_cannot_revoke(self, app, user, agent, risk_policy,
-                                      active_grant, other_user):
-        from core.governance.delegation import revoke_grant
+        assert error == ERR_GRANT_ALREADY_INACTIVE
 
+    def test_non_owner_cannot_revoke(self, user, agent, risk_policy,
+                                     active_grant_id, other_user):
         result, error = revoke_grant(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             revoker_id=other_user.id,
         )
@@ -2567,12 +2941,10 @@ class TestRevokeGrant:
         assert result is None
         assert 'Only the workspace owner' in error
 
-    def test_admin_can_revoke(self, app, user, agent, risk_policy,
-                               active_grant, admin_user):
-        from core.governance.delegation import revoke_grant
-
+    def test_admin_can_revoke(self, user, agent, risk_policy, active_grant_id,
+                              admin_user):
         result, error = revoke_grant(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             revoker_id=admin_user.id,
         )
@@ -2585,45 +2957,19 @@ class TestRevokeGrant:
 # No Stacking Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestNoGrantStacking:
 
-    def test_grants_do_not_stack(self, app, user, agent, risk_policy):
+    def test_grants_do_not_stack(self, user, agent, risk_policy, make_grant):
         """Two grants for the same policy — each enforces its own envelope."""
-        from core.governance.delegation import apply_delegated_change
-
-        now = datetime.utcnow()
 
         # Grant 1: allows 10-15
-        g1 = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '15'},
-                },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
+        g1 = make_grant(
+            allowed_changes=_envelope('10', '15', risk_policy.id),
         )
         # Grant 2: allows 12-20
-        g2 = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '12', 'max_value': '20'},
-                },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
+        g2 = make_grant(
+            allowed_changes=_envelope('12', '20', risk_policy.id),
         )
-        db.session.add_all([g1, g2])
-        db.session.commit()
 
         # Using grant 1 to set 18 should fail (max is 15)
         r1, e1 = apply_delegated_change(
@@ -2637,7 +2983,7 @@ class TestNoGrantStacking:
             },
         )
         assert r1 is None
-        assert 'envelope violation' in e1
+        assert e1.startswith(ERR_ENVELOPE_VIOLATION)
 
         # Using grant 2 to set 18 should succeed (max is 20)
         r2, e2 = apply_delegated_change(
@@ -2653,27 +2999,13 @@ class TestNoGrantStacking:
         assert e2 is None
         assert r2['new_value'] == '18.0000'
 
-    def test_grant_envelope_is_absolute_not_relative(self, app, user, agent,
-                                                       risk_policy):
+    def test_grant_envelope_is_absolute_not_relative(self, user, agent,
+                                                     risk_policy, make_grant):
         """Grant bounds are absolute values, not relative to current policy."""
-        from core.governance.delegation import apply_delegated_change
 
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '15'},
-                },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
+        grant = make_grant(
+            allowed_changes=_envelope('10', '15', risk_policy.id),
         )
-        db.session.add(grant)
-        db.session.commit()
 
         # Set to 15
         apply_delegated_change(
@@ -2699,63 +3031,35 @@ class TestNoGrantStacking:
             },
         )
         assert r is None
-        assert 'envelope violation' in e
+        assert e.startswith(ERR_ENVELOPE_VIOLATION)
 
 
 # ---------------------------------------------------------------------------
 # Get Active Grants Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestGetActiveGrants:
 
-    def test_returns_active_grants(self, app, user, agent, risk_policy,
-                                    active_grant):
-        from core.governance.delegation import get_active_grants
-
+    def test_returns_active_grants(self, user, agent, risk_policy,
+                                   active_grant_id):
         grants = get_active_grants(workspace_id=user.id)
         assert len(grants) == 1
-        assert grants[0].id == active_grant.id
+        assert grants[0].id == active_grant_id
 
-    def test_excludes_expired(self, app, user, agent):
-        from core.governance.delegation import get_active_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id, allowed_changes={},
-            duration_minutes=60,
-            valid_from=now - timedelta(hours=2),
-            valid_to=now - timedelta(hours=1),
-            active=True,
-        )
-        db.session.add(grant)
-        db.session.commit()
+    def test_excludes_expired(self, user, clock, make_grant):
+        make_grant(valid_from=clock.past_2h, valid_to=clock.past_1h)
 
         grants = get_active_grants(workspace_id=user.id)
         assert len(grants) == 0
 
-    def test_excludes_inactive(self, app, user, agent):
-        from core.governance.delegation import get_active_grants
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id, allowed_changes={},
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=False,
-        )
-        db.session.add(grant)
-        db.session.commit()
+    def test_excludes_inactive(self, user, make_grant):
+        make_grant(active=False)
 
         grants = get_active_grants(workspace_id=user.id)
         assert len(grants) == 0
 
-    def test_filters_by_agent(self, app, user, agent, risk_policy,
-                               active_grant, other_user, other_agent):
-        from core.governance.delegation import get_active_grants
-
+    def test_filters_by_agent(self, user, agent, risk_policy, active_grant_id,
+                              other_user, other_agent):
         by_agent = get_active_grants(
             workspace_id=user.id, agent_id=agent.id,
         )
@@ -2766,10 +3070,8 @@ class TestGetActiveGrants:
         )
         assert len(by_other) == 0
 
-    def test_workspace_isolation(self, app, user, agent, risk_policy,
-                                  active_grant, other_user):
-        from core.governance.delegation import get_active_grants
-
+    def test_workspace_isolation(self, user, agent, risk_policy,
+                                 active_grant_id, other_user):
         grants = get_active_grants(workspace_id=other_user.id)
         assert len(grants) == 0
 
@@ -2778,31 +3080,17 @@ class TestGetActiveGrants:
 # Workspace Boundary on Delegated Apply
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestDelegationWorkspaceBoundary:
 
-    def test_workspace_boundary_enforced_on_delegation(self, app, user, agent,
-                                                        risk_policy):
+    def test_workspace_boundary_enforced_on_delegation(self, user, agent,
+                                                       risk_policy,
+                                                       make_grant):
         """Even if grant envelope allows it, workspace boundary blocks it."""
-        from core.governance.delegation import apply_delegated_change
 
-        now = datetime.utcnow()
         # Grant allows up to 100 — but free tier caps at 50
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '100'},
-                },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
+        grant = make_grant(
+            allowed_changes=_envelope('10', '100', risk_policy.id),
         )
-        db.session.add(grant)
-        db.session.commit()
 
         result, error = apply_delegated_change(
             grant_id=grant.id,
@@ -2816,33 +3104,19 @@ class TestDelegationWorkspaceBoundary:
         )
 
         assert result is None
-        assert 'Workspace boundary violation' in error
+        assert error.startswith(ERR_WORKSPACE_BOUNDARY_VIOLATION)
 
         # Policy unchanged
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D10
 
-    def test_within_both_grant_and_workspace(self, app, user, agent,
-                                              risk_policy):
+    def test_within_both_grant_and_workspace(self, user, agent, risk_policy,
+                                             make_grant):
         """Value within both grant envelope and workspace boundary succeeds."""
-        from core.governance.delegation import apply_delegated_change
 
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '40'},
-                },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
+        grant = make_grant(
+            allowed_changes=_envelope('10', '40', risk_policy.id),
         )
-        db.session.add(grant)
-        db.session.commit()
 
         result, error = apply_delegated_change(
             grant_id=grant.id,
@@ -2856,7 +3130,7 @@ class TestDelegationWorkspaceBoundary:
         )
 
         assert error is None
-        db.session.refresh(risk_policy)
+        db.session.expire(risk_policy, ['threshold_value'])
         assert risk_policy.threshold_value == Decimal('35.0000')
 
 
@@ -2864,20 +3138,24 @@ class TestDelegationWorkspaceBoundary:
 # Phase 3 Route Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
-class TestDelegateApplyRoute:
+class TestDelegationRoutesAuth:
 
-    def test_unauthenticated_rejected(self, client, app):
-        resp = client.post('/api/governance/delegate/apply', json={})
+    @pytest.mark.parametrize('method, url, body', [
+        ('post', '/api/governance/delegate/apply', {}),
+        ('get', '/api/governance/delegations', None),
+        ('post', '/api/governance/delegations/1/revoke', None),
+    ])
+    def test_unauthenticated_rejected(self, client, method, url, body):
+        resp = getattr(client, method)(url, json=body)
         assert resp.status_code == 401
 
-    def test_apply_via_route(self, app, user, agent, risk_policy, active_grant):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
 
-        resp = client.post('/api/governance/delegate/apply', json={
-            'grant_id': active_grant.id,
+class TestDelegateApplyRoute:
+
+    def test_apply_via_route(self, authenticated_client, agent, risk_policy,
+                             active_grant_id):
+        resp = authenticated_client.post('/api/governance/delegate/apply', json={
+            'grant_id': active_grant_id,
             'agent_id': agent.id,
             'requested_change': {
                 'policy_id': risk_policy.id,
@@ -2890,14 +3168,10 @@ class TestDelegateApplyRoute:
         assert data['success'] is True
         assert data['new_value'] == '13.0000'
 
-    def test_envelope_violation_returns_403(self, app, user, agent,
-                                             risk_policy, active_grant):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.post('/api/governance/delegate/apply', json={
-            'grant_id': active_grant.id,
+    def test_envelope_violation_returns_403(self, authenticated_client, agent,
+                                            risk_policy, active_grant_id):
+        resp = authenticated_client.post('/api/governance/delegate/apply', json={
+            'grant_id': active_grant_id,
             'agent_id': agent.id,
             'requested_change': {
                 'policy_id': risk_policy.id,
@@ -2907,59 +3181,36 @@ class TestDelegateApplyRoute:
         })
         assert resp.status_code == 403
 
-    def test_missing_fields(self, app, user, agent, risk_policy, active_grant):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.post('/api/governance/delegate/apply', json={
+    def test_missing_fields(self, authenticated_client, agent, risk_policy,
+                            active_grant_id):
+        resp = authenticated_client.post('/api/governance/delegate/apply', json={
             'agent_id': agent.id,
             'requested_change': {},
         })
         assert resp.status_code == 400
 
 
-@pytest.mark.governance
 class TestDelegationsListRoute:
 
-    def test_unauthenticated_rejected(self, client, app):
-        resp = client.get('/api/governance/delegations')
-        assert resp.status_code == 401
-
-    def test_list_active(self, app, user, agent, risk_policy, active_grant):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.get('/api/governance/delegations')
+    def test_list_active(self, authenticated_client, agent, risk_policy,
+                         active_grant_id):
+        resp = authenticated_client.get('/api/governance/delegations')
         assert resp.status_code == 200
         data = resp.get_json()
-        assert data['count'] == 1
-
-    def test_list_empty(self, app, user):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
+        assert data['count'] == 1
 
-        resp = client.get('/api/governance/delegations')
+    def test_list_empty(self, authenticated_client):
+        resp = authenticated_client.get('/api/governance/delegations')
         assert resp.status_code == 200
         assert resp.get_json()['count'] == 0
 
 
-@pytest.mark.governance
 class TestRevokeRoute:
 
-    def test_unauthenticated_rejected(self, client, app):
-        resp = client.post('/api/governance/delegations/1/revoke')
-        assert resp.status_code == 401
-
-    def test_revoke_via_route(self, app, user, agent, risk_policy, active_grant):
-        client = app.test_client()
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.post(
-            f'/api/governance/delegations/{active_grant.id}/revoke',
+    def test_revoke_via_route(self, authenticated_client, agent, risk_policy,
+                              active_grant_id):
+        resp = authenticated_client.post(
+            f'/api/governance/delegations/{active_grant_id}/revoke',
         )
         assert resp.status_code == 200
         data = resp.get_json()
@@ -2967,133 +3218,108 @@ class TestRevokeRoute:
         assert data['status'] == 'revoked'
 
 
-@pytest.mark.governance
 class TestExpireCronRoute:
 
-    def test_unauthenticated_rejected(self, app):
-        client = app.test_client()
-        resp = client.post('/api/governance/internal/expire', json={})
-        assert resp.status_code == 401
-
-    def test_with_admin_password(self, app):
-        import os
-        os.environ['ADMIN_PASSWORD'] = 'test_admin_pass'
-
-        client = app.test_client()
-        resp = client.post('/api/governance/internal/expire', json={
-            'password': 'test_admin_pass',
-        })
-        assert resp.status_code == 200
-        data = resp.get_json()
-        assert data['success'] is True
-        assert 'requests_expired' in data
-        assert 'grants_expired' in data
-
-        del os.environ['ADMIN_PASSWORD']
-
-    def test_with_cron_secret(self, app):
-        import os
-        os.environ['CRON_SECRET'] = 'test_cron_secret'
-
-        client = app.test_client()
-        resp = client.post(
-            '/api/governance/internal/expire',
-            headers={'Authorization': 'Bearer test_cron_secret'},
-        )
-        assert resp.status_code == 200
-
-        del os.environ['CRON_SECRET']
+    ENDPOINT = 'governance_internal_expire'
+    URL = '/api/governance/internal/expire'
+
+    def test_route_registered(self, app):
+        adapter = app.url_map.bind('localhost')
+        assert adapter.match(self.URL, method='POST')[0] == self.ENDPOINT
+
+    @pytest.mark.parametrize('env, headers, body, expected_status', [
+        pytest.param({}, {}, {}, 401, id='unauthenticated'),
+        pytest.param(
+            {'ADMIN_PASSWORD': 'test_admin_pass'},
+            {}, {'password': 'test_admin_pass'}, 200,
+            id='admin_password',
+        ),
+        pytest.param(
+            {'CRON_SECRET': 'test_cron_secret'},
+            {'Authorization': 'Bearer test_cron_secret'}, None, 200,
+            id='cron_secret',
+        ),
+    ])
+    def test_auth(self, app, monkeypatch, env, headers, body,
+                  expected_status):
+        """Call the view under a request context, skipping WSGI dispatch."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        view = app.view_functions[self.ENDPOINT]
+        with app.test_request_context(self.URL, method='POST',
+                                      headers=headers, json=body):
+            resp = app.make_response(view())
+
+        assert resp.status_code == expected_status
+        if expected_status == 200:
+            data = resp.get_json()
+            assert data['success'] is True
+            assert 'requests_expired' in data
+            assert 'grants_expired' in data
 
 
 # ---------------------------------------------------------------------------
 # Phase 3 Module Exports
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPhase3Exports:
 
-    def test_module_exports_phase3(self, app):
-        from core.governance import (
-            get_active_grants, apply_delegated_change,
-            expire_grants, revoke_grant,
-        )
-        assert callable(get_active_grants)
-        assert callable(apply_delegated_change)
-        assert callable(expire_grants)
-        assert callable(revoke_grant)
+    @pytest.mark.parametrize('name', [
+        'get_active_grants', 'apply_delegated_change',
+        'expire_grants', 'revoke_grant',
+    ])
+    def test_module_exports_phase3(self, name):
+        assert callable(getattr(gov, name))
 
 
 # ---------------------------------------------------------------------------
 # Phase 3 Determinism
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestDelegationDeterminism:
 
-    def test_same_input_same_result(self, app, user, agent, risk_policy):
-        """Identical delegated applies produce identical results."""
-        from core.governance.delegation import apply_delegated_change
-
-        now = datetime.utcnow()
-        grant = DelegationGrant(
-            workspace_id=user.id, agent_id=agent.id,
-            granted_by=user.id,
-            allowed_changes={
-                'policy_id': risk_policy.id,
-                'fields': {
-                    'threshold_value': {'min_value': '10', 'max_value': '20'},
+    @pytest.fixture
+    def grant_id(self, make_grant, risk_policy):
+        """Build a 10-20 threshold grant and return its id."""
+        envelope = _envelope('10', '20', risk_policy.id)
+        return make_grant(allowed_changes=envelope).id
+
+    @pytest.mark.parametrize('first, second, expected', [
+        pytest.param('15.0000', '15.0000', _D15, id='equal'),
+        pytest.param('15', '15.0000', _D15, id='precision'),
+    ])
+    def test_same_input_same_result(self, user, agent, risk_policy, grant_id,
+                                    first, second, expected):
+        """Re-applying an equal value leaves the policy in the same state."""
+        thresholds = []
+        for value in (first, second):
+            result, error = apply_delegated_change(
+                grant_id=grant_id,
+                workspace_id=user.id,
+                agent_id=agent.id,
+                requested_change={
+                    'policy_id': risk_policy.id,
+                    'field': 'threshold_value',
+                    'new_value': value,
                 },
-            },
-            duration_minutes=120,
-            valid_from=now, valid_to=now + timedelta(hours=2),
-            active=True,
-        )
-        db.session.add(grant)
-        db.session.commit()
-
-        r1, _ = apply_delegated_change(
-            grant_id=grant.id,
-            workspace_id=user.id,
-            agent_id=agent.id,
-            requested_change={
-                'policy_id': risk_policy.id,
-                'field': 'threshold_value',
-                'new_value': '15.0000',
-            },
-        )
-
-        # Apply same value again — idempotent
-        r2, _ = apply_delegated_change(
-            grant_id=grant.id,
-            workspace_id=user.id,
-            agent_id=agent.id,
-            requested_change={
-                'policy_id': risk_policy.id,
-                'field': 'threshold_value',
-                'new_value': '15.0000',
-            },
-        )
+            )
+            assert error is None
+            assert result['new_value'] == value
+            thresholds.append(db.session.execute(
+                select(RiskPolicy.threshold_value)
+                .where(RiskPolicy.id == risk_policy.id)
+            ).scalar_one())
 
-        assert r1['new_value'] == r2['new_value']
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert thresholds == [expected, expected]
 
-    def test_wrong_agent_cannot_use_grant(self, app, user, agent, risk_policy,
-                                           active_grant):
+    def test_wrong_agent_cannot_use_grant(self, user, risk_policy,
+                                          active_grant_id, alt_agent_id):
         """Grant is bound to a specific agent."""
-        from core.governance.delegation import apply_delegated_change
-
-        agent2 = Agent(
-            user_id=user.id, name='Agent2', is_active=True,
-            created_at=datetime.utcnow(),
-        )
-        db.session.add(agent2)
-        db.session.commit()
-
         result, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
-            agent_id=agent2.id,
+            agent_id=alt_agent_id,
             requested_change={
                 'policy_id': risk_policy.id,
                 'field': 'threshold_value',
@@ -3102,7 +3328,7 @@ class TestDelegationDeterminism:
         )
 
         assert result is None
-        assert 'does not belong to this agent' in error
+        assert error == ERR_GRANT_WRONG_AGENT
 
 
 # ===========================================================================
@@ -3117,10 +3343,8 @@ class TestDelegationDeterminism:
 @pytest.fixture
 def applied_change(app, user, agent, risk_policy, pending_request):
     """Apply a one-time change and return the audit entry for the application."""
-    from core.governance.approvals import approve_request as do_approve
-    from core.governance.governance_audit import get_governance_trail
 
-    do_approve(
+    approve_request(
         request_id=pending_request.id,
         workspace_id=user.id,
         approver_id=user.id,
@@ -3130,22 +3354,20 @@ def applied_change(app, user, agent, risk_policy, pending_request):
     entries = get_governance_trail(
         workspace_id=user.id,
         event_type='change_applied',
+        limit=1,
     )
     assert len(entries) >= 1
     return entries[0]
 
 
-@pytest.mark.governance
 class TestRollbackChange:
 
     def test_rollback_restores_policy(self, app, user, agent, risk_policy,
                                       pending_request, applied_change):
         """Rolling back a change_applied event restores policy_before."""
-        from core.governance.rollback import rollback_change
 
         # Policy should be at the approved value now
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert risk_policy.threshold_value == _D15
 
         result, error = rollback_change(
             audit_entry_id=applied_change.id,
@@ -3156,16 +3378,41 @@ class TestRollbackChange:
         assert error is None
         assert result['policy_id'] == risk_policy.id
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
+
+    def test_rollback_updates_only_changed_field(self, user, risk_policy,
+                                                 applied_change):
+        """Restoring one field writes that column and updated_at only."""
+
+        updated = []
+
+        def record(session, flush_context):
+            for obj in session.dirty:
+                if isinstance(obj, RiskPolicy):
+                    state = inspect(obj)
+                    updated.append(sorted(
+                        attr.key for attr in state.attrs
+                        if attr.history.has_changes()
+                    ))
+
+        event.listen(db.session, 'after_flush', record)
+        try:
+            _, error = rollback_change(
+                audit_entry_id=applied_change.id,
+                workspace_id=user.id,
+                actor_id=user.id,
+            )
+        finally:
+            event.remove(db.session, 'after_flush', record)
+
+        assert error is None
+        assert updated == [['threshold_value', 'updated_at']]
 
     def test_rollback_creates_audit_entry(self, app, user, agent, risk_policy,
                                           pending_request, applied_change):
         """Rollback creates a change_rolled_back audit entry."""
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
-        rollback_change(
+        result, _ = rollback_change(
             audit_entry_id=applied_change.id,
             workspace_id=user.id,
             actor_id=user.id,
@@ -3177,6 +3424,7 @@ class TestRollbackChange:
         )
         assert len(entries) == 1
         entry = entries[0]
+        assert entry.id == result['rollback_entry_id']
         assert entry.details['rolled_back_entry_id'] == applied_change.id
         assert entry.details['policy_id'] == risk_policy.id
         assert 'policy_before' in entry.details
@@ -3187,8 +3435,6 @@ class TestRollbackChange:
                                                      pending_request,
                                                      applied_change):
         """Rollback audit entry contains pre-rollback and post-rollback state."""
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
         result, _ = rollback_change(
             audit_entry_id=applied_change.id,
@@ -3196,11 +3442,7 @@ class TestRollbackChange:
             actor_id=user.id,
         )
 
-        entries = get_governance_trail(
-            workspace_id=user.id,
-            event_type='change_rolled_back',
-        )
-        entry = entries[0]
+        entry = db.session.get(GovernanceAuditLog, result['rollback_entry_id'])
 
         # policy_before in the rollback entry = state before rollback (15.0000)
         assert entry.details['policy_before']['threshold_value'] == '15.0000'
@@ -3210,55 +3452,30 @@ class TestRollbackChange:
     def test_rollback_of_rollback(self, app, user, agent, risk_policy,
                                    pending_request, applied_change):
         """Rolling back a rollback restores the state before the rollback."""
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
         # First rollback: 15 -> 10
-        rollback_change(
+        first, _ = rollback_change(
             audit_entry_id=applied_change.id,
             workspace_id=user.id,
             actor_id=user.id,
         )
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
-
-        # Get the rollback audit entry
-        rollback_entries = get_governance_trail(
-            workspace_id=user.id,
-            event_type='change_rolled_back',
-        )
-        rollback_entry = rollback_entries[0]
+        assert risk_policy.threshold_value == _D10
 
         # Second rollback (of the rollback): 10 -> 15
         result, error = rollback_change(
-            audit_entry_id=rollback_entry.id,
+            audit_entry_id=first['rollback_entry_id'],
             workspace_id=user.id,
             actor_id=user.id,
         )
 
         assert error is None
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert risk_policy.threshold_value == _D15
 
     def test_rollback_boundary_revalidation(self, app, user, agent,
-                                             risk_policy):
+                                             risk_policy, pro_tier):
         """Rollback is blocked if restoring would violate current boundaries."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request as do_approve
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
-        from core.observability.tier_enforcement import invalidate_tier_cache
-
-        # Start with pro tier: boundary $500
-        tier = WorkspaceTier(
-            workspace_id=user.id,
-            tier_name='pro',
-            **WorkspaceTier.TIER_DEFAULTS['pro'],
-        )
-        db.session.add(tier)
-        db.session.commit()
-        invalidate_tier_cache(user.id)
 
+        # Start with pro tier (pro_tier fixture): boundary $500
         # Set policy threshold to $400 (within pro boundary)
         risk_policy.threshold_value = Decimal('400.0000')
         db.session.commit()
@@ -3276,7 +3493,7 @@ class TestRollbackChange:
             reason='Lower the cap',
         )
 
-        result, error = do_approve(
+        result, error = approve_request(
             request_id=pcr.id,
             workspace_id=user.id,
             approver_id=user.id,
@@ -3287,13 +3504,12 @@ class TestRollbackChange:
         entries = get_governance_trail(
             workspace_id=user.id,
             event_type='change_applied',
+            limit=1,
         )
         change_entry = entries[0]
 
         # Now downgrade tier to free (boundary $50)
-        tier.tier_name = 'free'
-        db.session.commit()
-        invalidate_tier_cache(user.id)
+        pro_tier('free')
 
         # Try to rollback: would restore $400, but free tier cap is $50
         result, error = rollback_change(
@@ -3303,21 +3519,20 @@ class TestRollbackChange:
         )
 
         assert result is None
-        assert 'boundary' in error.lower()
+        assert error.startswith(ERR_ROLLBACK_BLOCKED)
         # Policy should still be at $200
-        db.session.refresh(risk_policy)
+        db.session.expire(risk_policy, ['threshold_value'])
         assert risk_policy.threshold_value == Decimal('200.0000')
 
     def test_rollback_non_mutation_event_rejected(self, app, user, agent,
                                                    risk_policy,
                                                    pending_request):
         """Cannot rollback a non-mutation event like request_submitted."""
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
         entries = get_governance_trail(
             workspace_id=user.id,
             event_type='request_submitted',
+            limit=1,
         )
         assert len(entries) >= 1
 
@@ -3334,7 +3549,6 @@ class TestRollbackChange:
                                        pending_request, applied_change,
                                        other_user):
         """Cannot rollback a change from another workspace."""
-        from core.governance.rollback import rollback_change
 
         result, error = rollback_change(
             audit_entry_id=applied_change.id,
@@ -3349,7 +3563,6 @@ class TestRollbackChange:
                                      pending_request, applied_change,
                                      other_user):
         """Non-owner, non-admin cannot rollback."""
-        from core.governance.rollback import rollback_change
 
         result, error = rollback_change(
             audit_entry_id=applied_change.id,
@@ -3363,7 +3576,6 @@ class TestRollbackChange:
     def test_admin_can_rollback(self, app, user, agent, risk_policy,
                                  pending_request, applied_change, admin_user):
         """Admin user can rollback changes for any workspace."""
-        from core.governance.rollback import rollback_change
 
         result, error = rollback_change(
             audit_entry_id=applied_change.id,
@@ -3372,19 +3584,15 @@ class TestRollbackChange:
         )
 
         assert error is None
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
 
     def test_rollback_delegation_applied_change(self, app, user, agent,
-                                                 risk_policy, active_grant):
+                                                risk_policy, active_grant_id):
         """Can rollback a change that was applied via delegation."""
-        from core.governance.delegation import apply_delegated_change
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
         # Apply via delegation
         apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -3394,12 +3602,12 @@ class TestRollbackChange:
             },
         )
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('14.0000')
+        assert risk_policy.threshold_value == _D14
 
         entries = get_governance_trail(
             workspace_id=user.id,
             event_type='change_applied',
+            limit=1,
         )
         change_entry = entries[0]
 
@@ -3410,15 +3618,13 @@ class TestRollbackChange:
         )
 
         assert error is None
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
 
 
 # ---------------------------------------------------------------------------
 # Rollback Route Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestRollbackRoute:
 
     def test_unauthenticated_rejected(self, client, app):
@@ -3436,8 +3642,8 @@ class TestRollbackRoute:
         assert data['success'] is True
         assert data['policy_id'] == risk_policy.id
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D10
 
     def test_rollback_nonexistent_returns_400(self, app, user, client):
         with client.session_transaction() as sess:
@@ -3447,21 +3653,9 @@ class TestRollbackRoute:
         assert resp.status_code == 400
 
     def test_rollback_boundary_violation_returns_403(self, app, user, agent,
-                                                      risk_policy, client):
+                                                      risk_policy, client,
+                                                      pro_tier):
         """Rollback that would violate boundaries returns 403."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request as do_approve
-        from core.governance.governance_audit import get_governance_trail
-        from core.observability.tier_enforcement import invalidate_tier_cache
-
-        tier = WorkspaceTier(
-            workspace_id=user.id,
-            tier_name='pro',
-            **WorkspaceTier.TIER_DEFAULTS['pro'],
-        )
-        db.session.add(tier)
-        db.session.commit()
-        invalidate_tier_cache(user.id)
 
         risk_policy.threshold_value = Decimal('300.0000')
         db.session.commit()
@@ -3477,7 +3671,7 @@ class TestRollbackRoute:
             },
             reason='Lower cap',
         )
-        result, error = do_approve(
+        result, error = approve_request(
             request_id=pcr.id,
             workspace_id=user.id,
             approver_id=user.id,
@@ -3488,12 +3682,11 @@ class TestRollbackRoute:
         entries = get_governance_trail(
             workspace_id=user.id,
             event_type='change_applied',
+            limit=1,
         )
 
         # Downgrade to free tier
-        tier.tier_name = 'free'
-        db.session.commit()
-        invalidate_tier_cache(user.id)
+        pro_tier('free')
 
         with client.session_transaction() as sess:
             sess['user_id'] = user.id
@@ -3506,7 +3699,6 @@ class TestRollbackRoute:
 # Audit Trail Route Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestAuditTrailRoute:
 
     def test_unauthenticated_rejected(self, client, app):
@@ -3573,18 +3765,35 @@ class TestAuditTrailRoute:
         data = resp.get_json()
         assert data['count'] <= 1
 
+    def test_limit_capped(self, app, user, client, monkeypatch):
+        """The route never asks for more than 500 entries."""
+        limits = []
+
+        def fake_trail(**kwargs):
+            limits.append(kwargs['limit'])
+            return []
+
+        monkeypatch.setattr(
+            'core.governance.governance_audit.get_governance_trail',
+            fake_trail,
+        )
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+
+        resp = client.get('/api/governance/audit?limit=100000')
+        assert resp.status_code == 200
+        assert limits == [500]
+
 
 # ---------------------------------------------------------------------------
 # Policy Diff Validation: No Full Overwrite
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPolicyDiffValidation:
     """Ensure governance only allows single-field changes, not full overwrites."""
 
     def test_only_single_field_per_request(self, app, user, agent, risk_policy):
         """Each request targets exactly one mutable field."""
-        from core.governance.requests import create_request
 
         pcr, error = create_request(
             workspace_id=user.id,
@@ -3603,7 +3812,6 @@ class TestPolicyDiffValidation:
     def test_immutable_field_policy_type_rejected(self, app, user, agent,
                                                     risk_policy):
         """Cannot request a change to policy_type (structural field)."""
-        from core.governance.requests import create_request
 
         _, error = create_request(
             workspace_id=user.id,
@@ -3621,7 +3829,6 @@ class TestPolicyDiffValidation:
     def test_immutable_field_is_enabled_rejected(self, app, user, agent,
                                                    risk_policy):
         """Cannot disable a policy via governance (removes safety net)."""
-        from core.governance.requests import create_request
 
         _, error = create_request(
             workspace_id=user.id,
@@ -3639,7 +3846,6 @@ class TestPolicyDiffValidation:
     def test_immutable_field_workspace_id_rejected(self, app, user, agent,
                                                      risk_policy):
         """Cannot change workspace_id (would break isolation)."""
-        from core.governance.requests import create_request
 
         _, error = create_request(
             workspace_id=user.id,
@@ -3657,7 +3863,6 @@ class TestPolicyDiffValidation:
     def test_immutable_field_agent_id_rejected(self, app, user, agent,
                                                 risk_policy):
         """Cannot change agent_id via governance."""
-        from core.governance.requests import create_request
 
         _, error = create_request(
             workspace_id=user.id,
@@ -3672,9 +3877,24 @@ class TestPolicyDiffValidation:
         assert error is not None
         assert 'not mutable' in error
 
+    def test_non_string_field_rejected(self, app, user, agent, risk_policy):
+        """An unhashable field name is rejected, not a TypeError."""
+
+        _, error = create_request(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': ['threshold_value'],
+                'requested_value': 999,
+            },
+            reason='Malformed field',
+        )
+        assert error is not None
+        assert 'not mutable' in error
+
     def test_mutable_fields_are_limited(self, app):
         """Only three fields are mutable via governance."""
-        from core.governance.requests import MUTABLE_FIELDS
 
         assert MUTABLE_FIELDS == frozenset({
             'threshold_value', 'action_type', 'cooldown_minutes',
@@ -3685,14 +3905,12 @@ class TestPolicyDiffValidation:
 # Safety Invariant Tests (Architecture Section 6)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestSafetyInvariant_NoSilentMutation:
     """Invariant 6.1: Every agent-originated policy mutation goes through
     the request pipeline. Direct mutation is forbidden."""
 
     def test_create_request_never_mutates(self, app, user, agent, risk_policy):
         """Submitting a request must not change the policy."""
-        from core.governance.requests import create_request
 
         original = risk_policy.to_dict()
 
@@ -3713,7 +3931,6 @@ class TestSafetyInvariant_NoSilentMutation:
     def test_deny_never_mutates(self, app, user, agent, risk_policy,
                                  pending_request):
         """Denying a request must not change the policy."""
-        from core.governance.approvals import deny_request
 
         original = risk_policy.to_dict()
 
@@ -3727,20 +3944,13 @@ class TestSafetyInvariant_NoSilentMutation:
         db.session.refresh(risk_policy)
         assert risk_policy.to_dict() == original
 
-    def test_governance_module_does_not_import_risk_engine_mutators(self, app):
+    def test_governance_module_does_not_import_risk_engine_mutators(self):
         """Governance never imports risk engine write functions."""
-        import core.governance.requests as req_mod
-        import core.governance.approvals as app_mod
-        import core.governance.delegation as del_mod
-        import core.governance.rollback as rb_mod
 
         for mod in [req_mod, app_mod, del_mod, rb_mod]:
-            source = open(mod.__file__).read()
-            assert 'from core.risk_engine' not in source
-            assert 'import core.risk_engine' not in source
+            assert not _imports_package(mod.__file__, 'core.risk_engine')
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_HumanAuthority:
     """Invariant 6.2: No policy change without explicit human approval."""
 
@@ -3757,7 +3967,6 @@ class TestSafetyInvariant_HumanAuthority:
                                             risk_policy, pending_request,
                                             other_user):
         """Non-owner, non-admin cannot approve."""
-        from core.governance.approvals import approve_request
 
         _, error = approve_request(
             request_id=pending_request.id,
@@ -3769,14 +3978,11 @@ class TestSafetyInvariant_HumanAuthority:
         assert 'Only the workspace owner' in error
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_BoundaryInviolability:
     """Invariant 6.3: No policy value can exceed workspace boundaries."""
 
     def test_one_time_blocked_at_boundary(self, app, user, agent, risk_policy):
         """One-time approval is blocked if value exceeds tier boundary."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -3797,13 +4003,11 @@ class TestSafetyInvariant_BoundaryInviolability:
             mode='one_time',
         )
         assert error is not None
-        assert 'Boundary violation' in error
+        assert error.startswith(ERR_BOUNDARY_VIOLATION)
 
     def test_delegation_blocked_at_boundary(self, app, user, agent,
                                              risk_policy):
         """Delegation grant creation is blocked if envelope exceeds boundary."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -3825,7 +4029,7 @@ class TestSafetyInvariant_BoundaryInviolability:
             delegation_params={'duration_minutes': 60},
         )
         assert error is not None
-        assert 'Boundary violation' in error
+        assert error.startswith(ERR_BOUNDARY_VIOLATION)
 
     def test_delegated_apply_blocked_at_boundary(self, app, user, agent,
                                                    risk_policy, active_grant):
@@ -3833,8 +4037,6 @@ class TestSafetyInvariant_BoundaryInviolability:
 
         Even if the grant envelope allows it, workspace boundaries prevail.
         """
-        from core.governance.delegation import apply_delegated_change
-        from models import WorkspaceTier
 
         # Downgrade tier to free: max $50
         # Grant was created under free tier so envelope max is $15
@@ -3864,10 +4066,9 @@ class TestSafetyInvariant_BoundaryInviolability:
             },
         )
         assert error is not None
-        assert 'boundary violation' in error.lower()
+        assert error.startswith(ERR_WORKSPACE_BOUNDARY_VIOLATION)
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_TimeBoundedDelegation:
     """Invariant 6.4: Every delegation grant has a finite duration."""
 
@@ -3881,7 +4082,6 @@ class TestSafetyInvariant_TimeBoundedDelegation:
     def test_grant_max_duration_enforced(self, app, user, agent, risk_policy,
                                           pending_request):
         """Cannot create a grant exceeding 24 hours."""
-        from core.governance.approvals import approve_request
 
         _, error = approve_request(
             request_id=pending_request.id,
@@ -3896,7 +4096,6 @@ class TestSafetyInvariant_TimeBoundedDelegation:
     def test_grant_zero_duration_rejected(self, app, user, agent, risk_policy,
                                            pending_request):
         """Cannot create a grant with zero duration."""
-        from core.governance.approvals import approve_request
 
         _, error = approve_request(
             request_id=pending_request.id,
@@ -3909,17 +4108,11 @@ class TestSafetyInvariant_TimeBoundedDelegation:
         assert 'at least 1' in error
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_NoGrantStacking:
     """Invariant 6.5: Grants define absolute limits, not relative ones."""
 
     def test_two_grants_independent_bounds(self, app, user, agent, risk_policy):
         """Each grant's envelope is checked independently."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
-        from core.governance.delegation import apply_delegated_change
-        from models import DelegationGrant
-        import time
 
         # Create first request + grant (10 -> 12)
         pcr1, _ = create_request(
@@ -3940,15 +4133,11 @@ class TestSafetyInvariant_NoGrantStacking:
             mode='delegate',
             delegation_params={'duration_minutes': 60},
         )
-        grant1 = DelegationGrant.query.get(r1['grant_id'])
-
-        # Wait a moment to avoid cooldown
-        time.sleep(0.01)
+        grant1 = db.session.get(DelegationGrant, r1['grant_id'])
 
         # Create second request + grant (10 -> 14)
         # Need a fresh pending request — cooldown on same policy
         # Manually insert to bypass cooldown for testing
-        from models import db, PolicyChangeRequest
         pcr2 = PolicyChangeRequest(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -3966,7 +4155,7 @@ class TestSafetyInvariant_NoGrantStacking:
             policy_snapshot=risk_policy.to_dict(),
         )
         db.session.add(pcr2)
-        db.session.commit()
+        db.session.flush()
 
         r2, _ = approve_request(
             request_id=pcr2.id,
@@ -3975,7 +4164,7 @@ class TestSafetyInvariant_NoGrantStacking:
             mode='delegate',
             delegation_params={'duration_minutes': 60},
         )
-        grant2 = DelegationGrant.query.get(r2['grant_id'])
+        grant2 = db.session.get(DelegationGrant, r2['grant_id'])
 
         # Use grant1 to set policy to 12
         apply_delegated_change(
@@ -4017,27 +4206,20 @@ class TestSafetyInvariant_NoGrantStacking:
         assert error is None
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_FullAuditability:
     """Invariant 6.6: Every state transition is audited."""
 
     def test_request_submit_audited(self, app, user, agent, risk_policy,
                                      pending_request):
-        from core.governance.governance_audit import get_governance_trail
         entries = get_governance_trail(user.id, event_type='request_submitted')
         assert len(entries) >= 1
 
     def test_approval_audited(self, app, user, agent, risk_policy,
                                pending_request, applied_change):
-        from core.governance.governance_audit import get_governance_trail
         entries = get_governance_trail(user.id, event_type='request_approved')
         assert len(entries) >= 1
 
     def test_denial_audited(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-        from core.governance.approvals import deny_request
-        from core.governance.governance_audit import get_governance_trail
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -4055,27 +4237,21 @@ class TestSafetyInvariant_FullAuditability:
 
     def test_change_applied_audited(self, app, user, agent, risk_policy,
                                      pending_request, applied_change):
-        from core.governance.governance_audit import get_governance_trail
-        entries = get_governance_trail(user.id, event_type='change_applied')
+        entries = get_governance_trail(
+            user.id, event_type='change_applied', limit=1,
+        )
         assert len(entries) >= 1
         assert 'policy_before' in entries[0].details
         assert 'policy_after' in entries[0].details
 
     def test_rollback_audited(self, app, user, agent, risk_policy,
                                pending_request, applied_change):
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
-
         rollback_change(applied_change.id, user.id, user.id)
 
         entries = get_governance_trail(user.id, event_type='change_rolled_back')
         assert len(entries) == 1
 
     def test_boundary_violation_audited(self, app, user, agent, risk_policy):
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
-        from core.governance.governance_audit import get_governance_trail
-
         pcr, _ = create_request(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -4094,47 +4270,41 @@ class TestSafetyInvariant_FullAuditability:
     def test_audit_log_is_append_only(self, app, user, agent, risk_policy,
                                        pending_request):
         """Audit log entries cannot be updated or deleted via the module API."""
-        from core.governance import governance_audit as gmod
-        import inspect
 
         # The module should only have log_governance_event and
         # get_governance_trail — no update/delete functions
         public_funcs = [
-            name for name, obj in inspect.getmembers(gmod, inspect.isfunction)
-            if not name.startswith('_')
+            name for name, obj in vars(audit_mod).items()
+            if isinstance(obj, types.FunctionType) and not name.startswith('_')
         ]
         assert 'log_governance_event' in public_funcs
         assert 'get_governance_trail' in public_funcs
-        for name in public_funcs:
-            assert 'delete' not in name.lower()
-            assert 'update' not in name.lower()
-            assert 'remove' not in name.lower()
+        forbidden = ('delete', 'update', 'remove')
+        assert not any(
+            word in name.lower() for name in public_funcs for word in forbidden
+        )
+
+        # Entries are hash-chained, so out-of-band edits are detectable
+        trail = get_governance_trail(workspace_id=user.id)
+        assert trail
+        assert all(entry.row_hash for entry in trail)
 
 
-@pytest.mark.governance
 class TestSafetyInvariant_RollbackCapability:
     """Invariant 6.7: Any governance-applied change can be reversed."""
 
     def test_one_time_change_reversible(self, app, user, agent, risk_policy,
                                          pending_request, applied_change):
-        from core.governance.rollback import rollback_change
-
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert risk_policy.threshold_value == _D15
 
         rollback_change(applied_change.id, user.id, user.id)
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
 
     def test_delegation_change_reversible(self, app, user, agent, risk_policy,
-                                           active_grant):
-        from core.governance.delegation import apply_delegated_change
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
-
+                                          active_grant_id):
         apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -4144,18 +4314,18 @@ class TestSafetyInvariant_RollbackCapability:
             },
         )
 
-        entries = get_governance_trail(user.id, event_type='change_applied')
+        entries = get_governance_trail(
+            user.id, event_type='change_applied', limit=1,
+        )
         rollback_change(entries[0].id, user.id, user.id)
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
 
 
 # ---------------------------------------------------------------------------
 # Failure Simulation Tests (Architecture Section 11 — QA)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestFailureSimulation:
 
     def test_crash_mid_approval_no_partial_state(self, app, user, agent,
@@ -4163,8 +4333,6 @@ class TestFailureSimulation:
                                                    pending_request):
         """If approval raises mid-way, neither the policy nor the request
         status should change (atomic commit)."""
-        from unittest.mock import patch
-        from core.governance.approvals import approve_request
 
         original_policy = risk_policy.to_dict()
         original_status = pending_request.status
@@ -4195,7 +4363,6 @@ class TestFailureSimulation:
                                          active_grant):
         """Using an expired grant returns a clear error and does not
         mutate the policy."""
-        from core.governance.delegation import apply_delegated_change
 
         # Force-expire the grant
         active_grant.valid_to = datetime.utcnow() - timedelta(hours=1)
@@ -4223,7 +4390,6 @@ class TestFailureSimulation:
     def test_request_exceeding_global_cap(self, app, user, agent, risk_policy):
         """Requesting a value beyond the tier's global cap is allowed at
         request time (boundary check happens at approval)."""
-        from core.governance.requests import create_request
 
         # Free tier cap is $50 — requesting $100
         pcr, error = create_request(
@@ -4242,7 +4408,6 @@ class TestFailureSimulation:
         assert pcr.status == 'pending'
 
         # But approval is blocked
-        from core.governance.approvals import approve_request
         _, approval_error = approve_request(
             request_id=pcr.id,
             workspace_id=user.id,
@@ -4250,17 +4415,16 @@ class TestFailureSimulation:
             mode='one_time',
         )
         assert approval_error is not None
-        assert 'Boundary violation' in approval_error
+        assert approval_error.startswith(ERR_BOUNDARY_VIOLATION)
 
     def test_revoked_grant_cannot_be_used(self, app, user, agent, risk_policy,
-                                           active_grant):
+                                          active_grant_id):
         """A revoked grant cannot be used to apply changes."""
-        from core.governance.delegation import revoke_grant, apply_delegated_change
 
-        revoke_grant(active_grant.id, user.id, user.id)
+        revoke_grant(active_grant_id, user.id, user.id)
 
         _, error = apply_delegated_change(
-            grant_id=active_grant.id,
+            grant_id=active_grant_id,
             workspace_id=user.id,
             agent_id=agent.id,
             requested_change={
@@ -4275,7 +4439,6 @@ class TestFailureSimulation:
     def test_double_approval_rejected(self, app, user, agent, risk_policy,
                                        pending_request):
         """Cannot approve a request that's already been applied."""
-        from core.governance.approvals import approve_request
 
         # First approval
         approve_request(
@@ -4298,9 +4461,6 @@ class TestFailureSimulation:
     def test_expired_request_cannot_be_approved(self, app, user, agent,
                                                   risk_policy):
         """An expired request cannot be approved."""
-        from core.governance.requests import create_request, expire_stale_requests
-        from core.governance.approvals import approve_request
-        from models import PolicyChangeRequest
 
         pcr, _ = create_request(
             workspace_id=user.id,
@@ -4335,16 +4495,11 @@ class TestFailureSimulation:
 # End-to-End Lifecycle Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestE2ELifecycle:
 
     def test_full_one_time_lifecycle(self, app, user, agent, risk_policy):
         """Agent request -> human approve one_time -> policy changed ->
         risk engine sees new value -> rollback -> policy restored."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
-        from core.governance.rollback import rollback_change
-        from core.governance.governance_audit import get_governance_trail
 
         # 1. Agent requests threshold increase
         pcr, _ = create_request(
@@ -4361,8 +4516,8 @@ class TestE2ELifecycle:
         assert pcr.status == 'pending'
 
         # Policy unchanged
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        db.session.expire(risk_policy, ['threshold_value'])
+        assert risk_policy.threshold_value == _D10
 
         # 2. Human approves
         result, _ = approve_request(
@@ -4374,20 +4529,19 @@ class TestE2ELifecycle:
         assert result['status'] == 'applied'
 
         # Policy changed
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('20.0000')
+        assert risk_policy.threshold_value == _D20
 
         # 3. Risk engine would see the new value (we verify the DB state)
-        from models import RiskPolicy
-        policy = RiskPolicy.query.get(risk_policy.id)
-        assert policy.threshold_value == Decimal('20.0000')
+        policy = db.session.get(RiskPolicy, risk_policy.id)
+        assert policy.threshold_value == _D20
 
         # 4. Rollback
-        entries = get_governance_trail(user.id, event_type='change_applied')
+        entries = get_governance_trail(
+            user.id, event_type='change_applied', limit=1,
+        )
         rollback_change(entries[0].id, user.id, user.id)
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('10.0000')
+        assert risk_policy.threshold_value == _D10
 
         # 5. Verify complete audit trail exists
         trail = get_governance_trail(user.id)
@@ -4400,12 +4554,6 @@ class TestE2ELifecycle:
     def test_full_delegation_lifecycle(self, app, user, agent, risk_policy):
         """Agent request -> human delegates -> agent self-applies ->
         grant expires -> agent can no longer apply."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import approve_request
-        from core.governance.delegation import (
-            apply_delegated_change, expire_grants,
-        )
-        from models import DelegationGrant
 
         # 1. Agent requests
         pcr, _ = create_request(
@@ -4428,7 +4576,7 @@ class TestE2ELifecycle:
             mode='delegate',
             delegation_params={'duration_minutes': 60},
         )
-        grant = DelegationGrant.query.get(result['grant_id'])
+        grant = db.session.get(DelegationGrant, result['grant_id'])
         assert grant.active is True
 
         # 3. Agent self-applies within envelope
@@ -4444,8 +4592,7 @@ class TestE2ELifecycle:
         )
         assert apply_result is not None
 
-        db.session.refresh(risk_policy)
-        assert risk_policy.threshold_value == Decimal('15.0000')
+        assert risk_policy.threshold_value == _D15
 
         # 4. Grant expires
         grant.valid_to = datetime.utcnow() - timedelta(minutes=1)
@@ -4473,12 +4620,9 @@ class TestE2ELifecycle:
 # Phase 4 Module Exports
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPhase4Exports:
 
-    def test_module_exports_phase4(self, app):
-        import core.governance as gov
-
+    def test_module_exports_phase4(self):
         assert hasattr(gov, 'rollback_change')
         assert callable(gov.rollback_change)
         assert 'rollback_change' in gov.__all__
@@ -4493,27 +4637,22 @@ class TestPhase4Exports:
 # Pending Requests Route Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPendingRequestsRoute:
 
     def test_unauthenticated_rejected(self, client, app):
         resp = client.get('/api/governance/pending')
         assert resp.status_code == 401
 
-    def test_empty_pending(self, app, user, client):
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.get('/api/governance/pending')
+    def test_empty_pending(self, app, user, authenticated_client):
+        resp = authenticated_client.get('/api/governance/pending')
         assert resp.status_code == 200
         data = resp.get_json()
         assert data['count'] == 0
         assert data['requests'] == []
 
-    def test_returns_only_pending(self, app, user, agent, risk_policy, client):
+    def test_returns_only_pending(self, app, user, agent, risk_policy,
+                                  authenticated_client):
         """Pending endpoint only returns status=pending requests."""
-        from core.governance.requests import create_request
-        from core.governance.approvals import deny_request
 
         # Create a pending request
         pcr1, _ = create_request(
@@ -4528,7 +4667,6 @@ class TestPendingRequestsRoute:
         )
 
         # Create and deny another request (need different policy or wait)
-        from models import PolicyChangeRequest
         pcr2 = PolicyChangeRequest(
             workspace_id=user.id,
             agent_id=agent.id,
@@ -4545,19 +4683,15 @@ class TestPendingRequestsRoute:
         db.session.add(pcr2)
         db.session.commit()
 
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.get('/api/governance/pending')
+        resp = authenticated_client.get('/api/governance/pending')
         data = resp.get_json()
         assert data['count'] == 1
         assert data['requests'][0]['id'] == pcr1.id
         assert data['requests'][0]['status'] == 'pending'
 
     def test_filter_by_agent(self, app, user, agent, risk_policy,
-                              other_user, other_agent, client):
+                              other_user, other_agent, authenticated_client):
         """Pending endpoint supports agent_id filter."""
-        from core.governance.requests import create_request
 
         create_request(
             workspace_id=user.id,
@@ -4570,23 +4704,21 @@ class TestPendingRequestsRoute:
             reason='From agent 1',
         )
 
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
         # Filter by this agent
-        resp = client.get(f'/api/governance/pending?agent_id={agent.id}')
+        resp = authenticated_client.get(
+            f'/api/governance/pending?agent_id={agent.id}')
         data = resp.get_json()
         assert data['count'] == 1
 
         # Filter by other agent (belongs to other workspace, so 0 results)
-        resp = client.get(f'/api/governance/pending?agent_id={other_agent.id}')
+        resp = authenticated_client.get(
+            f'/api/governance/pending?agent_id={other_agent.id}')
         data = resp.get_json()
         assert data['count'] == 0
 
     def test_workspace_isolation(self, app, user, agent, risk_policy,
                                   other_user, client):
         """Pending endpoint is workspace-scoped."""
-        from core.governance.requests import create_request
 
         create_request(
             workspace_id=user.id,
@@ -4607,9 +4739,9 @@ class TestPendingRequestsRoute:
         data = resp.get_json()
         assert data['count'] == 0
 
-    def test_limit_parameter(self, app, user, agent, risk_policy, client):
+    def test_limit_parameter(self, app, user, agent, risk_policy,
+                             authenticated_client):
         """Pending endpoint respects limit parameter."""
-        from core.governance.requests import create_request
 
         create_request(
             workspace_id=user.id,
@@ -4622,17 +4754,114 @@ class TestPendingRequestsRoute:
             reason='Request 1',
         )
 
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.get('/api/governance/pending?limit=1')
+        resp = authenticated_client.get('/api/governance/pending?limit=1')
         data = resp.get_json()
         assert data['count'] <= 1
 
+    def test_cursor_pagination(self, app, user, agent, risk_policy,
+                               authenticated_client):
+        """next_cursor pages through pending requests without overlap."""
+        now = datetime.utcnow()
+        rows = [
+            PolicyChangeRequest(
+                workspace_id=user.id,
+                agent_id=agent.id,
+                policy_id=risk_policy.id,
+                requested_changes={
+                    'policy_id': risk_policy.id,
+                    'field': 'threshold_value',
+                    'requested_value': '15.0000',
+                },
+                reason=f'Request {i}',
+                status='pending',
+                # Two rows share a timestamp so the id tiebreak is exercised.
+                requested_at=now - timedelta(minutes=min(i, 1)),
+            )
+            for i in range(3)
+        ]
+        db.session.add_all(rows)
+        db.session.commit()
+
+        seen = []
+        resp = authenticated_client.get('/api/governance/pending?limit=2')
+        data = resp.get_json()
+        assert data['count'] == 2
+        assert data['next_cursor'] is not None
+        seen += [r['id'] for r in data['requests']]
+
+        resp = authenticated_client.get(
+            '/api/governance/pending',
+            query_string={'limit': 2, 'cursor': data['next_cursor']},
+        )
+        data = resp.get_json()
+        assert data['count'] == 1
+        assert data['next_cursor'] is None
+        seen += [r['id'] for r in data['requests']]
+
+        assert sorted(seen) == sorted(r.id for r in rows)
+
+    def test_page_is_one_select(self, app, user, agent, risk_policy,
+                                authenticated_client):
+        """Serializing a page does not lazy-load per row (no N+1)."""
+        db.session.add_all([
+            PolicyChangeRequest(
+                workspace_id=user.id,
+                agent_id=agent.id,
+                policy_id=risk_policy.id,
+                requested_changes={
+                    'policy_id': risk_policy.id,
+                    'field': 'threshold_value',
+                    'requested_value': '15.0000',
+                },
+                reason=f'Request {i}',
+                status='pending',
+            )
+            for i in range(3)
+        ])
+        db.session.commit()
+
+        selects = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+
+        conn = db.session.connection()
+        event.listen(conn, 'before_cursor_execute', record)
+        try:
+            resp = authenticated_client.get('/api/governance/pending')
+        finally:
+            event.remove(conn, 'before_cursor_execute', record)
+
+        assert resp.get_json()['count'] == 3
+        assert len(selects) == 1
+
+    def test_invalid_cursor_rejected(self, app, user, authenticated_client):
+        resp = authenticated_client.get(
+            '/api/governance/pending?cursor=not-a-cursor')
+        assert resp.status_code == 400
+        assert resp.get_json()['error'] == 'Invalid cursor'
+
+    def test_limit_capped(self, app, user, authenticated_client, monkeypatch):
+        """The page never exceeds 200 rows (one extra is fetched to probe
+        for a next page)."""
+        limits = []
+
+        def fake_get_requests(**kwargs):
+            limits.append(kwargs['limit'])
+            return []
+
+        monkeypatch.setattr(
+            'core.governance.requests.get_requests', fake_get_requests,
+        )
+        resp = authenticated_client.get(
+            '/api/governance/pending?limit=1000000')
+        assert resp.status_code == 200
+        assert limits == [201]
+
     def test_pending_count_for_badge(self, app, user, agent, risk_policy,
-                                      client):
+                                      authenticated_client):
         """Count field is usable for badge display."""
-        from core.governance.requests import create_request
 
         create_request(
             workspace_id=user.id,
@@ -4645,26 +4874,98 @@ class TestPendingRequestsRoute:
             reason='For badge count',
         )
 
-        with client.session_transaction() as sess:
-            sess['user_id'] = user.id
-
-        resp = client.get('/api/governance/pending')
+        resp = authenticated_client.get('/api/governance/pending')
         data = resp.get_json()
         assert isinstance(data['count'], int)
         assert data['count'] > 0
 
+    def test_pending_count_endpoint(self, app, user, agent, risk_policy,
+                                    other_user, client):
+        """The badge endpoint counts only this workspace's pending rows."""
+        create_request(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': 'threshold_value',
+                'requested_value': '15.0000',
+            },
+            reason='Pending',
+        )
+        db.session.add(PolicyChangeRequest(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            policy_id=risk_policy.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': 'threshold_value',
+                'requested_value': '20.0000',
+            },
+            reason='Denied',
+            status='denied',
+        ))
+        db.session.commit()
+
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+        resp = client.get('/api/governance/pending/count')
+        assert resp.status_code == 200
+        assert resp.get_json() == {'count': 1}
+
+        with client.session_transaction() as sess:
+            sess['user_id'] = other_user.id
+        resp = client.get('/api/governance/pending/count')
+        assert resp.get_json() == {'count': 0}
+
+    def test_pending_count_conditional(self, app, user, agent, risk_policy,
+                                       authenticated_client):
+        """Repeat badge polls revalidate by ETag instead of re-sending."""
+        resp = authenticated_client.get('/api/governance/pending/count')
+        assert resp.status_code == 200
+        assert resp.cache_control.private
+        assert resp.cache_control.max_age == 3
+        etag = resp.headers['ETag']
+
+        resp = authenticated_client.get(
+            '/api/governance/pending/count',
+            headers={'If-None-Match': etag},
+        )
+        assert resp.status_code == 304
+        assert resp.data == b''
+
+        create_request(
+            workspace_id=user.id,
+            agent_id=agent.id,
+            requested_changes={
+                'policy_id': risk_policy.id,
+                'field': 'threshold_value',
+                'requested_value': '15.0000',
+            },
+            reason='New pending',
+        )
+        resp = authenticated_client.get(
+            '/api/governance/pending/count',
+            headers={'If-None-Match': etag},
+        )
+        assert resp.status_code == 200
+        assert resp.get_json() == {'count': 1}
+
+    def test_pending_count_unauthenticated(self, client, app):
+        resp = client.get('/api/governance/pending/count')
+        assert resp.status_code == 401
+
 
 # ---------------------------------------------------------------------------
 # Phase 5 Completeness Tests
 # ---------------------------------------------------------------------------
 
-@pytest.mark.governance
 class TestPhase5Completeness:
 
     def test_all_ui_endpoints_exist(self, app, user, client):
         """All governance endpoints needed by the UI exist and require auth."""
         endpoints = [
             ('GET', '/api/governance/pending'),
+            ('GET', '/api/governance/pending/count'),
             ('GET', '/api/governance/requests'),
             ('GET', '/api/governance/delegations'),
             ('GET', '/api/governance/audit'),
@@ -4704,11 +5005,12 @@ class TestPhase5Completeness:
 
     def test_governance_routes_registered(self, app):
         """Governance routes are registered on the app."""
-        rules = [rule.rule for rule in app.url_map.iter_rules()]
-        expected = [
+        rules = {rule.rule for rule in app.url_map.iter_rules()}
+        expected = {
             '/api/governance/request',
             '/api/governance/requests',
             '/api/governance/pending',
+            '/api/governance/pending/count',
             '/api/governance/approve/<int:request_id>',
             '/api/governance/deny/<int:request_id>',
             '/api/governance/delegate/apply',
@@ -4716,9 +5018,9 @@ class TestPhase5Completeness:
             '/api/governance/rollback/<int:audit_id>',
             '/api/governance/audit',
             '/api/governance/internal/expire',
-        ]
-        for route in expected:
-            assert route in rules, f'Route {route} not registered'
+        }
+        missing = expected - rules
+        assert not missing, f'Routes not registered: {sorted(missing)}'
 
     def test_full_api_surface_matches_architecture(self, app):
         """All endpoints from the architecture doc Section 7 are present."""
@@ -4734,6 +5036,7 @@ class TestPhase5Completeness:
         assert '/api/governance/approve/<int:request_id>' in rules
         assert '/api/governance/deny/<int:request_id>' in rules
         assert '/api/governance/pending' in rules
+        assert '/api/governance/pending/count' in rules
         assert '/api/governance/delegations' in rules
         assert '/api/governance/audit' in rules
         assert '/api/governance/rollback/<int:audit_id>' in rules
@@ -6,7 +6,7 @@ import json
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 from models import (
-    db, User, Agent, ObsApiKey, ObsEvent, ObsRun,
+    db, User, Agent, WorkspaceTier, ObsApiKey, ObsEvent, ObsRun,
     ObsAgentDailyMetrics, ObsAlertRule, ObsAlertEvent, ObsLlmPricing,
 )
 
@@ -23,6 +23,22 @@ def obs_api_key(app, user):
     return api_key, raw_key
 
 
+@pytest.fixture
+def alert_tier(app, user):
+    """Put the test user on a tier that allows alert rules.
+
+    Free tier has alert_rule_limit=0, so without this the alert-rule routes
+    only succeed if another test left a paid tier in the process-wide cache.
+    """
+    from core.observability.tier_enforcement import invalidate_tier_cache
+
+    tier = WorkspaceTier.create_for_workspace(user.id, 'production')
+    db.session.commit()
+    invalidate_tier_cache(user.id)
+    yield tier
+    invalidate_tier_cache(user.id)
+
+
 @pytest.fixture
 def obs_pricing(app):
     """Seed minimal LLM pricing data."""
@@ -113,6 +129,55 @@ class TestIngestionAPI:
         assert data['accepted'] == 3
         assert data['total_submitted'] == 3
 
+    def test_ingest_checks_each_agent_once(self, client, user, agent,
+                                           obs_api_key, monkeypatch):
+        from core.observability import tier_enforcement
+        _, raw_key = obs_api_key
+
+        calls = []
+        real_check = tier_enforcement.check_agent_allowed
+
+        def counting_check(workspace_id, agent_id):
+            calls.append(agent_id)
+            return real_check(workspace_id, agent_id)
+
+        monkeypatch.setattr(tier_enforcement, 'check_agent_allowed',
+                            counting_check)
+
+        events = [{'event_type': 'heartbeat', 'agent_id': agent.id}] * 5
+        resp = client.post('/api/obs/ingest/events',
+            headers={'Authorization': f'Bearer {raw_key}', 'Content-Type': 'application/json'},
+            json={'events': events})
+
+        assert resp.get_json()['accepted'] == 5
+        assert calls == [agent.id]
+
+    def test_batch_written_with_one_insert(self, app, user, agent):
+        from sqlalchemy import event
+        from core.observability import emit_event_batch
+
+        inserts = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.startswith('INSERT INTO obs_events'):
+                inserts.append(statement)
+
+        conn = db.session.connection()
+        event.listen(conn, 'before_cursor_execute', record)
+        try:
+            accepted, rejected = emit_event_batch(
+                [{'event_type': 'heartbeat', 'agent_id': agent.id}] * 10,
+                user.id,
+            )
+        finally:
+            event.remove(conn, 'before_cursor_execute', record)
+
+        assert (accepted, rejected) == (10, [])
+        assert len(inserts) == 1
+        events = ObsEvent.query.filter_by(user_id=user.id).all()
+        assert len(events) == 10
+        assert all(e.created_at is not None for e in events)
+
     def test_ingest_invalid_event_type_rejected(self, client, user, obs_api_key):
         _, raw_key = obs_api_key
 
@@ -165,6 +230,32 @@ class TestIngestionAPI:
         assert data2['accepted'] == 0 or len(data2['rejected']) > 0
 
 
+    def test_batch_skips_dedupe_conflicts_in_sql(self, app, user, agent,
+                                                 monkeypatch):
+        from core.observability import emit_event_batch, ingestion
+
+        emit_event_batch(
+            [{'event_type': 'metric', 'dedupe_key': 'seen-before'}], user.id,
+        )
+
+        def no_fallback(*args):
+            raise AssertionError('batch fell back to row-by-row inserts')
+
+        monkeypatch.setattr(ingestion, '_commit_one_by_one', no_fallback)
+        accepted, rejected = emit_event_batch([
+            {'event_type': 'metric', 'dedupe_key': 'seen-before'},
+            {'event_type': 'metric', 'dedupe_key': 'fresh'},
+            {'event_type': 'metric', 'dedupe_key': 'fresh'},
+            {'event_type': 'metric'},
+        ], user.id)
+
+        assert accepted == 2
+        assert rejected == [
+            {'index': 0, 'reason': 'duplicate dedupe_key'},
+            {'index': 2, 'reason': 'duplicate dedupe_key'},
+        ]
+        assert ObsEvent.query.filter_by(user_id=user.id).count() == 3
+
 # ---------------------------------------------------------------------------
 # Heartbeat Endpoint Tests
 # ---------------------------------------------------------------------------
@@ -293,7 +384,7 @@ class TestEventsQuery:
 @pytest.mark.observability
 class TestAlertRules:
 
-    def test_create_alert_rule(self, authenticated_client, agent):
+    def test_create_alert_rule(self, authenticated_client, agent, alert_tier):
         resp = authenticated_client.post('/api/obs/alerts/rules', json={
             'name': 'High Cost Alert',
             'rule_type': 'cost_per_day',
@@ -307,7 +398,7 @@ class TestAlertRules:
         assert data['rule']['name'] == 'High Cost Alert'
         assert data['rule']['rule_type'] == 'cost_per_day'
 
-    def test_create_alert_invalid_type(self, authenticated_client):
+    def test_create_alert_invalid_type(self, authenticated_client, alert_tier):
         resp = authenticated_client.post('/api/obs/alerts/rules', json={
             'name': 'Bad Rule',
             'rule_type': 'invalid_type',
@@ -425,6 +516,45 @@ class TestAggregation:
         assert m.latency_p50_ms is not None
         assert m.latency_p95_ms is not None
 
+    def test_aggregate_daily_sql_totals(self, app, user, agent):
+        """Sums, heartbeat and histograms computed in SQL match the events."""
+        from observability_service import emit_event, aggregate_daily
+
+        today = datetime.utcnow().date()
+        emit_event(user.id, 'llm_call', status='success', agent_id=agent.id,
+                   model='gpt-4o', tokens_in=10, tokens_out=5,
+                   cost_usd=Decimal('0.10000001'), latency_ms=100)
+        emit_event(user.id, 'llm_call', status='success', agent_id=agent.id,
+                   model='gpt-4o-mini', tokens_in=20, tokens_out=5,
+                   cost_usd=Decimal('0.20000002'), latency_ms=300)
+        emit_event(user.id, 'llm_call', status='error', agent_id=agent.id,
+                   model='gpt-4o', latency_ms=0)
+        hb = emit_event(user.id, 'heartbeat', agent_id=agent.id)
+        emit_event(user.id, 'tool_result', status='error', agent_id=agent.id)
+        emit_event(user.id, 'heartbeat', agent_id=None)
+
+        assert aggregate_daily(today) == 2
+
+        m = ObsAgentDailyMetrics.query.filter_by(
+            user_id=user.id, agent_id=agent.id, date=today).one()
+        assert m.total_events == 5
+        assert m.total_runs == 0
+        assert m.total_tokens_in == 30
+        assert m.total_tokens_out == 10
+        assert m.total_cost_usd == Decimal('0.30000003')
+        assert m.total_tool_calls == 0
+        assert m.tool_errors == 1
+        assert (m.latency_p50_ms, m.latency_p95_ms, m.latency_avg_ms) == (
+            300, 300, 200)
+        assert m.models_used == {'gpt-4o': 2, 'gpt-4o-mini': 1}
+        assert m.last_heartbeat_at == hb.created_at
+
+        unassigned = ObsAgentDailyMetrics.query.filter_by(
+            user_id=user.id, agent_id=None, date=today).one()
+        assert unassigned.total_events == 1
+        assert unassigned.latency_p50_ms is None
+        assert unassigned.models_used == {}
+
     def test_aggregate_idempotent(self, app, user, agent):
         """Running aggregation twice should not double-count."""
         from observability_service import emit_event, aggregate_daily
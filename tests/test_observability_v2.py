@@ -25,9 +25,7 @@ def _ensure_production_tier(app, user):
     """
     from core.observability.tier_enforcement import invalidate_tier_cache
     invalidate_tier_cache()
-    tier = WorkspaceTier(workspace_id=user.id, tier_name='production',
-                         **WorkspaceTier.TIER_DEFAULTS['production'])
-    db.session.add(tier)
+    WorkspaceTier.create_for_workspace(user.id, 'production')
     db.session.commit()
     invalidate_tier_cache()
     yield
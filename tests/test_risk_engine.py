@@ -1171,10 +1171,9 @@ class TestCronEndpoint:
         resp = client.post('/api/obs/internal/enforce-risk')
         assert resp.status_code == 401
 
-    def test_enforce_risk_with_cron_secret(self, app, client, user, agent, risk_policy):
+    def test_enforce_risk_with_cron_secret(self, app, client, user, agent, risk_policy, monkeypatch):
         """Endpoint accepts CRON_SECRET and runs enforcement cycle."""
-        import os
-        os.environ['CRON_SECRET'] = 'test-cron-secret'
+        monkeypatch.setenv('CRON_SECRET', 'test-cron-secret')
 
         _seed_cost_events(user.id, agent.id, Decimal('15.0000'), 1)
 
@@ -1189,12 +1188,9 @@ class TestCronEndpoint:
         assert 'events_executed' in data
         assert 'elapsed_seconds' in data
 
-        os.environ.pop('CRON_SECRET', None)
-
-    def test_enforce_risk_with_admin_password(self, app, client):
+    def test_enforce_risk_with_admin_password(self, app, client, monkeypatch):
         """Endpoint accepts admin password fallback."""
-        import os
-        os.environ['ADMIN_PASSWORD'] = 'test-admin-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-admin-pw')
 
         resp = client.post(
             '/api/obs/internal/enforce-risk',
@@ -1205,12 +1201,9 @@ class TestCronEndpoint:
         data = resp.get_json()
         assert data['success'] is True
 
-        os.environ.pop('ADMIN_PASSWORD', None)
-
-    def test_enforce_risk_no_policies_clean(self, app, client):
+    def test_enforce_risk_no_policies_clean(self, app, client, monkeypatch):
         """Endpoint returns clean result when no policies exist."""
-        import os
-        os.environ['CRON_SECRET'] = 'test-cron-secret'
+        monkeypatch.setenv('CRON_SECRET', 'test-cron-secret')
 
         resp = client.post(
             '/api/obs/internal/enforce-risk',
@@ -1221,8 +1214,6 @@ class TestCronEndpoint:
         assert data['events_created'] == 0
         assert data['events_executed'] == 0
 
-        os.environ.pop('CRON_SECRET', None)
-
 
 # ===========================================================================
 # Phase 5 — Daily Spend Cap Guardrail V1: End-to-End Integration Tests
@@ -1478,13 +1469,12 @@ class TestDailySpendCapE2E:
         assert agent.is_active is True
         assert agent.llm_config['model'] == 'gpt-4o'
 
-    def test_cron_endpoint_full_guardrail(self, app, client, user, agent):
+    def test_cron_endpoint_full_guardrail(self, app, client, user, agent, monkeypatch):
         """
         The cron HTTP endpoint triggers the full guardrail pipeline.
         Proves the integration from HTTP → worker → evaluator → executor → DB.
         """
-        import os
-        os.environ['CRON_SECRET'] = 'test-cron-secret'
+        monkeypatch.setenv('CRON_SECRET', 'test-cron-secret')
 
         agent.llm_config = {'provider': 'openai', 'model': 'gpt-4o'}
         db.session.commit()
@@ -1520,8 +1510,6 @@ class TestDailySpendCapE2E:
         assert log.action_type == 'pause_agent'
         assert log.result == 'success'
 
-        os.environ.pop('CRON_SECRET', None)
-
     def test_workspace_wide_spend_cap(self, app, user):
         """
         Workspace-wide policy triggers alert_only when total spend
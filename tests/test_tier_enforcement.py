@@ -40,9 +40,7 @@ def production_user(app):
     u = User(email='prod@test.com', created_at=datetime.utcnow())
     db.session.add(u)
     db.session.flush()
-    tier = WorkspaceTier(workspace_id=u.id, tier_name='production',
-                         **WorkspaceTier.TIER_DEFAULTS['production'])
-    db.session.add(tier)
+    WorkspaceTier.create_for_workspace(u.id, 'production')
     db.session.commit()
     return u
 
@@ -53,9 +51,7 @@ def pro_user(app):
     u = User(email='pro@test.com', created_at=datetime.utcnow())
     db.session.add(u)
     db.session.flush()
-    tier = WorkspaceTier(workspace_id=u.id, tier_name='pro',
-                         **WorkspaceTier.TIER_DEFAULTS['pro'])
-    db.session.add(tier)
+    WorkspaceTier.create_for_workspace(u.id, 'pro')
     db.session.commit()
     return u
 
@@ -66,9 +62,7 @@ def agency_user(app):
     u = User(email='agency@test.com', created_at=datetime.utcnow())
     db.session.add(u)
     db.session.flush()
-    tier = WorkspaceTier(workspace_id=u.id, tier_name='agency',
-                         **WorkspaceTier.TIER_DEFAULTS['agency'])
-    db.session.add(tier)
+    WorkspaceTier.create_for_workspace(u.id, 'agency')
     db.session.commit()
     return u
 
@@ -535,9 +529,7 @@ class TestTierUpgrade:
         assert ok is False
 
         # Upgrade
-        tier = WorkspaceTier(workspace_id=free_user.id, tier_name='production',
-                             **WorkspaceTier.TIER_DEFAULTS['production'])
-        db.session.add(tier)
+        WorkspaceTier.create_for_workspace(free_user.id, 'production')
         db.session.commit()
         invalidate_tier_cache(free_user.id)
 
@@ -728,7 +720,7 @@ class TestRetentionFilterRoutes:
         assert data['tier']['name'] == 'free'
         assert data['tier']['retention_days'] == 7
 
-    def test_cron_retention_cleanup_endpoint(self, app, free_user):
+    def test_cron_retention_cleanup_endpoint(self, app, free_user, monkeypatch):
         """POST /api/obs/internal/retention-cleanup works with cron auth."""
         from core.observability.tier_enforcement import invalidate_tier_cache
         invalidate_tier_cache()
@@ -745,15 +737,13 @@ class TestRetentionFilterRoutes:
         assert resp.status_code == 401
 
         # Set env and retry
-        import os
-        os.environ['ADMIN_PASSWORD'] = 'test-admin-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-admin-pw')
         resp = client.post('/api/obs/internal/retention-cleanup',
                            json={'password': 'test-admin-pw'})
         data = resp.get_json()
         assert resp.status_code == 200
         assert data['success'] is True
         assert data['total_events_deleted'] == 1
-        os.environ.pop('ADMIN_PASSWORD', None)
 
 
 # ===========================================================================
@@ -1319,13 +1309,12 @@ class TestBillingWebhookStub:
         })
         assert resp.status_code == 401
 
-    def test_subscription_created(self, app, target_user):
+    def test_subscription_created(self, app, target_user, monkeypatch):
         """obs_subscription.created assigns the tier."""
-        import os
         from core.observability.tier_enforcement import invalidate_tier_cache, get_workspace_tier
         invalidate_tier_cache()
 
-        os.environ['ADMIN_PASSWORD'] = 'test-billing-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-billing-pw')
 
         client = app.test_client()
         resp = client.post('/api/obs/webhooks/billing', json={
@@ -1344,15 +1333,12 @@ class TestBillingWebhookStub:
         assert tier['tier_name'] == 'pro'
         assert tier['anomaly_detection_enabled'] is True
 
-        os.environ.pop('ADMIN_PASSWORD', None)
-
-    def test_subscription_updated(self, app, production_user):
+    def test_subscription_updated(self, app, production_user, monkeypatch):
         """obs_subscription.updated changes the tier."""
-        import os
         from core.observability.tier_enforcement import invalidate_tier_cache, get_workspace_tier
         invalidate_tier_cache()
 
-        os.environ['ADMIN_PASSWORD'] = 'test-billing-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-billing-pw')
 
         client = app.test_client()
         resp = client.post('/api/obs/webhooks/billing', json={
@@ -1369,15 +1355,12 @@ class TestBillingWebhookStub:
         assert tier['tier_name'] == 'agency'
         assert tier['priority_processing'] is True
 
-        os.environ.pop('ADMIN_PASSWORD', None)
-
-    def test_subscription_deleted_downgrades_to_free(self, app, pro_user):
+    def test_subscription_deleted_downgrades_to_free(self, app, pro_user, monkeypatch):
         """obs_subscription.deleted downgrades to free tier."""
-        import os
         from core.observability.tier_enforcement import invalidate_tier_cache, get_workspace_tier
         invalidate_tier_cache()
 
-        os.environ['ADMIN_PASSWORD'] = 'test-billing-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-billing-pw')
 
         client = app.test_client()
         resp = client.post('/api/obs/webhooks/billing', json={
@@ -1393,12 +1376,9 @@ class TestBillingWebhookStub:
         assert tier['tier_name'] == 'free'
         assert tier['agent_limit'] == 2
 
-        os.environ.pop('ADMIN_PASSWORD', None)
-
-    def test_unknown_event_type_ignored(self, app, target_user):
+    def test_unknown_event_type_ignored(self, app, target_user, monkeypatch):
         """Unknown event types return ignored response."""
-        import os
-        os.environ['ADMIN_PASSWORD'] = 'test-billing-pw'
+        monkeypatch.setenv('ADMIN_PASSWORD', 'test-billing-pw')
 
         client = app.test_client()
         resp = client.post('/api/obs/webhooks/billing', json={
@@ -1410,15 +1390,12 @@ class TestBillingWebhookStub:
         assert resp.status_code == 200
         assert data['ignored'] is True
 
-        os.environ.pop('ADMIN_PASSWORD', None)
-
-    def test_webhook_with_bearer_auth(self, app, target_user):
+    def test_webhook_with_bearer_auth(self, app, target_user, monkeypatch):
         """Webhook authenticates via OBS_BILLING_WEBHOOK_SECRET Bearer token."""
-        import os
         from core.observability.tier_enforcement import invalidate_tier_cache, get_workspace_tier
         invalidate_tier_cache()
 
-        os.environ['OBS_BILLING_WEBHOOK_SECRET'] = 'whsec_test_123'
+        monkeypatch.setenv('OBS_BILLING_WEBHOOK_SECRET', 'whsec_test_123')
 
         client = app.test_client()
         resp = client.post('/api/obs/webhooks/billing',
@@ -1434,5 +1411,3 @@ class TestBillingWebhookStub:
 
         tier = get_workspace_tier(target_user.id)
         assert tier['tier_name'] == 'production'
-
-        os.environ.pop('OBS_BILLING_WEBHOOK_SECRET', None)